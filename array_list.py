@@ -1,13 +1,23 @@
-from referential_array import ArrayR
+from referential_array import LazyArrayR
 from abstract_list import List, T
 
 
 class ArrayList(List[T]):
     MIN_CAPACITY = 1
-
-    def __init__(self, max_capacity: int) -> None:
+    # capacity is multiplied by this when the array is full
+    GROWTH_FACTOR = 2
+    # capacity is halved once the length falls to capacity / SHRINK_RATIO;
+    # keeping this above GROWTH_FACTOR stops an append/delete pair at the
+    # boundary from resizing back and forth
+    SHRINK_RATIO = 4
+
+    def __init__(self, max_capacity: int, growth_factor: float = None) -> None:
         List.__init__(self)
-        self.array = ArrayR(max(self.MIN_CAPACITY, max_capacity))
+        self.array = LazyArrayR(max(self.MIN_CAPACITY, max_capacity))
+        if growth_factor is not None:
+            if growth_factor <= 1:
+                raise ValueError("Growth factor should be larger than 1.")
+            self.GROWTH_FACTOR = growth_factor
 
     def reset(self):
         List.__init__(self)
@@ -18,6 +28,11 @@ class ArrayList(List[T]):
     def __setitem__(self, index: int, value: T) -> None:
         self.array[index] = value
 
+    def __iter__(self):
+        # bounded by the length, not the capacity of the underlying array
+        for i in range(len(self)):
+            yield self.array[i]
+
     def __contains__(self, item):
         for i in range(len(self)):
             if self.array[i] == item:
@@ -25,39 +40,61 @@ class ArrayList(List[T]):
         return False
 
     def __shuffle_right(self, index: int) -> None:
-        for i in range(len(self), index, -1):
-            self.array[i] = self.array[i - 1]
+        self.array.move_range(index, index + 1, len(self) - index)
 
     def __shuffle_left(self, index: int) -> None:
         if len(self) < 0:
             raise Exception("Out of bounds")
-        for i in range(index, len(self)):
-            self.array[i] = self.array[i + 1]
+        self.array.move_range(index + 1, index, len(self) - index)
 
-    def __newsize(self) -> int:
-        length = len(self)
-        if length > 8:
-            new_length = length + (length >> 3) + (4 if length < 9 else 7)
-        else:
-            new_length = 2 * length
+    def __newsize(self, needed: int) -> int:
+        capacity = len(self.array)
+        return max(int(capacity * self.GROWTH_FACTOR), capacity + 1, needed)
 
-        return new_length
-
-    def __resize(self) -> None:
-        new_array = ArrayR(self.__newsize())
-        for i in range(self.length):
-            new_array[i] = self.array[i]
+    def __resize(self, capacity: int) -> None:
+        new_array = LazyArrayR(max(self.MIN_CAPACITY, capacity))
+        new_array.copy_from(self.array, 0, 0, self.length)
         self.array = new_array
 
+    def __grow(self, needed: int) -> None:
+        if needed > len(self.array):
+            self.__resize(self.__newsize(needed))
+
+    def __shrink(self) -> None:
+        capacity = len(self.array)
+        if capacity > self.MIN_CAPACITY and len(self) <= capacity // self.SHRINK_RATIO:
+            self.__resize(capacity // 2)
+
+    def shrink_to_fit(self) -> None:
+        if len(self.array) > max(self.MIN_CAPACITY, len(self)):
+            self.__resize(len(self))
+
+    def extend(self, items) -> None:
+        try:
+            count = len(items)
+        except TypeError:
+            # no length to presize from, so fall back to growing as we go
+            for item in items:
+                self.append(item)
+            return
+        self.__grow(len(self) + count)
+        if isinstance(items, (list, tuple)):
+            self.array.copy_from(items, 0, len(self), count)
+            self.length += count
+        else:
+            for item in items:
+                self.array[self.length] = item
+                self.length += 1
+
     def append(self, item: T) -> None:
         if self.is_full():
-            self.__resize()
+            self.__grow(len(self) + 1)
         self.array[len(self)] = item
         self.length += 1
 
     def insert(self, index: int, item: T) -> None:
         if self.is_full():
-            self.__resize()
+            self.__grow(len(self) + 1)
         self.__shuffle_right(index)
         self.array[index] = item
         self.length += 1
@@ -68,6 +105,7 @@ class ArrayList(List[T]):
         item = self.array[index]
         self.length -= 1
         self.__shuffle_left(index)
+        self.__shrink()
         return item
 
     def index(self, item: T) -> int:
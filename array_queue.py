@@ -0,0 +1,227 @@
+""" Queue and double-ended queue ADTs based on a circular array. """
+
+from __future__ import annotations
+
+__docformat__ = 'reStructuredText'
+
+from typing import Iterable
+from queue_adt import *
+
+
+class ArrayQueue(Queue[T]):
+    """ Implementation of a queue with a circular array.
+
+        The elements occupy length consecutive slots of the array starting
+        at front, wrapping around its end, so serving only moves front and
+        no element is ever shifted. An unbounded queue doubles its array
+        when it is full, making append O(1) amortised. A bounded queue
+        keeps its capacity and applies backpressure instead: append raises
+        an exception and try_append returns False while it is full. As for
+        ArrayStack, the array is a Python list used with a fixed capacity.
+
+        Attributes:
+            length (int): number of elements in the queue (inherited)
+            array (list[T]): the slots of the circular array
+            front (int): position in the array of the element at the front
+            bounded (bool): if True, the capacity never changes
+    """
+
+    MIN_CAPACITY = 1
+
+    def __init__(self, max_capacity: int = 1, bounded: bool = False) -> None:
+        """ Object initializer. """
+        Queue.__init__(self)
+        self.bounded = bounded
+        self.front = 0
+        self.array = [None] * max(self.MIN_CAPACITY, max_capacity)
+
+    @classmethod
+    def from_iterable(cls, items: Iterable[T]) -> ArrayQueue[T]:
+        """ Creates an unbounded queue holding the given items, the first one at the front.
+            :complexity: O(N)
+        """
+        res = cls()
+        items = list(items)
+        if items:
+            res.array = items
+            res.length = len(items)
+        return res
+
+    def clear(self) -> None:
+        """ Resets the queue
+            :complexity: O(N) to drop the references to the elements
+        """
+        super().clear()
+        self.front = 0
+        self.array = [None] * len(self.array)
+
+    def is_empty(self) -> bool:
+        """ Returns whether the queue is empty
+            :complexity: O(1)
+        """
+        return self.length == 0
+
+    def is_full(self) -> bool:
+        """ Returns whether the queue is full. Only a bounded queue can be full.
+            :complexity: O(1)
+        """
+        return self.bounded and self.length == len(self.array)
+
+    def _position(self, index: int) -> int:
+        """ Position in the array of the element at the given index from the front.
+            :raises IndexError: if there is no such element
+        """
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError('No such index in the queue')
+        return (self.front + index) % len(self.array)
+
+    def __getitem__(self, index: int) -> T:
+        """ Returns the element at the given index from the front.
+            :complexity: O(1)
+        """
+        return self.array[self._position(index)]
+
+    def __setitem__(self, index: int, item: T) -> None:
+        """ Replaces the element at the given index from the front.
+            :complexity: O(1)
+        """
+        self.array[self._position(index)] = item
+
+    def __iter__(self):
+        """ Yields the elements from the front to the rear, without copying them.
+            :complexity: O(1) per element
+        """
+        array = self.array
+        capacity = len(array)
+        for i in range(self.front, self.front + self.length):
+            yield array[i % capacity]
+
+    def __str__(self) -> str:
+        """ Magic method constructing a string representation of the queue. """
+        return '[' + ', '.join(str(item) for item in self) + ']'
+
+    def _grow(self) -> None:
+        """ Doubles the array, unrolling the elements to its start.
+            :complexity: O(N)
+        """
+        capacity = len(self.array)
+        self.array = self.array[self.front:] + self.array[:self.front] + [None] * capacity
+        self.front = 0
+
+    def _make_room(self) -> None:
+        """ Ensures there is a free slot for one more element.
+            :raises Exception: if the queue is bounded and full
+        """
+        if self.length == len(self.array):
+            if self.bounded:
+                raise Exception('Queue is full')
+            self._grow()
+
+    def append(self, item: T) -> None:
+        """ Adds an element to the rear of the queue.
+            :complexity: O(1) amortised, O(N) when the array has to grow
+            :raises Exception: if the queue is bounded and full
+        """
+        self._make_room()
+        self.array[(self.front + self.length) % len(self.array)] = item
+        self.length += 1
+
+    def try_append(self, item: T) -> bool:
+        """ Adds an element to the rear of the queue unless it is full.
+            Returns whether the element was added, so a producer can wait
+            for the queue to be served instead of catching an exception.
+            :complexity: O(1) amortised
+        """
+        if self.is_full():
+            return False
+        self.append(item)
+        return True
+
+    def serve(self) -> T:
+        """ Deletes and returns the element at the front of the queue.
+            :pre: queue is not empty
+            :complexity: O(1)
+            :raises Exception: if the queue is empty
+        """
+        if self.length == 0:
+            raise Exception('Queue is empty')
+        item = self.array[self.front]
+        self.array[self.front] = None
+        self.front = (self.front + 1) % len(self.array)
+        self.length -= 1
+        return item
+
+    def peek(self) -> T:
+        """ Returns the element at the front, without serving it.
+            :pre: queue is not empty
+            :complexity: O(1)
+            :raises Exception: if the queue is empty
+        """
+        if self.length == 0:
+            raise Exception('Queue is empty')
+        return self.array[self.front]
+
+    def rotate(self, steps: int = 1) -> None:
+        """ Moves the given number of elements from the front to the rear,
+            keeping their order, e.g. to give every element a turn at the front.
+            :complexity: O(steps % N), or O(1) if the array is full
+        """
+        if self.length == 0:
+            return
+        steps %= self.length
+        capacity = len(self.array)
+        if self.length < capacity:
+            for _ in range(steps):
+                self.append(self.serve())
+        else:
+            # a full array is rotated by moving front alone
+            self.front = (self.front + steps) % capacity
+
+
+class ArrayDeque(ArrayQueue[T]):
+    """ Implementation of a double-ended queue with a circular array.
+
+        Extends ArrayQueue with adding and removing elements at both ends,
+        all in O(1) amortised.
+    """
+
+    def append_left(self, item: T) -> None:
+        """ Adds an element to the front of the deque.
+            :complexity: O(1) amortised, O(N) when the array has to grow
+            :raises Exception: if the deque is bounded and full
+        """
+        self._make_room()
+        self.front = (self.front - 1) % len(self.array)
+        self.array[self.front] = item
+        self.length += 1
+
+    def pop_left(self) -> T:
+        """ Deletes and returns the element at the front of the deque.
+            :complexity: O(1)
+            :raises Exception: if the deque is empty
+        """
+        return self.serve()
+
+    def pop(self) -> T:
+        """ Deletes and returns the element at the rear of the deque.
+            :complexity: O(1)
+            :raises Exception: if the deque is empty
+        """
+        if self.length == 0:
+            raise Exception('Queue is empty')
+        self.length -= 1
+        position = (self.front + self.length) % len(self.array)
+        item = self.array[position]
+        self.array[position] = None
+        return item
+
+    def peek_last(self) -> T:
+        """ Returns the element at the rear, without removing it.
+            :complexity: O(1)
+            :raises Exception: if the deque is empty
+        """
+        if self.length == 0:
+            raise Exception('Queue is empty')
+        return self.array[(self.front + self.length - 1) % len(self.array)]
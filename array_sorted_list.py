@@ -1,158 +1,318 @@
 """
     Array-based implementation of SortedList ADT.
-    Items to store should be of time ListItem.
+    Items are ordered by a key function (by default the key of a ListItem),
+    in a direction fixed when the list is created.
 """
 
-from referential_array import ArrayR
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right, insort
+from operator import attrgetter
+from typing import Callable, Iterable
+from referential_array import LazyArrayR
 from sorted_list import *
 
 __author__ = 'Maria Garcia de la Banda and Brendon Taylor. Modified by Alexey Ignatiev and Graeme Gange'
 __docformat__ = 'reStructuredText'
 
+
 class ArraySortedList(SortedList[T]):
-    """ SortedList ADT implemented with arrays. """
+    """ SortedList ADT implemented with arrays.
+
+    The array always holds the items in ascending order of key(item). A
+    list created with reverse=True presents them in descending order by
+    reading the array from the other end, so both directions share the
+    same code. Positions are found with the C implementation of bisect,
+    run directly on the ctypes array. Items with equal keys keep the order
+    in which they were added.
+
+    Deleting from the middle is lazy: the item stays in its slot as a
+    tombstone, so the array stays sorted and bisect still works on it, and
+    its position is recorded in dead. An index of the list is translated
+    to a slot by skipping the tombstones before it, with a binary search
+    over dead. The tombstones are dropped in a single pass once they fill
+    more than MAX_DEAD_FRACTION of the slots in use, before an insertion
+    (which shifts the array anyway), or before iterating over the list, so
+    a run of deletions costs O(log(N)) each, amortised.
+
+    Attributes:
+        * length (int): number of items in the list (inherited)
+        * key (Callable): maps an item to the value it is sorted by
+        * reverse (bool): True if the list is in descending order
+        * array (ArrayR[T]): the items, in ascending order of their keys
+        * size (int): number of slots in use, tombstones included
+        * dead (list[int]): the slots holding tombstones, in increasing order
+    """
     MIN_CAPACITY = 1
+    MAX_DEAD_FRACTION = 0.5
 
-    def __init__(self, max_capacity: int) -> None:
+    def __init__(self, max_capacity: int, key: Callable = None, reverse: bool = False) -> None:
         """ ArraySortedList object initialiser. """
 
         # first, calling the basic initialiser
         SortedList.__init__(self)
 
+        self.key = attrgetter('key') if key is None else key
+        self.reverse = reverse
+        self.size = 0
+        self.dead = []
+
         # initialising the internal array
         size = max(self.MIN_CAPACITY, max_capacity)
-        self.array = ArrayR(size)
+        self.array = LazyArrayR(size)
+
+    @classmethod
+    def from_iterable(cls, items: Iterable[T], key: Callable = None, reverse: bool = False) -> ArraySortedList[T]:
+        """ Build a sorted list holding the given items with a single sort.
+            :complexity: O(N*log(N)) in general, O(N) if the items are already in order
+        """
+        res = cls(0, key, reverse)
+        items = list(items)
+        if reverse:
+            # so that equal keys still end up in the order they were given
+            items.reverse()
+        items.sort(key=res.key)
+        if len(items) > len(res.array):
+            res.array = LazyArrayR(len(items))
+        res.array.copy_from(items, 0, 0, len(items))
+        res.length = res.size = len(items)
+        return res
 
     def reset(self):
         """ Reset the list. """
         SortedList.__init__(self)
+        self.size = 0
+        self.dead = []
+
+    def clear(self) -> None:
+        """ Clear the list. """
+        SortedList.clear(self)
+        self.array.fill(None, 0, self.size)
+        self.size = 0
+        self.dead = []
+
+    def _compact(self) -> None:
+        """ Drop the tombstones, in a single pass.
+            :complexity: O(1) if there are none, O(N) otherwise
+        """
+        if not self.dead:
+            return
+        kept = 0
+        next_dead = 0
+        for position in range(self.size):
+            if next_dead < len(self.dead) and self.dead[next_dead] == position:
+                next_dead += 1
+                continue
+            self.array[kept] = self.array[position]
+            kept += 1
+        self.array.fill(None, kept, self.size)
+        self.size = kept
+        self.dead = []
+
+    def _slot(self, rank: int) -> int:
+        """ Position in the array of the item with the given rank in ascending order.
+            It is rank plus the number j of tombstones before it, the first j with
+            dead[j] - j > rank, as dead[j] - j never decreases.
+            :complexity: O(log(D)) where D is the number of tombstones
+        """
+        if not self.dead:
+            return rank
+        dead = self.dead
+        return rank + bisect_right(range(len(dead)), rank, key=lambda j: dead[j] - j)
+
+    def _physical(self, index: int) -> int:
+        """ Position in the array of the item at the given index of the list. """
+        if index < 0:
+            index += len(self)
+        return self._slot(len(self) - 1 - index if self.reverse else index)
+
+    def _logical(self, position: int) -> int:
+        """ Index in the list of the item at the given position of the array. """
+        rank = position - bisect_left(self.dead, position)
+        return len(self) - 1 - rank if self.reverse else rank
 
     def __getitem__(self, index: int) -> T:
         """ Magic method. Return the element at a given position. """
-        return self.array[index]
+        if not -len(self) <= index < len(self):
+            raise IndexError('No such index in the list')
+        return self.array[self._physical(index)]
 
-    def __setitem__(self, index: int, item: ListItem) -> None:
+    def __iter__(self):
+        """ Yields the items in the order of the list. """
+        self._compact()
+        positions = range(len(self) - 1, -1, -1) if self.reverse else range(len(self))
+        for i in positions:
+            yield self.array[i]
+
+    def __setitem__(self, index: int, item: T) -> None:
         """ Magic method. Insert the item at a given position,
             if possible (!). Shift the following elements to the right.
+            :raises IndexError: if the item does not belong at that position
         """
-
-        if self.is_empty() or \
-                (index == 0 and item.key <= self[index].key) or \
-                (index == len(self) and self[index - 1].key <= item.key) or \
-                (index > 0 and self[index - 1].key <= item.key <= self[index].key)or\
-                (index == 0 and item.key >= self[index].key)or\
-                (index == len(self) and self[index - 1].key >= item.key)or\
-                (index > 0 and self[index - 1].key >= item.key >= self[index].key):
-
-            if self.is_full():
-                self._resize()
-
-            self._shuffle_right(index)
-            self.array[index] = item
-        else:
-            # the list isn't empty and the item's position is wrong wrt. its neighbourghs
+        if not 0 <= index <= len(self):
+            raise IndexError('No such index in the list')
+        self._compact()
+
+        # the position in the array the item would take, and its neighbours there
+        position = len(self) - index if self.reverse else index
+        key = self.key(item)
+        if (position > 0 and key < self.key(self.array[position - 1])) or \
+                (position < len(self) and self.key(self.array[position]) < key):
+            # the list isn't empty and the item's position is wrong wrt. its neighbours
             raise IndexError('Element should be inserted in sorted order')
 
-    def __contains__(self, item: ListItem):
+        self._insert(position, item)
+
+    def __contains__(self, item: T):
         """ Checks if value is in the list. """
-        for i in range(len(self)):
-            if self.array[i] == item:
-                return True
-        return False
+        try:
+            self.index(item)
+        except ValueError:
+            return False
+        return True
 
     def _shuffle_right(self, index: int) -> None:
         """ Shuffle items to the right up to a given position. """
-        for i in range(len(self), index, -1):
-            self.array[i] = self.array[i - 1]
-
-    def _shuffle_left(self, index: int) -> None:
-        """ Shuffle items starting at a given position to the left. """
-        for i in range(index, len(self)):
-            self.array[i] = self.array[i + 1]
+        self.array.move_range(index, index + 1, len(self) - index)
 
     def _resize(self) -> None:
         """ Resize the list. """
         # doubling the size of our list
-        new_array = ArrayR(2 * len(self.array))
+        new_array = LazyArrayR(2 * len(self.array))
 
         # copying the contents
-        for i in range(self.length):
-            new_array[i] = self.array[i]
+        new_array.copy_from(self.array, 0, 0, self.size)
 
         # referring to the new array
         self.array = new_array
 
-    def delete_at_index(self, index: int) -> ListItem:
-        """ Delete item at a given position. """
-        if index >= len(self):
-            raise IndexError('No such index in the list')
-        item = self.array[index]
-        self.length -= 1
-        self._shuffle_left(index)
-        return item
-
-    def index(self, item: ListItem) -> int:
-        """ Find the position of a given item in the list. """
-        pos = self._index_to_add(item)
-        if pos < len(self) and self[pos] == item:
-            return pos
-        raise ValueError('item not in list')
-
-    def is_full(self):
-        """ Check if the list is full. """
-        return len(self) >= len(self.array)
-
-    def add(self, item: ListItem,reverseSortBoolean) -> None:
-        """ Add new element to the list. """
+    def _insert(self, position: int, item: T) -> None:
+        """ Insert the item at the given position of the array.
+            :pre: there are no tombstones
+        """
         if self.is_full():
             self._resize()
-
-        # find where to place it
-        position = self._index_to_add(item,reverseSortBoolean)
-
-
-
-        self[position] = item
+        self._shuffle_right(position)
+        self.array[position] = item
         self.length += 1
+        self.size += 1
 
-    def _index_to_add(self, item: ListItem,reverseSortBoolean) -> int:
-        """ Find the position where the new item should be placed. """
-        low = 0
-        high = len(self) - 1
-
-        if reverseSortBoolean==False:
-            while low <= high:
-
-
-                mid = (low + high) // 2
-                if self[mid].key < item.key:
-
-                    low = mid + 1
-                elif self[mid].key > item.key:
-
-                    high = mid - 1
-                else:
-
-                    return mid
-
-            return low
-
+    def _drop_tail(self) -> None:
+        """ Drop the last slot in use, and the tombstones it leaves at the end.
+            :complexity: O(1) amortised, as every tombstone is dropped once
+        """
+        self.size -= 1
+        self.array[self.size] = None
+        while self.dead and self.dead[-1] == self.size - 1:
+            self.dead.pop()
+            self.size -= 1
+            self.array[self.size] = None
+
+    def delete_at_index(self, index: int) -> T:
+        """ Delete item at a given position. The last item of the array is
+            removed at once, any other is left as a tombstone.
+            :complexity: O(log(N)) amortised
+        """
+        if not -len(self) <= index < len(self):
+            raise IndexError('No such index in the list')
+        position = self._physical(index)
+        item = self.array[position]
+        self.length -= 1
+        if position == self.size - 1:
+            self._drop_tail()
         else:
-            while low <= high:
-
-                mid = (low + high) // 2
-                if self[mid].key < item.key:
-
-                    high = mid - 1
-                elif self[mid].key > item.key:
+            insort(self.dead, position)
+            if len(self.dead) > self.MAX_DEAD_FRACTION * self.size:
+                self._compact()
+        return item
 
-                    low = mid + 1
-                else:
+    def peek_max(self) -> T:
+        """ Return the item with the greatest key: the last added of equal ones,
+            or the first added in a list created with reverse=True.
+            :complexity: O(1)
+            :raises IndexError: if the list is empty
+        """
+        if len(self) == 0:
+            raise IndexError('The list is empty')
+        # tombstones never stay at the end of the array
+        return self.array[self.size - 1]
+
+    def pop_max(self) -> T:
+        """ Delete and return the item with the greatest key. It is at the end
+            of the array, so nothing is shifted.
+            :complexity: O(1)
+            :raises IndexError: if the list is empty
+        """
+        item = self.peek_max()
+        self.length -= 1
+        self._drop_tail()
+        return item
 
-                    return mid
+    def index(self, item: T) -> int:
+        """ Find the position of a given item in the list.
+            :complexity: O(log(N)), plus the number of items with the same key
+        """
+        key = self.key(item)
+        position = bisect_left(self.array.array, key, 0, self.size, key=self.key)
+        while position < self.size and self.key(self.array[position]) == key:
+            if self.array[position] == item and not self._is_dead(position):
+                return self._logical(position)
+            position += 1
+        raise ValueError('item not in list')
 
-            return low
+    def _is_dead(self, position: int) -> bool:
+        """ Whether the given position of the array holds a tombstone. """
+        k = bisect_left(self.dead, position)
+        return k < len(self.dead) and self.dead[k] == position
 
+    def is_full(self):
+        """ Check if the list is full. """
+        return self.size >= len(self.array)
 
+    def add(self, item: T) -> None:
+        """ Add new element to the list.
+            :complexity: O(log(N)) to find the position, O(N) to shift the items after it
+        """
+        self._compact()
+        self._insert(self._index_to_add(item), item)
 
+    def _index_to_add(self, item: T) -> int:
+        """ Find the position in the array where the new item should be placed.
+            Binary search runs in C directly on the underlying ctypes array.
+        """
+        # bisect to the right of equal keys in ascending order, and to the left
+        # in descending order, so they are read back in the order they were added
+        search = bisect_left if self.reverse else bisect_right
+        return search(self.array.array, self.key(item), 0, len(self), key=self.key)
+
+    def merge(self, other: ArraySortedList[T]) -> None:
+        """ Merge the items of another sorted list into this one.
+            Both lists are walked once in ascending order of this list's key.
+            :complexity: O(N + M) where N and M are the lengths of the lists
+        """
+        self._compact()
+        other._compact()
+        # equal keys are stored in opposite orders by lists of opposite directions
+        other_items = other.array[0:len(other)]
+        if other.reverse != self.reverse:
+            other_items.reverse()
+        # linear when both lists use the same key, as the items are then already in order
+        other_items.sort(key=self.key)
+
+        new_array = LazyArrayR(max(self.MIN_CAPACITY, len(self) + len(other_items)))
+        i = j = k = 0
+        while i < len(self) and j < len(other_items):
+            # on equal keys, the items of the other list count as added after those of this one
+            mine, theirs = self.key(self.array[i]), self.key(other_items[j])
+            if theirs < mine or (self.reverse and not mine < theirs):
+                new_array[k] = other_items[j]
+                j += 1
+            else:
+                new_array[k] = self.array[i]
+                i += 1
+            k += 1
+        new_array.copy_from(self.array, i, k, len(self) - i)
+        new_array.copy_from(other_items, j, k + len(self) - i, len(other_items) - j)
 
+        self.array = new_array
+        self.length = self.size = k + (len(self) - i) + (len(other_items) - j)
@@ -0,0 +1,89 @@
+""" Stack ADT based on a resizable array. """
+
+__docformat__ = 'reStructuredText'
+
+from stack_adt import *
+
+
+class ArrayStack(Stack[T]):
+    """ Implementation of a stack with a resizable array.
+
+        Unlike LinkedStack, pushing does not allocate a node per element:
+        the items are stored in one array that doubles when it is full, so
+        push and pop are O(1) amortised and never allocate in the common case.
+        The array is a Python list used with a fixed capacity rather than an
+        ArrayR, as reading and writing its slots is done in C.
+
+        Attributes:
+            length (int): number of elements in the stack (inherited)
+            array (list[T]): the elements, from the bottom to the top of the stack
+            shrink (bool): if True, the array is halved once it is a quarter full
+    """
+
+    MIN_CAPACITY = 1
+
+    def __init__(self, max_capacity: int = 1, shrink: bool = False) -> None:
+        """ Object initializer. """
+        Stack.__init__(self)
+        self.shrink = shrink
+        self.array = [None] * max(self.MIN_CAPACITY, max_capacity)
+
+    def clear(self) -> None:
+        """ Resets the stack
+        :complexity: O(N) to drop the references to the elements
+        """
+        self.array[:self.length] = [None] * self.length
+        super().clear()
+
+    def is_empty(self) -> bool:
+        """ Returns whether the stack is empty
+            :complexity: O(1)
+        """
+        return self.length == 0
+
+    def is_full(self) -> bool:
+        """ Returns whether the stack is full
+            :complexity: O(1)
+        """
+        return False
+
+    def _resize(self, capacity: int) -> None:
+        """ Moves the elements into a new array of the given capacity.
+            :complexity: O(N)
+        """
+        self.array = self.array[:self.length] + [None] * (capacity - self.length)
+
+    def push(self, item: T) -> None:
+        """ Pushes an element to the top of the stack.
+            :complexity: O(1) amortised, O(N) when the array has to grow
+        """
+        if self.length == len(self.array):
+            self._resize(2 * len(self.array))
+        self.array[self.length] = item
+        self.length += 1
+
+    def pop(self) -> T:
+        """ Pops the element at the top of the stack.
+            :pre: stack is not empty
+            :complexity: O(1) amortised, O(N) when the array shrinks
+            :raises Exception: if the stack is empty
+        """
+        if self.length == 0:
+            raise Exception('Stack is empty')
+
+        self.length -= 1
+        item = self.array[self.length]
+        self.array[self.length] = None
+        if self.shrink and len(self.array) > self.MIN_CAPACITY and self.length <= len(self.array) // 4:
+            self._resize(max(self.MIN_CAPACITY, len(self.array) // 2))
+        return item
+
+    def peek(self) -> T:
+        """ Returns the element at the top, without popping it from stack.
+            :pre: stack is not empty
+            :complexity: O(1)
+            :raises Exception: if the stack is empty
+        """
+        if self.is_empty():
+            raise Exception('Stack is empty')
+        return self.array[self.length - 1]
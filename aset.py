@@ -4,7 +4,7 @@
 
 from __future__ import annotations
 from set import *
-from referential_array import ArrayR
+from referential_array import LazyArrayR
 
 class ASet(Set[T]):
     """Simple array-based implementation of the set ADT.
@@ -22,7 +22,7 @@ class ASet(Set[T]):
     def __init__(self, capacity: int = 1) -> None:
         """ Initialization. """
         Set.__init__(self)
-        self.array = ArrayR(max(self.MIN_CAPACITY, capacity))
+        self.array = LazyArrayR(max(self.MIN_CAPACITY, capacity))
 
     def __len__(self) -> int:
         """ Returns the number of elements in the set. """
@@ -43,6 +43,11 @@ class ASet(Set[T]):
         """ Makes the set empty. """
         self.size = 0
 
+    def __iter__(self):
+        """ Yields the elements of the set, in insertion order. """
+        for i in range(self.size):
+            yield self.array[i]
+
     def is_full(self) -> bool:
         """ True if the set is full and no element can be added. """
         return len(self) == len(self.array)
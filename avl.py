@@ -1,5 +1,7 @@
 """ AVL Tree implemented on top of the standard BST. """
 
+from __future__ import annotations
+
 __author__ = 'Alexey Ignatiev, with edits by Jackson Goerner, modified by Shoumil Guha (32700660)'
 __docformat__ = 'reStructuredText'
 
@@ -16,6 +18,11 @@ class AVLTree(BinarySearchTree, Generic[K, I]):
         rotations of Adelson-Velsky and Landis (AVL).
     """
 
+    COUNTED_METHODS = dict(BinarySearchTree.COUNTED_METHODS,
+                           left_rotate='left_rotations',
+                           right_rotate='right_rotations',
+                           rebalance='rebalances')
+
     def __init__(self) -> None:
         """
             Initialises an empty Binary Search Tree
@@ -48,6 +55,27 @@ class AVLTree(BinarySearchTree, Generic[K, I]):
             return 0
         return self.get_height(current.right) - self.get_height(current.left)
 
+    def get_size(self, current: AVLTreeNode) -> int:
+        """
+            Get the number of nodes in the sub-tree of a node. Return
+            current.size if current is not None. Otherwise, return 0.
+            :complexity: O(1)
+        """
+
+        if current is not None:
+            return current.size
+        return 0
+
+    def update_node(self, current: AVLTreeNode) -> None:
+        """
+            Recompute the height and size of a node from those of its children.
+            :complexity: O(1)
+        """
+
+        # get the height of the longest subtree and add 1 to account for the current node
+        current.height = 1 + max(self.get_height(current.right), self.get_height(current.left))
+        current.size = 1 + self.get_size(current.left) + self.get_size(current.right)
+
     def insert_aux(self, current: AVLTreeNode, key: K, item: I) -> AVLTreeNode:
         """
             Attempts to insert an item into the tree, it uses the Key to insert it
@@ -63,8 +91,8 @@ class AVLTree(BinarySearchTree, Generic[K, I]):
         else:  # key == current.key
             raise ValueError('Inserting duplicate item')
 
-        # get the height of the longest subtree and add 1 to account for the current node
-        current.height = 1 + max(self.get_height(current.right), self.get_height(current.left))
+        # update the height and size of the current node from its subtrees
+        self.update_node(current)
         current = self.rebalance(current)
         return current
 
@@ -99,6 +127,7 @@ class AVLTree(BinarySearchTree, Generic[K, I]):
             current.item = succ.item
             current.right = self.delete_aux(current.right, succ.key)
 
+        self.update_node(current)
         return self.rebalance(current)
 
     def left_rotate(self, current: AVLTreeNode) -> AVLTreeNode:
@@ -123,10 +152,9 @@ class AVLTree(BinarySearchTree, Generic[K, I]):
         child.left = current  # current node is now to the left of the new root node, child
         current.right = center  # move center to the right of the current node
 
-        # update heights for the trees
-        # get the height of the longest subtree and add 1 to account for the current node
-        current.height = 1 + max(self.get_height(current.right), self.get_height(current.left))
-        child.height = 1 + max(self.get_height(child.right), self.get_height(child.left))
+        # update heights and sizes for the trees
+        self.update_node(current)
+        self.update_node(child)
         return child
 
     def right_rotate(self, current: AVLTreeNode) -> AVLTreeNode:
@@ -151,10 +179,9 @@ class AVLTree(BinarySearchTree, Generic[K, I]):
         child.right = current  # current node is now to the right of the new root node, child
         current.left = center  # move center to the left of the current node
 
-        # update heights for the trees
-        # get the height of the longest subtree and add 1 to account for the current node
-        current.height = 1 + max(self.get_height(current.right), self.get_height(current.left))
-        child.height = 1 + max(self.get_height(child.right), self.get_height(child.left))
+        # update heights and sizes for the trees
+        self.update_node(current)
+        self.update_node(child)
         return child
 
     def rebalance(self, current: AVLTreeNode) -> AVLTreeNode:
@@ -181,6 +208,17 @@ class AVLTree(BinarySearchTree, Generic[K, I]):
 
         return current
 
+    def tree_stats(self) -> dict:
+        """
+            Reports the shape of the tree as BinarySearchTree.tree_stats does,
+            adding the total number of rotations if stats were enabled.
+            :complexity: O(N)
+        """
+        stats = BinarySearchTree.tree_stats(self)
+        if 'left_rotations' in stats:
+            stats['rotations'] = stats['left_rotations'] + stats['right_rotations']
+        return stats
+
     def range_between_aux(self, current: AVLTreeNode, i: int, j: int):
         """
         Custom function that utilises recursion to traverse the AVLTree to
@@ -195,8 +233,12 @@ class AVLTree(BinarySearchTree, Generic[K, I]):
             :complexity: O(j - i + log(N))
                 Where N is the number of nodes in the AVLTree
         """
-        if current is not None:  # if not a base case
-            self.range_between_aux(current.left, i, j)
+        if current is not None and self.range_counter <= j:  # if not a base case
+            if self.range_counter + self.get_size(current.left) <= i:
+                # the whole left subtree comes before index i, skip it
+                self.range_counter += self.get_size(current.left)
+            else:
+                self.range_between_aux(current.left, i, j)
             self.range_counter += 1
             if i + 1 <= self.range_counter <= j + 1:
                 self.range_sorted_list.append(current.item)
@@ -214,3 +256,113 @@ class AVLTree(BinarySearchTree, Generic[K, I]):
         self.range_between_aux(self.root, i, j)
         self.range_counter = 0
         return self.range_sorted_list
+
+    def kth_item(self, k: int) -> I:
+        """
+            Returns the item of the node with the kth smallest key, starting from 0.
+            The sub-tree sizes tell which side of each node the kth key is on.
+            :complexity: O(log(N))
+            :raises IndexError: if there is no such index in the tree
+        """
+        if not 0 <= k < len(self):
+            raise IndexError('No such index in the tree')
+        current = self.root
+        while True:
+            left_size = self.get_size(current.left)
+            if k < left_size:
+                current = current.left
+            elif k == left_size:
+                return current.item
+            else:
+                k -= left_size + 1
+                current = current.right
+
+    def get_maximal(self, current: AVLTreeNode) -> AVLTreeNode:
+        """
+            Get a node having the largest key in the current sub-tree.
+            :complexity: O(log(N))
+        """
+        while current.right is not None:
+            current = current.right
+        return current
+
+    def join_aux(self, left: AVLTreeNode, middle: AVLTreeNode, right: AVLTreeNode) -> AVLTreeNode:
+        """
+            Joins two AVL sub-trees and a node whose key is larger than every
+            key of the left sub-tree and smaller than every key of the right one.
+            The node is attached at the depth where the taller sub-tree has the
+            height of the shorter one, and the path back up is rebalanced.
+            returns the root of the joined sub-tree.
+            :complexity: O(|height(left) - height(right)| + 1)
+        """
+        if self.get_height(left) > self.get_height(right) + 1:
+            left.right = self.join_aux(left.right, middle, right)
+            self.update_node(left)
+            return self.rebalance(left)
+        if self.get_height(right) > self.get_height(left) + 1:
+            right.left = self.join_aux(left, middle, right.left)
+            self.update_node(right)
+            return self.rebalance(right)
+
+        middle.left = left
+        middle.right = right
+        self.update_node(middle)
+        return middle
+
+    def split_aux(self, current: AVLTreeNode, key: K) -> tuple:
+        """
+            Splits a sub-tree into the sub-trees of the keys smaller than key
+            and of the keys larger than or equal to key.
+            :complexity: O(log(N)), as the costs of the joins on the way up add up to the height
+        """
+        if current is None:
+            return None, None
+        left, right = current.left, current.right
+        if key <= current.key:
+            smaller, larger = self.split_aux(left, key)
+            return smaller, self.join_aux(larger, current, right)
+        smaller, larger = self.split_aux(right, key)
+        return self.join_aux(left, current, smaller), larger
+
+    def _tree_with_root(self, root: AVLTreeNode) -> AVLTree:
+        """ Creates a tree of the same class around an existing sub-tree. """
+        tree = type(self)()
+        tree.root = root
+        tree.length = self.get_size(root)
+        return tree
+
+    def split(self, key: K) -> tuple:
+        """
+            Splits the tree into a tree of the keys smaller than key and a tree
+            of the keys larger than or equal to key. The nodes are moved into the
+            two new trees, so this tree is left empty.
+            :complexity: O(log(N))
+        """
+        smaller, larger = self.split_aux(self.root, key)
+        self.root = None
+        self.length = 0
+        return self._tree_with_root(smaller), self._tree_with_root(larger)
+
+    @classmethod
+    def join(cls, left: AVLTree, right: AVLTree) -> AVLTree:
+        """
+            Joins two trees into one, when every key of the left tree is smaller
+            than every key of the right one. The nodes are moved into the new
+            tree, so both trees are left empty.
+            :complexity: O(log(N))
+            :raises ValueError: if the keys of the trees overlap
+        """
+        res = cls()
+        if left.is_empty() or right.is_empty():
+            res.root = left.root if right.is_empty() else right.root
+        else:
+            middle = res.get_maximal(left.root)
+            if not middle.key < res.get_minimal(right.root).key:
+                raise ValueError('The keys of the left tree should be smaller than those of the right tree')
+            left.root = left.delete_aux(left.root, middle.key)
+            res.root = res.join_aux(left.root, middle, right.root)
+        res.length = res.get_size(res.root)
+        for tree in (left, right):
+            tree.root = None
+            tree.length = 0
+        return res
@@ -0,0 +1,34 @@
+"""
+Microbenchmark for array allocation.
+
+Compares the cost of creating an ArrayR (which writes None into every slot)
+against a LazyArrayR (which leaves the zero-filled NULL slots alone and reads
+them back as None), for lengths from 10 to 10^7. Run it directly:
+
+    python bench_referential_array.py
+"""
+
+__docformat__ = 'reStructuredText'
+
+import timeit
+from referential_array import ArrayR, LazyArrayR
+
+SIZES = [10, 100, 1000, 10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7]
+
+# enough repetitions that every size allocates about this many slots in total
+SLOTS_PER_RUN = 10 ** 7
+
+
+def allocations_per_second(array_type: type, length: int) -> float:
+    """ Returns how many arrays of the given type and length are allocated per second. """
+    number = max(1, SLOTS_PER_RUN // length)
+    seconds = min(timeit.repeat(lambda: array_type(length), number=number, repeat=3))
+    return number / seconds
+
+
+if __name__ == '__main__':
+    print("{0:>10} {1:>16} {2:>16} {3:>8}".format("length", "ArrayR/s", "LazyArrayR/s", "speedup"))
+    for length in SIZES:
+        eager = allocations_per_second(ArrayR, length)
+        lazy = allocations_per_second(LazyArrayR, length)
+        print("{0:>10} {1:>16.1f} {2:>16.1f} {3:>7.1f}x".format(length, eager, lazy, lazy / eager))
@@ -0,0 +1,44 @@
+"""
+Microbenchmark for the stack implementations.
+
+Compares push/pop throughput of LinkedStack (one Node allocated per push)
+against ArrayStack (one resizable array), filling each stack to a given
+depth and emptying it again. Run it directly:
+
+    python bench_stack.py
+"""
+
+__docformat__ = 'reStructuredText'
+
+import timeit
+from array_stack import ArrayStack
+from linked_stack import LinkedStack
+
+DEPTHS = [10, 100, 1000, 10 ** 4, 10 ** 5, 10 ** 6]
+
+# enough repetitions that every depth pushes about this many items in total
+PUSHES_PER_RUN = 10 ** 6
+
+
+def fill_and_empty(stack_type: type, depth: int) -> None:
+    """ Pushes depth items onto a new stack, then pops them all. """
+    stack = stack_type()
+    for i in range(depth):
+        stack.push(i)
+    while not stack.is_empty():
+        stack.pop()
+
+
+def operations_per_second(stack_type: type, depth: int) -> float:
+    """ Returns how many push or pop operations are done per second. """
+    number = max(1, PUSHES_PER_RUN // depth)
+    seconds = min(timeit.repeat(lambda: fill_and_empty(stack_type, depth), number=number, repeat=3))
+    return 2 * depth * number / seconds
+
+
+if __name__ == '__main__':
+    print("{0:>10} {1:>16} {2:>16} {3:>8}".format("depth", "LinkedStack op/s", "ArrayStack op/s", "speedup"))
+    for depth in DEPTHS:
+        linked = operations_per_second(LinkedStack, depth)
+        array = operations_per_second(ArrayStack, depth)
+        print("{0:>10} {1:>16.0f} {2:>16.0f} {3:>7.2f}x".format(depth, linked, array, array / linked))
@@ -0,0 +1,68 @@
+"""
+Memory benchmark of pooled traders.
+
+Measures with tracemalloc the memory taken by N traders, each with a few
+materials and an active deal, stored as Trader objects and in a
+TraderPool. The materials are shared and not counted. Run it directly:
+
+    python bench_trader_pool.py
+"""
+
+__docformat__ = 'reStructuredText'
+
+import gc
+import tracemalloc
+from deal_engine import generate_all_deals
+from material import Material
+from random_gen import RandomGen
+from trader import Trader
+from trader_pool import TraderPool
+
+COUNTS = [10 ** 3, 10 ** 4, 10 ** 5]
+
+MATERIALS = [Material("Material {0}".format(i), i + 0.5) for i in range(20)]
+
+
+def make_traders(count: int) -> list:
+    """ Makes count traders as objects. """
+    traders = []
+    for _ in range(count):
+        trader = Trader.random_trader()
+        low = RandomGen.randint(0, 15)
+        trader.set_all_materials(MATERIALS[low:low + 5])
+        traders.append(trader)
+    generate_all_deals(traders)
+    return traders
+
+
+def make_pool(count: int) -> TraderPool:
+    """ Makes count traders in a pool, drawn as make_traders draws them. """
+    pool = TraderPool()
+    for _ in range(count):
+        trader = pool.add_random()
+        low = RandomGen.randint(0, 15)
+        trader.set_all_materials(MATERIALS[low:low + 5])
+    generate_all_deals(list(pool))
+    return pool
+
+
+def bytes_used(make, count: int) -> int:
+    """ Returns the memory still allocated for what make(count) returns. """
+    RandomGen.set_seed(16)
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = make(count)
+    gc.collect()
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del result
+    return used
+
+
+if __name__ == '__main__':
+    print("{0:>8} {1:>16} {2:>16} {3:>8}".format("traders", "Trader B/trader", "pool B/trader", "ratio"))
+    for count in COUNTS:
+        objects = bytes_used(make_traders, count) / count
+        pooled = bytes_used(make_pool, count) / count
+        print("{0:>8} {1:>16.0f} {2:>16.0f} {3:>7.1f}x".format(count, objects, pooled, objects / pooled))
@@ -0,0 +1,47 @@
+"""
+Work report for the AVL trees kept by RangeTrader.
+
+A RangeTrader keeps its materials in material_index, an AVLTree keyed by
+mining rate, which set_all_materials builds and add_material and
+remove_material update; materials_between then only reads a range of it.
+This script builds such an index for inventories of growing size, with the
+tree's counters enabled, reads one range, and prints the shape of the tree
+next to log2(N) and the work done per insert.
+Run it directly:
+
+    python bench_tree_stats.py
+"""
+
+__docformat__ = 'reStructuredText'
+
+import math
+from avl import AVLTree
+from material import Material
+from random_gen import RandomGen
+
+SIZES = [10, 100, 1000, 10 ** 4, 10 ** 5]
+
+
+def range_trader_tree(size: int) -> AVLTree:
+    """ Builds the material index of a RangeTrader with size random materials, and reads a range. """
+    tree = AVLTree()
+    tree.enable_stats()
+    for _ in range(size):
+        material = Material.random_material()
+        if material.mining_rate not in tree:
+            tree[material.mining_rate] = material
+    i = RandomGen.randint(0, len(tree) - 1)
+    tree.range_between(i, RandomGen.randint(i, len(tree) - 1))
+    return tree
+
+
+if __name__ == '__main__':
+    RandomGen.set_seed(40)
+    print("{0:>8} {1:>7} {2:>7} {3:>10} {4:>15} {5:>15}".format(
+        "nodes", "height", "log2(N)", "avg depth", "rotations/ins", "comparisons/ins"))
+    for size in SIZES:
+        stats = range_trader_tree(size).tree_stats()
+        nodes = stats['nodes']
+        print("{0:>8} {1:>7} {2:>7.1f} {3:>10.2f} {4:>15.2f} {5:>15.2f}".format(
+            nodes, stats['height'], math.log2(nodes), stats['average_depth'],
+            stats['rotations'] / nodes, stats['insert_comparisons'] / nodes))
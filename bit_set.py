@@ -0,0 +1,138 @@
+"""
+    Bit-vector implementation of Set ADT for small non-negative integers.
+"""
+
+from __future__ import annotations
+from set import *
+
+__docformat__ = 'reStructuredText'
+
+# BIT_POSITIONS[b] holds the positions of the bits set in the byte b
+BIT_POSITIONS = tuple(tuple(bit for bit in range(8) if byte >> bit & 1) for byte in range(256))
+
+
+class BitSet(Set[int]):
+    """Set of integer ids in the range [0, N), one bit per id.
+
+    Attributes:
+        * size (int): number of elements in the set
+        * capacity (int): number of ids the set was sized for initially
+        * bits (bytearray): bit i of byte i // 8 is set iff i is in the set
+
+    Meant for dense universes such as the indices of the materials or
+    caves of a world: a million ids take 125KB. add, remove and membership
+    are O(1). union, intersection and difference combine the bit vectors as
+    Python integers, so they run a machine word at a time in C. The vector
+    grows as needed when larger ids are added.
+    """
+
+    def __init__(self, capacity: int = 1) -> None:
+        """ Initialization. """
+        self.capacity = capacity
+        Set.__init__(self)
+
+    @classmethod
+    def _from_int(cls, value: int, capacity: int) -> BitSet:
+        """ Creates a set from an integer used as a bit vector. """
+        res = cls(capacity)
+        res.bits = bytearray(value.to_bytes(len(res.bits), 'little'))
+        res.size = value.bit_count()
+        return res
+
+    def _as_int(self) -> int:
+        """ The bit vector as a Python integer. """
+        return int.from_bytes(self.bits, 'little')
+
+    def __len__(self) -> int:
+        """ Returns the number of elements in the set. """
+        return self.size
+
+    def is_empty(self) -> bool:
+        """ True if the set is empty. """
+        return len(self) == 0
+
+    def clear(self) -> None:
+        """ Makes the set empty. """
+        self.size = 0
+        self.bits = bytearray((max(1, self.capacity) + 7) // 8)
+
+    @staticmethod
+    def _check(item: int) -> None:
+        """ Raises an exception if item cannot be stored in a bit set. """
+        if type(item) != int:
+            raise TypeError("BitSet elements must be integers")
+        if item < 0:
+            raise ValueError("BitSet elements must be non-negative")
+
+    def __contains__(self, item: int) -> bool:
+        """ True if the set contains the item. """
+        if type(item) != int or item < 0 or item >> 3 >= len(self.bits):
+            return False
+        return self.bits[item >> 3] >> (item & 7) & 1 == 1
+
+    def __iter__(self):
+        """ Yields the elements of the set in increasing order.
+        :complexity: O(N / 8 + len(self)) where N is the size of the universe
+        """
+        for index, byte in enumerate(self.bits):
+            if byte:
+                base = index << 3
+                for bit in BIT_POSITIONS[byte]:
+                    yield base + bit
+
+    def add(self, item: int) -> None:
+        """ Adds an element to the set. Note that an element already
+        present in the set should not be added.
+        :raises TypeError: if item is not an integer
+        :raises ValueError: if item is negative
+        """
+        self._check(item)
+        index = item >> 3
+        if index >= len(self.bits):
+            # at least double, so adding increasing ids costs O(1) amortised
+            self.bits.extend(bytes(max(index + 1, 2 * len(self.bits)) - len(self.bits)))
+        mask = 1 << (item & 7)
+        if not self.bits[index] & mask:
+            self.bits[index] |= mask
+            self.size += 1
+
+    def remove(self, item: int) -> None:
+        """ Removes an element from the set.
+        :pre: the element should be present in the set
+        :raises KeyError: if no such element is found.
+        """
+        if item not in self:
+            raise KeyError(item)
+        self.bits[item >> 3] &= ~(1 << (item & 7)) & 0xFF
+        self.size -= 1
+
+    def _capacity_with(self, other: BitSet) -> int:
+        """ Number of ids covered by the longer of the two bit vectors. """
+        return 8 * max(len(self.bits), len(other.bits))
+
+    def union(self, other: BitSet) -> BitSet:
+        """ Creates a new set equal to the union with another one,
+        i.e. the result set should contains the elements of self and other.
+        :complexity: O(N / w) where w is the machine word size in bits
+        """
+        return BitSet._from_int(self._as_int() | other._as_int(), self._capacity_with(other))
+
+    def intersection(self, other: BitSet) -> BitSet:
+        """ Creates a new set equal to the intersection with another one,
+        i.e. the result set should contain the elements that are both in
+        self *and* other.
+        :complexity: O(N / w) where w is the machine word size in bits
+        """
+        return BitSet._from_int(self._as_int() & other._as_int(), self._capacity_with(other))
+
+    def difference(self, other: BitSet) -> BitSet:
+        """ Creates a new set equal to the difference with another one,
+        i.e. the result set should contain the elements of self that
+        *are not* in other.
+        :complexity: O(N / w) where w is the machine word size in bits
+        """
+        return BitSet._from_int(self._as_int() & ~other._as_int(), self._capacity_with(other))
+
+    def __str__(self):
+        """ Magic method constructing a string representation of the set object. """
+        return '{' + ', '.join(str(item) for item in self) + '}'
@@ -0,0 +1,249 @@
+""" Blocked (square root decomposition) implementation of SortedList ADT. """
+
+from __future__ import annotations
+
+__docformat__ = 'reStructuredText'
+
+from bisect import bisect_left, bisect_right
+from typing import Callable
+from AbstractSortedList import SortedList, T
+
+
+class BlockSortedList(SortedList[T]):
+    """ SortedList ADT implemented as a list of sorted blocks.
+
+    The items are kept in ascending order of key(item), split across blocks
+    of at most 2 * LOAD items. Inserting or deleting only shifts the items
+    of one block, so with N items both cost O(log N + LOAD) rather than the
+    O(N) shuffle of an array-based sorted list. Items with equal keys keep
+    their insertion order.
+
+    Positions are translated to blocks with a Fenwick tree of the block
+    sizes: the block holding a given index, and the number of items before
+    a given block, are both found in O(log(N / LOAD)). The tree is updated
+    in O(log(N / LOAD)) when a block grows or shrinks by one item, and
+    rebuilt in O(N / LOAD) only when blocks are split, merged or dropped,
+    which happens once every LOAD or so operations.
+
+    Attributes:
+        * length (int): number of items in the list (inherited)
+        * key (Callable): maps an item to the value it is sorted by
+        * blocks (list[list[T]]): the items, block by block
+        * block_keys (list[list]): key(item) for every item, block by block
+        * maxes (list): the largest key of every block, used to find the
+          block an item belongs to with binary search
+        * fenwick (list[int] | None): Fenwick tree of the block sizes, indexed
+          from 1, or None when it has to be rebuilt
+    """
+    LOAD = 256
+
+    def __init__(self, key: Callable = None, load: int = None) -> None:
+        """ BlockSortedList object initialiser.
+            :param load: the block size to aim for, LOAD by default
+        """
+        SortedList.__init__(self)
+        self.key = key if key is not None else (lambda item: item)
+        if load is not None:
+            if load < 1:
+                raise ValueError("Load should be at least 1.")
+            self.LOAD = load
+        self.blocks = []
+        self.block_keys = []
+        self.maxes = []
+        self.fenwick = None
+
+    def clear(self) -> None:
+        """ Clear the list. """
+        SortedList.clear(self)
+        self.blocks = []
+        self.block_keys = []
+        self.maxes = []
+        self.fenwick = None
+
+    def _build_fenwick(self) -> list[int]:
+        """ Build the Fenwick tree of the block sizes.
+            :complexity: O(B) where B is the number of blocks
+        """
+        tree = [0] + [len(block) for block in self.blocks]
+        for i in range(1, len(tree)):
+            parent = i + (i & -i)
+            if parent < len(tree):
+                tree[parent] += tree[i]
+        self.fenwick = tree
+        return tree
+
+    def _resized(self, block_index: int, delta: int) -> None:
+        """ Record that a block has gained (or lost) delta items.
+            :complexity: O(log(B)) where B is the number of blocks
+        """
+        tree = self.fenwick
+        if tree is not None:
+            i = block_index + 1
+            while i < len(tree):
+                tree[i] += delta
+                i += i & -i
+
+    def _locate(self, index: int) -> tuple[int, int]:
+        """ Find the block holding the item of the given rank, and its
+            position inside that block, by descending the Fenwick tree.
+            :complexity: O(log(N / LOAD)), plus O(N / LOAD) if the tree is rebuilt
+            :raises IndexError: if there is no such index in the list
+        """
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('No such index in the list')
+        tree = self.fenwick if self.fenwick is not None else self._build_fenwick()
+        block_index = 0
+        step = 1 << (len(self.blocks).bit_length() - 1)
+        while step > 0:
+            if block_index + step < len(tree) and tree[block_index + step] <= index:
+                block_index += step
+                index -= tree[block_index]
+            step >>= 1
+        return block_index, index
+
+    def _rank(self, block_index: int, position: int) -> int:
+        """ Rank of the item at the given position of the given block.
+            :complexity: O(log(N / LOAD)), plus O(N / LOAD) if the tree is rebuilt
+        """
+        tree = self.fenwick if self.fenwick is not None else self._build_fenwick()
+        rank = position
+        while block_index > 0:
+            rank += tree[block_index]
+            block_index -= block_index & -block_index
+        return rank
+
+    def __getitem__(self, index: int) -> T:
+        """ Magic method. Return the element at a given position. """
+        block_index, position = self._locate(index)
+        return self.blocks[block_index][position]
+
+    def __iter__(self):
+        """ Yields the items in sorted order. """
+        for block in self.blocks:
+            yield from block
+
+    def __contains__(self, item: T) -> bool:
+        """ Checks if item is in the list. """
+        try:
+            self.index(item)
+        except ValueError:
+            return False
+        return True
+
+    def _insert(self, block_index: int, position: int, item: T, key) -> None:
+        """ Insert an item at a given position of a given block, splitting
+            the block in two if it has become too long.
+        """
+        block = self.blocks[block_index]
+        keys = self.block_keys[block_index]
+        block.insert(position, item)
+        keys.insert(position, key)
+        self.length += 1
+        self._resized(block_index, 1)
+
+        if len(block) > 2 * self.LOAD:
+            self.blocks.insert(block_index + 1, block[self.LOAD:])
+            self.block_keys.insert(block_index + 1, keys[self.LOAD:])
+            del block[self.LOAD:]
+            del keys[self.LOAD:]
+            self.maxes.insert(block_index + 1, self.block_keys[block_index + 1][-1])
+            self.fenwick = None
+        self.maxes[block_index] = keys[-1]
+
+    def add(self, item: T) -> None:
+        """ Add new element to the list.
+            :complexity: O(log(N) + LOAD)
+        """
+        key = self.key(item)
+        if not self.blocks:
+            self.blocks.append([item])
+            self.block_keys.append([key])
+            self.maxes.append(key)
+            self.length += 1
+            self.fenwick = None
+            return
+
+        block_index = min(bisect_right(self.maxes, key), len(self.maxes) - 1)
+        position = bisect_right(self.block_keys[block_index], key)
+        self._insert(block_index, position, item, key)
+
+    def __setitem__(self, index: int, item: T) -> None:
+        """ Magic method. Insert the item at a given position,
+            if possible (!). Shift the following elements to the right.
+            :raises IndexError: if the item does not belong at that position
+        """
+        key = self.key(item)
+        if not 0 <= index <= len(self) or \
+                (index > 0 and self.key(self[index - 1]) > key) or \
+                (index < len(self) and key > self.key(self[index])):
+            raise IndexError('Element should be inserted in sorted order')
+
+        if not self.blocks:
+            self.add(item)
+        elif index == len(self):
+            block_index = len(self.blocks) - 1
+            self._insert(block_index, len(self.blocks[block_index]), item, key)
+        else:
+            block_index, position = self._locate(index)
+            self._insert(block_index, position, item, key)
+
+    def delete_at_index(self, index: int) -> T:
+        """ Delete item at a given position.
+            :complexity: O(log(N) + LOAD) amortised
+        """
+        block_index, position = self._locate(index)
+        block = self.blocks[block_index]
+        item = block.pop(position)
+        self.block_keys[block_index].pop(position)
+        self.length -= 1
+        self._resized(block_index, -1)
+
+        if not block:
+            del self.blocks[block_index]
+            del self.block_keys[block_index]
+            del self.maxes[block_index]
+            self.fenwick = None
+        else:
+            self.maxes[block_index] = self.block_keys[block_index][-1]
+            if len(block) < self.LOAD // 2 and block_index + 1 < len(self.blocks):
+                self._merge(block_index)
+        return item
+
+    def _merge(self, block_index: int) -> None:
+        """ Merge a block that has become short with the block after it, so
+            deletions cannot leave behind a long run of tiny blocks. If the
+            merged block is too long it is split again into two halves.
+        """
+        block = self.blocks[block_index] + self.blocks[block_index + 1]
+        keys = self.block_keys[block_index] + self.block_keys[block_index + 1]
+        self.fenwick = None
+        if len(block) > 2 * self.LOAD:
+            half = len(block) // 2
+            self.blocks[block_index:block_index + 2] = [block[:half], block[half:]]
+            self.block_keys[block_index:block_index + 2] = [keys[:half], keys[half:]]
+            self.maxes[block_index:block_index + 2] = [keys[half - 1], keys[-1]]
+        else:
+            self.blocks[block_index:block_index + 2] = [block]
+            self.block_keys[block_index:block_index + 2] = [keys]
+            self.maxes[block_index:block_index + 2] = [keys[-1]]
+
+    def index(self, item: T) -> int:
+        """ Find the position of a given item in the list.
+            :complexity: O(log(N)), plus the number of items with the same key
+        """
+        key = self.key(item)
+        block_index = bisect_left(self.maxes, key)
+        while block_index < len(self.blocks):
+            keys = self.block_keys[block_index]
+            block = self.blocks[block_index]
+            position = bisect_left(keys, key)
+            while position < len(block) and keys[position] == key:
+                if block[position] == item:
+                    return self._rank(block_index, position)
+                position += 1
+            if position < len(block):
+                break
+            block_index += 1
+        raise ValueError('item not in list')
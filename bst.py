@@ -9,7 +9,7 @@ __author__ = 'Brendon Taylor, modified by Alexey Ignatiev, further modified by J
 __docformat__ = 'reStructuredText'
 
 from typing import TypeVar, Generic
-from linked_stack import LinkedStack
+from array_stack import ArrayStack
 from node import TreeNode
 import sys
 
@@ -28,7 +28,7 @@ class BSTInOrderIterator:
     def __init__(self, root: TreeNode[K, I]) -> None:
         """ Iterator initialiser. """
 
-        self.stack = LinkedStack()
+        self.stack = ArrayStack()
         self.current = root
 
     def __iter__(self) -> BSTInOrderIterator:
@@ -55,7 +55,18 @@ class BSTInOrderIterator:
 
 
 class BinarySearchTree(Generic[K, I]):
-    """ Basic binary search tree. """
+    """ Basic binary search tree.
+
+        Work counters are opt-in, see enable_stats. COUNTED_METHODS maps
+        each counted method to its counter; the recursive helpers are
+        counted once per node they compare a key with.
+    """
+
+    COUNTED_METHODS = {
+        'get_tree_node_by_key': 'searches',
+        'get_tree_node_by_key_aux': 'search_comparisons',
+        'insert_aux': 'insert_comparisons',
+    }
 
     def __init__(self) -> None:
         """
@@ -211,6 +222,66 @@ class BinarySearchTree(Generic[K, I]):
         return self.get_minimal(current.left)
 
 
+    def enable_stats(self) -> None:
+        """
+            Starts counting the work done by the tree, from zero.
+            Counting wrappers are set as instance attributes hiding the
+            counted methods, so a tree without stats enabled runs the plain
+            methods and pays nothing for the counters.
+            :complexity: O(1)
+        """
+        self.disable_stats()
+        self.counters = dict.fromkeys(self.COUNTED_METHODS.values(), 0)
+        for name, counter in self.COUNTED_METHODS.items():
+            setattr(self, name, self._counting(getattr(self, name), counter))
+
+    def disable_stats(self) -> None:
+        """
+            Stops counting, restoring the plain methods. The counters are kept.
+            :complexity: O(1)
+        """
+        for name in self.COUNTED_METHODS:
+            self.__dict__.pop(name, None)
+
+    def _counting(self, method, counter: str):
+        """ Wraps a method so every call on a node (or on the tree, for non-recursive methods) is counted. """
+        counters = self.counters
+
+        def counted(*args):
+            if not args or args[0] is not None:
+                counters[counter] += 1
+            return method(*args)
+        return counted
+
+    def tree_stats(self) -> dict:
+        """
+            Reports the shape of the tree, and the counters if stats were enabled:
+                - height: number of nodes on the longest path from the root
+                - nodes: number of nodes
+                - average_depth: mean depth of the nodes, the root having depth 0
+            :complexity: O(N)
+        """
+        height = 0
+        total_depth = 0
+        nodes = 0
+        stack = [(self.root, 0)] if self.root is not None else []
+        while stack:
+            current, depth = stack.pop()
+            nodes += 1
+            total_depth += depth
+            height = max(height, depth + 1)
+            for child in (current.left, current.right):
+                if child is not None:
+                    stack.append((child, depth + 1))
+
+        stats = {
+            'height': height,
+            'nodes': nodes,
+            'average_depth': total_depth / nodes if nodes else 0.0,
+        }
+        stats.update(getattr(self, 'counters', {}))
+        return stats
+
     def is_leaf(self, current: TreeNode) -> bool:
         """ Simple check whether or not the node is a leaf. """
 
@@ -1,6 +1,6 @@
 from __future__ import annotations
 # from player import Player
-from random_gen import RandomGen
+from random_gen import AliasTable, RandomGen
 from material import Material
 
 """
@@ -180,15 +180,19 @@ class Cave:
         
 
     @classmethod
-    def random_cave(self, material_list: list[Material]) -> Cave:
+    def random_cave(self, material_list: list[Material], material_table: AliasTable = None) -> Cave:
         """
             Initialises a random Cave Object
             @Param: material_list - A list of materials to choose from to add to the cave
+            @Param: material_table - if given, an AliasTable of the materials the material is drawn from by weight instead
             @Return: A Cave Object
         """
 
         input_name = RandomGen.random_choice(CAVE_NAMES)
-        input_materials = RandomGen.random_choice(material_list)
+        if material_table is None:
+            input_materials = RandomGen.random_choice(material_list)
+        else:
+            input_materials = material_table.draw()
         int_gen = RandomGen.randint(RANDOM_MIN, RANDOM_MAX)
         flt_gen = RandomGen.random_float()
         input_quantity = int_gen + flt_gen
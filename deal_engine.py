@@ -0,0 +1,100 @@
+"""
+Batched generation of the traders' deals.
+
+Trader.generate_deal draws RANDOM_DRAWS numbers from RandomGen and computes
+the deal from them. generate_all_deals draws the numbers of every trader in
+one batch, in the order the sequential loop
+
+    for trader in traders:
+        trader.generate_deal()
+
+would draw them, and hands each trader its slice. Each deal is computed
+from the same numbers as in the loop, so the deals are identical to the
+sequential ones and RandomGen ends in the same state. Only the drawing is
+batched: the deals themselves are still computed one trader at a time.
+
+generate_seeded_deals draws the numbers of every trader from its own
+substream of a master seed instead, picked by the day and the trader's id,
+so a deal only depends on (seed, day, trader id). The traders can then be
+dealt with in any order, or split across a process pool, with bit-identical
+results, and RandomGen itself is left untouched.
+"""
+from __future__ import annotations
+
+__docformat__ = 'reStructuredText'
+
+from concurrent.futures import ProcessPoolExecutor
+from random_gen import RandomGen
+from trader import Trader
+
+# number of substreams set aside for the traders of one day
+STREAMS_PER_DAY = 1 << 16
+
+
+def generate_all_deals(traders: list[Trader]) -> None:
+    """ Generates a deal for every trader, as calling generate_deal on each in turn would.
+    :param traders: the traders, in the order their deals would be generated
+    :complexity: O(R + T*D) where R is the number of random numbers drawn and
+        D the cost of computing one deal from its numbers
+    """
+    draws = RandomGen.random_batch(sum(trader.RANDOM_DRAWS for trader in traders))
+    offset = 0
+    for trader in traders:
+        trader.active_deal = trader.deal_from_draws(draws, offset)
+        offset += trader.RANDOM_DRAWS
+
+
+def deal_stream(day: int, trader_id: int) -> int:
+    """ Returns the substream of the master seed the deal of a trader on a day is drawn from.
+        :raises ValueError: if trader_id is not in range(STREAMS_PER_DAY), as its
+            substream would be the one of another trader on another day
+    """
+    if not 0 <= trader_id < STREAMS_PER_DAY:
+        raise ValueError("Trader id {0} is not in range({1})".format(trader_id, STREAMS_PER_DAY))
+    return day * STREAMS_PER_DAY + trader_id
+
+
+def _seeded_deals(seed: int, day: int, tasks: list[tuple[int, Trader]]) -> list[tuple[int, int, float]]:
+    """ Computes the deals of some traders from their substreams.
+        Returns for each trader its id, the position of the material of its deal
+        in its inventory and the price, so the deal can be rebuilt from the
+        original trader when the traders are copies in another process.
+    """
+    result = []
+    for trader_id, trader in tasks:
+        draws = RandomGen.substream_draws(seed, deal_stream(day, trader_id), trader.RANDOM_DRAWS)
+        material, price = trader.deal_from_draws(draws, 0)
+        result.append((trader_id, trader.material_list.index(material), price))
+    return result
+
+
+def generate_seeded_deals(traders: list[Trader], seed: int, day: int, processes: int | None = None,
+                          chunks: int | None = None) -> None:
+    """ Generates a deal for every trader from its own substream of seed, its id
+        being its position in traders.
+    :param traders: the traders
+    :param seed: the master seed
+    :param day: the day the deals are for
+    :param processes: if given, the deals are computed by a pool of this many processes
+    :param chunks: number of parts the traders are split into for the pool, by default processes
+    :complexity: O(T*(log(day*STREAMS_PER_DAY) + D)) where D is the cost of
+        computing one deal from its numbers
+    :raises ValueError: if there are more than STREAMS_PER_DAY traders
+    """
+    if len(traders) > STREAMS_PER_DAY:
+        raise ValueError("At most {0} traders can be dealt with per day".format(STREAMS_PER_DAY))
+    tasks = list(enumerate(traders))
+    if processes is None:
+        results = _seeded_deals(seed, day, tasks)
+    else:
+        chunks = processes if chunks is None else chunks
+        size = -(-len(tasks) // chunks) if chunks > 0 else len(tasks)
+        parts = [tasks[start:start + size] for start in range(0, len(tasks), max(size, 1))]
+        results = []
+        with ProcessPoolExecutor(processes) as pool:
+            for part in pool.map(_seeded_deals, [seed] * len(parts), [day] * len(parts), parts):
+                results.extend(part)
+
+    for trader_id, position, price in results:
+        trader = traders[trader_id]
+        trader.active_deal = (trader.material_list[position], price)
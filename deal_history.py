@@ -0,0 +1,154 @@
+"""
+    History of the traders' deals, kept in bounded memory.
+
+    Every trader keeps its last deals in a DealHistory, a ring buffer that
+    overwrites its oldest deal once it is full. For every material the game
+    keeps PriceStats, which maintain the mean, minimum and maximum of the
+    last prices offered for it, and an exponentially weighted moving average
+    of all of them, each updated in O(1) per deal. So the memory used does
+    not grow with the number of days simulated.
+"""
+
+from __future__ import annotations
+
+__docformat__ = 'reStructuredText'
+
+from typing import NamedTuple
+from array_queue import ArrayDeque, ArrayQueue
+from material import Material
+
+
+class Deal(NamedTuple):
+    """ A deal made by a trader on a given day. """
+    day: int
+    material: Material
+    price: float
+
+
+class DealHistory:
+    """ Ring buffer of the last deals of a trader, oldest first.
+
+    Attributes:
+        * deals (ArrayQueue[Deal]): the deals, in a bounded circular array
+    """
+
+    def __init__(self, capacity: int) -> None:
+        """ Object initializer.
+            :pre: capacity > 0
+        """
+        self.deals = ArrayQueue(capacity, bounded=True)
+
+    def __len__(self) -> int:
+        return len(self.deals)
+
+    def __iter__(self):
+        """ Yields the deals, oldest first. """
+        return iter(self.deals)
+
+    def __getitem__(self, index: int) -> Deal:
+        """ Returns a deal by age, 0 being the oldest and -1 the latest.
+            :complexity: O(1)
+            :raises IndexError: if there is no such deal
+        """
+        return self.deals[index]
+
+    def add(self, day: int, material: Material, price: float) -> None:
+        """ Adds a deal, forgetting the oldest one if the buffer is full.
+            :complexity: O(1)
+        """
+        if self.deals.is_full():
+            self.deals.serve()
+        self.deals.append(Deal(day, material, price))
+
+    def latest(self) -> Deal:
+        """ Returns the latest deal.
+            :complexity: O(1)
+            :raises IndexError: if there is no deal
+        """
+        return self.deals[-1]
+
+
+class PriceStats:
+    """ Rolling statistics of the prices offered for one material.
+
+        The mean, minimum and maximum are over the last window prices. The
+        window is kept in a bounded queue with the sum of its prices, and
+        the candidates for its minimum and maximum in two monotonic deques:
+        a price is dropped from a deque as soon as a later price is at
+        least as low (respectively high), since it can no longer be the
+        minimum (maximum) of any window. Every price enters and leaves each
+        deque once, so an update is O(1) amortised.
+
+    Attributes:
+        * window (ArrayQueue[float]): the last prices, oldest first
+        * total (float): sum of the prices in the window
+        * minima (ArrayDeque[float]): increasing candidates for the minimum
+        * maxima (ArrayDeque[float]): decreasing candidates for the maximum
+        * alpha (float): weight of the latest price in the EWMA
+        * ewma (float | None): the moving average, None before the first price
+        * count (int): number of prices ever added
+    """
+
+    WINDOW = 10
+    ALPHA = 0.3
+
+    def __init__(self, window: int = WINDOW, alpha: float = ALPHA) -> None:
+        """ Object initializer.
+            :pre: window > 0 and 0 < alpha <= 1
+        """
+        self.window = ArrayQueue(window, bounded=True)
+        self.total = 0.0
+        self.minima = ArrayDeque(window)
+        self.maxima = ArrayDeque(window)
+        self.alpha = alpha
+        self.ewma = None
+        self.count = 0
+
+    def add(self, price: float) -> None:
+        """ Adds the latest price offered for the material.
+            :complexity: O(1) amortised
+        """
+        if self.window.is_full():
+            oldest = self.window.serve()
+            self.total -= oldest
+            if self.minima.peek() == oldest:
+                self.minima.pop_left()
+            if self.maxima.peek() == oldest:
+                self.maxima.pop_left()
+        self.window.append(price)
+        self.total += price
+        while len(self.minima) > 0 and self.minima.peek_last() > price:
+            self.minima.pop()
+        self.minima.append(price)
+        while len(self.maxima) > 0 and self.maxima.peek_last() < price:
+            self.maxima.pop()
+        self.maxima.append(price)
+        self.ewma = price if self.ewma is None else self.alpha * price + (1 - self.alpha) * self.ewma
+        self.count += 1
+
+    def mean(self) -> float:
+        """ Mean of the prices in the window.
+            :complexity: O(1)
+            :raises ValueError: if no price was added
+        """
+        if len(self.window) == 0:
+            raise ValueError("No price was added")
+        return self.total / len(self.window)
+
+    def min(self) -> float:
+        """ Lowest price in the window.
+            :complexity: O(1)
+            :raises ValueError: if no price was added
+        """
+        if len(self.minima) == 0:
+            raise ValueError("No price was added")
+        return self.minima.peek()
+
+    def max(self) -> float:
+        """ Highest price in the window.
+            :complexity: O(1)
+            :raises ValueError: if no price was added
+        """
+        if len(self.maxima) == 0:
+            raise ValueError("No price was added")
+        return self.maxima.peek()
@@ -29,23 +29,23 @@ caves = [
 waldo = RandomTrader("Waldo Morgan")
 waldo.add_material(fishing_rod)
 waldo.generate_deal()
-waldo.sell = (fishing_rod, 7.44) # This is how my solution can hackily set the selling price - your solution does NOT need to support the same.
+waldo.active_deal = (fishing_rod, 7.44)
 orson = RandomTrader("Orson Hoover")
 orson.add_material(gold)
 orson.generate_deal()
-orson.sell = (gold, 7.70) # This is how my solution can hackily set the selling price - your solution does NOT need to support the same.
+orson.active_deal = (gold, 7.70)
 lea = RandomTrader("Lea Carpenter")
 lea.add_material(prismarine)
 lea.generate_deal()
-lea.sell = (prismarine, 7.63) # This is how my solution can hackily set the selling price - your solution does NOT need to support the same.
+lea.active_deal = (prismarine, 7.63)
 ruby = RandomTrader("Ruby Goodman")
 ruby.add_material(netherite)
 ruby.generate_deal()
-ruby.sell = (netherite, 9.78) # This is how my solution can hackily set the selling price - your solution does NOT need to support the same.
+ruby.active_deal = (netherite, 9.78)
 mable = RandomTrader("Mable Hodge")
 mable.add_material(gold)
 mable.generate_deal()
-mable.sell = (gold, 5.40) # This is how my solution can hackily set the selling price - your solution does NOT need to support the same.
+mable.active_deal = (gold, 5.40)
 
 traders = [
     waldo,
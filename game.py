@@ -1,17 +1,24 @@
 from __future__ import annotations
 # from ast import Mult
 # from tkinter import NONE
-from ArraySortedList import ArraySortedList_Game
+from array_sorted_list import ArraySortedList
+from array_queue import ArrayDeque
 from aset import ASet
+from hash_set import HashSet
 from hash_table import LinearProbeTable
+from market import Market
+from deal_engine import generate_all_deals, generate_seeded_deals
+from deal_history import PriceStats
+from referential_array import LazyArrayR
 
 from player import Player
 from trader import RandomTrader, RangeTrader, Trader
 from material import Material
 from cave import Cave
 from food import Food
-from random_gen import RandomGen
+from random_gen import AliasTable, RandomGen
 from abc import abstractmethod, ABC
+from operator import attrgetter
 from constants import EPSILON
 
 """
@@ -22,6 +29,28 @@ This includes two types of games, that is SoloGame and MultiplayerGame
 Modified by: Avinash Rvan (32717792)
 """
 
+class MiningOption:
+    """ A mining option of the multiplayer game. It is mutable, so that the
+    number of players who can still take it is decremented in place.
+
+    Attributes:
+        * cave (Cave): the cave to mine
+        * quantity (float): how much material a player mines from it
+        * earning (float): how much a player earns from it
+        * num_append (int): how many players can still take this option
+    """
+    __slots__ = ('cave', 'quantity', 'earning', 'num_append')
+
+    def __init__(self, cave: Cave, quantity: float, earning: float, num_append: int) -> None:
+        self.cave = cave
+        self.quantity = quantity
+        self.earning = earning
+        self.num_append = num_append
+
+    def __str__(self) -> str:
+        return '({0}, {1}, {2}, {3})'.format(self.cave.get_name(), self.quantity, self.earning, self.num_append)
+
+
 class Game(ABC):
     """
     This is the abstract class for both the types of games available, that is SoloGame, and MultiplayerGame.
@@ -31,6 +60,10 @@ class Game(ABC):
             material_list: a list of all the materials avaialable in the game
             cave_list: a list of all the caves that the player would be able to visit
             trader_list: a list of all the traders that exist in the game
+            day: the number of days simulated so far
+            price_stats: the rolling statistics of the prices offered for each material, by material name
+            material_weights: if given, the weight of each material when caves are generated, in the order of material_list
+            deal_seed: if given, the master seed each trader's deals are drawn from, by day and trader, instead of from RandomGen
     
     """
 
@@ -46,9 +79,13 @@ class Game(ABC):
     MIN_FOOD = 2
     MAX_FOOD = 5
 
-    def __init__(self) -> None:
+    def __init__(self, deal_seed: int | None = None) -> None:
         """ Constructor for the base class """
         self.setup = True
+        self.deal_seed = deal_seed
+        self.material_weights = None
+        self.day = 0
+        self.price_stats = {}
 
     def initialise_game(self) -> None:
         """Initialise all game objects: Materials, Caves, Traders."""
@@ -80,8 +117,39 @@ class Game(ABC):
         self.cave_list = caves
 
     def set_traders(self, traders: list[Trader]) -> None:
-        """ Sets the list of traders for the game """
+        """ Sets the list of traders for the game, and the market of their deals """
         self.trader_list = traders
+        self.market = Market.for_traders(traders)
+
+    def generate_deals(self) -> None:
+        """
+            Makes the traders' deals for the day. They are computed from one batch of random numbers,
+            as the traders would draw them in turn, or from each trader's substream of deal_seed if it is set.
+
+            complexity:
+                best/worst: O(T) -> where T is the number of traders
+        """
+        if self.deal_seed is None:
+            generate_all_deals(self.get_traders())
+        else:
+            generate_seeded_deals(self.get_traders(), self.deal_seed, self.day + 1)
+
+    def record_deals(self) -> None:
+        """
+            Starts a new day, adding the traders' active deals to their histories and to the price statistics of their materials.
+
+            complexity:
+                best/worst: O(T) -> where T is the number of traders
+        """
+        self.day += 1
+        for trader in self.get_traders():
+            if trader.active_deal is not None:
+                trader.record_deal(self.day)
+                material, price = trader.active_deal
+                name = material.get_name()
+                if name not in self.price_stats:
+                    self.price_stats[name] = PriceStats()
+                self.price_stats[name].add(price)
 
     def get_materials(self) -> list[Material]:
         """ Gets the list of materials for the game """
@@ -103,30 +171,18 @@ class Game(ABC):
         else:
             return True
 
-    def _get_trading_list(self) -> LinearProbeTable:
+    def _get_trading_list(self) -> Market:
         """ 
-        Will return a dictionary with the material:highest buying price
+        Will return the market of the traders, which maps each material to its highest buying price
+        through get_custom. The traders keep it up to date as their deals change, so nothing is rebuilt here.
 
-            returns a material:price dictionary
+            returns the Market of the game's traders
             complexity: 
-                best/worst: O(T) where T is the list of traders
+                best/worst: O(1)
         
         """
 
-        trading_list = LinearProbeTable(len(self.get_traders()))
-        for traders in self.get_traders():
-            material = traders.current_deal()[0]
-            buying_price = traders.current_deal()[1]
-
-            try:
-                # if there is already a trader for this material, then ignore the trader with lower buying price
-                if(buying_price > trading_list.get_custom(material)):
-                    trading_list.insert_custom(material, buying_price)
-            except:
-                # if not then there is no exisitng trader for this material yet
-                trading_list.insert_custom(material, buying_price)
-
-        return trading_list
+        return self.market
 
     def _get_cave_materials(self) -> LinearProbeTable:
         """ 
@@ -152,8 +208,9 @@ class Game(ABC):
         (You may have to call Material.random_material more than <amount> times.)
         """
         material_list = []
-        name_list = []
-        mining_rate_list = []
+        # names and mining rates already used, kept in hash sets so the uniqueness checks stay O(1)
+        name_list = HashSet()
+        mining_rate_list = HashSet()
 
         # check that the amount entered is valid
         if not (self._amount_check(amount)):
@@ -167,8 +224,8 @@ class Game(ABC):
             if (newMaterial.name not in name_list) and (newMaterial.mining_rate not in mining_rate_list) :
 
                 # if it is unique, then add it to the final material list, and add its data into the other lists for checking later
-                name_list.append(newMaterial.name)             
-                mining_rate_list.append(newMaterial.mining_rate)   
+                name_list.add(newMaterial.name)             
+                mining_rate_list.add(newMaterial.mining_rate)   
                 material_list.append(newMaterial)
 
         # set the materials using the setter method
@@ -181,21 +238,26 @@ class Game(ABC):
         (You may have to call Cave.random_cave more than <amount> times.)
         """
         cave_list = []
-        name_list = []
+        name_list = HashSet()
 
         # check that the amount entered is valid
         if not (self._amount_check(amount)):
             raise ValueError("The amount must be an integer more than 0")
         
+        # the materials are drawn by weight from a table built once, if weights are set
+        material_table = None
+        if self.material_weights is not None:
+            material_table = AliasTable(self.get_materials(), self.material_weights)
+
         # iterate until the cave_list has enough unique caves
         while len(cave_list) < amount:
-            newCave = Cave.random_cave(self.get_materials())
+            newCave = Cave.random_cave(self.get_materials(), material_table)
 
             # check if the new random cave has unique name and mining rate
             if (newCave.name not in name_list) :
 
                 # if it is unique, then add it to the final cave list, and add its name into the name list for checking later
-                name_list.append(newCave.name)             
+                name_list.add(newCave.name)             
                 cave_list.append(newCave)
 
         # set the caves using the setter method
@@ -210,11 +272,16 @@ class Game(ABC):
         (You may have to call <TraderClass>.random_trader() more than <amount> times.)
         """
         trader_list = []
-        name_list = []
+        name_list = HashSet()
 
         # check that the amount entered is valid
         if not (self._amount_check(amount)):
             raise ValueError("The amount must be an integer more than 0")
+
+        # copy the materials into an array once, so each trader's subset can be a view over it instead of a new list
+        material_list = self.get_materials()
+        material_array = LazyArrayR(len(material_list))
+        material_array.copy_from(material_list, 0, 0, len(material_list))
         
         # iterate until the trader_list has enough unique traders
         while len(trader_list) < amount:
@@ -225,15 +292,14 @@ class Game(ABC):
             if (newtrader.name not in name_list) :
 
                 # create a random subset of the existing materials and set the trader's materials
-                material_list = self.get_materials()
                 lowBound = RandomGen.randint(0, len(material_list)//2)
                 upperBound = RandomGen.randint(lowBound+1, len(material_list))
-                material_subset = material_list[lowBound:upperBound]
+                material_subset = material_array.view(lowBound, upperBound)
 
                 newtrader.set_all_materials(material_subset)
 
                 # if it is unique, then add it to the final trader list, and add its name into the name list for checking later
-                name_list.append(newtrader.name)             
+                name_list.add(newtrader.name)             
                 trader_list.append(newtrader)
 
         # set the traders using the setter method
@@ -298,8 +364,8 @@ class SoloGame(Game):
         # 1. Traders make deals
         trader_list = self.get_traders()
 
-        for traders in trader_list:
-            traders.generate_deal()
+        self.generate_deals()
+        self.record_deals()
 
         # save this new updated trader list
         self.set_traders(trader_list)
@@ -332,8 +398,10 @@ class SoloGame(Game):
                     @caves -> a list of tuples where each tuple contains the Cave visited and the quantity of material mined
 
                 complexity:
-                    best: O(1) -> this is case when there are no trader or caves, thus there is nothing to check
-                    worst: O(T + C) -> where T is the size of list of traders and C is the size of list of caves
+                    best: O(1) -> this is case when there are no caves, thus there is nothing to check
+                    worst: O(C + M) -> where C is the size of list of caves and M the number of materials bought,
+                                       as the market's price table is rebuilt in O(M) if a deal changed since it was last read,
+                                       and each price is then read from it in O(1)
         """
 
 
@@ -355,8 +423,8 @@ class SoloGame(Game):
 
             # 2. Check that all the caves have at least the amount required, and there is a trader who wants to buy the material
 
-        # create a dictionary of the traders and the buying price 
-        """ This will be O(T) complexity """
+        # get the market of the traders, which keeps the best buying price of every material
+        """ This will be O(1) complexity, the price table is cached by the market until a deal changes """
         trading_list=self._get_trading_list()
         
         # go through all the caves and check that there are enough materials 
@@ -377,8 +445,8 @@ class SoloGame(Game):
 
                 # next check if there is a trader willing to trade this material
                 try: 
-                    trading_list.get_custom(material) # this will check the Hash Table for this material key, and if it is not present, it will raise an error
-                                                      # this method of checking has O(1) complexity instead of using material in trading_list.keys() which would be O(T) complexity
+                    trading_list.get_custom(material) # this will look the material up in the market's price table, and if it is not present, it will raise an error
+                                                      # this check is O(1) amortised, instead of scanning the deals of all the traders which would be O(T) complexity
                     trader_check=True
                 except:
                     trader_check =False
@@ -433,16 +501,18 @@ class MultiplayerGame(Game):
             cave_list: a list of all the caves that the player would be able to visit
             trader_list: a list of all the traders that exist in the game
             players: the list of all the players who are in the game
+            fair_rotation: if True, the players are kept in an ArrayDeque and the player who went first in a day goes last the next day
     
     """
 
     MIN_PLAYERS = 2
     MAX_PLAYERS = 5
 
-    def __init__(self) -> None:
+    def __init__(self, fair_rotation: bool = False, deal_seed: int | None = None) -> None:
         """ Initalises an empty list for the list of players in the game """
-        super().__init__()
-        self.players = []
+        super().__init__(deal_seed)
+        self.fair_rotation = fair_rotation
+        self.players = ArrayDeque() if fair_rotation else []
 
     def initialise_game(self) -> None:
         """
@@ -462,7 +532,7 @@ class MultiplayerGame(Game):
     def generate_random_players(self, amount) -> None:
         """Generate <amount> random players. Don't need anything unique, but you can do so if you'd like."""
         player_list = []
-        name_list = []
+        name_list = HashSet()
 
         # check that the amount entered is valid
         if not (self._amount_check(amount)):
@@ -475,14 +545,14 @@ class MultiplayerGame(Game):
             # check if the name already exists, and if not then add the player in 
             if new_player_name not in name_list:
                 player_list.append(new_player)
-                name_list.append(new_player_name)
+                name_list.add(new_player_name)
 
         # once the length needed is reached, set the player list
         self.set_players(player_list)
     
     def set_players(self, players: list[Player]):
         """ Sets the list of players for the game """
-        self.players = players
+        self.players = ArrayDeque.from_iterable(players) if self.fair_rotation else players
 
     def get_players(self):
         """     returns the list of players for the game    """
@@ -515,10 +585,8 @@ class MultiplayerGame(Game):
         """
 
         # 1. Traders make deals
-        trader_list = self.get_traders()
-
-        for traders in trader_list:
-            traders.generate_deal()
+        self.generate_deals()
+        self.record_deals()
 
         print("Traders Deals:\n\t", end="")
         print("\n\t".join(map(str, self.get_traders())))
@@ -529,8 +597,11 @@ class MultiplayerGame(Game):
         foods, balances, caves = self.select_for_players(offered_food)
         # 4. Quantites for caves is updated, some more stuff is added.
         self.verify_output_and_update_quantities(foods, balances, caves)        
+        # 5. The first player goes last the next day, in O(1)
+        if self.fair_rotation:
+            self.players.rotate()
     
-    def _get_best_mining_choice(self, food: Food) -> list[tuple[Cave, float, float, int]]:
+    def _get_best_mining_choice(self, food: Food) -> ArraySortedList[MiningOption]:
         """
             Helper function will iterate through the list of caves and keep creating tuple options of which cave, how much is 
             mined, and how much is earned. This data is added to a sorted list to be used later.
@@ -550,7 +621,7 @@ class MultiplayerGame(Game):
 
             Finally, the balance material leftover in the cave after the multiple players mine the same amount is also added as an option to the sorted list.
 
-            In the end, the sorted list will contain tuples sorted by their earning potential. Each tuple will contain the following information, in that order:
+            In the end, the sorted list will contain MiningOptions sorted by their earning potential. Each MiningOption will contain the following information, in that order:
             (The cave being mined, How much is the maximum material that can be mined per player, How much is earned from this cave, How many players can mine this cave with this quantity)
             
                 pre:
@@ -560,7 +631,7 @@ class MultiplayerGame(Game):
                     food -> the food bought by the player
                 
                 return:
-                    list[tuple[Cave, float, float, int]] -> the cave that is mined, the quantity of material mined, the earning from this mining, and the number of players that can mine this cave for this quantity
+                    ArraySortedList[MiningOption] -> the cave that is mined, the quantity of material mined, the earning from this mining, and the number of players that can mine this cave for this quantity
 
                 complexity:
                     best: O(1) -> this is when there are no traders and caves, thus the code will not have any iterations
@@ -571,10 +642,11 @@ class MultiplayerGame(Game):
         # get the hunger bar for the food
         hunger_bars = food.get_hunger_bars()
 
-        # create a sorted list to store all the options
-        options_list = ArraySortedList_Game(len(self.get_caves()))
+        # create a sorted list to store all the options, the best first, so that
+        # of options with equal earnings the first added (earliest listed cave) is taken first
+        options_list = ArraySortedList(len(self.get_caves()), key=attrgetter('earning'), reverse=True)
 
-        """ This will have O(T) complexity """
+        """ This will have O(1) complexity, as the market is kept up to date by the traders """
         trading_list = self._get_trading_list()
 
         # add options to the list while there are not enough options
@@ -585,7 +657,7 @@ class MultiplayerGame(Game):
             
             # check if the material is tradeable
             try:
-                """ This check is O(1) complexity since the getter for HashTables is assumed to be O(1) complexity """
+                """ This check is O(1) amortised complexity since the market's price table is a dictionary cached until a deal changes """
                 price = trading_list.get_custom(material)
                 mining_rate = material.get_mining_rate()
 
@@ -604,7 +676,7 @@ class MultiplayerGame(Game):
                     """ 
                         This function has O(log(C)) worst case beacause the add function uses binary search which will half the search elements each iteration
                     """
-                    options_list.add((cave, quantity_in_cave, earning, 1))
+                    options_list.add(MiningOption(cave, quantity_in_cave, earning, 1))
 
                 elif num_append>0:
                     # this means that the player can mine less than what is in the cave
@@ -613,7 +685,7 @@ class MultiplayerGame(Game):
                     """ 
                         This function has O(log(C)) worst case beacause the add function uses binary search which will half the search elements each iteration
                     """
-                    options_list.add((cave, quantity_mineable_player, earning, num_append))
+                    options_list.add(MiningOption(cave, quantity_mineable_player, earning, num_append))
 
                     if num_append<len(self.get_players()):
                         # this means that for this cave, there are less mining options than there are players, 
@@ -624,10 +696,10 @@ class MultiplayerGame(Game):
                         """ 
                         This function has O(log(C)) worst case beacause the add function uses binary search which will half the search elements each iteration
                         """
-                        options_list.add((cave, balance_in_cave, earning, 1))
+                        options_list.add(MiningOption(cave, balance_in_cave, earning, 1))
                     
             except:
-                # this means that the material is not tradeable as the key is not in the HashTable
+                # this means that the material is not tradeable as it is not in the market's price table
                 pass
 
 
@@ -641,7 +713,7 @@ class MultiplayerGame(Game):
 
             - Firstly, the empty variables are instantiated
             - Next, the helper function, _get_best_mining_choice is called. @see _get_best_mining_choice function for the full details on how it works. This function will return
-              a sorted list of the best "options" for players to mine. Each option is in the form of tuple containing the following information:
+              a sorted list of the best "options" for players to mine. Each option is a MiningOption containing the following information:
               (Cave to mine, quantity to mine, earnings from mining this cave, how many players can mine this cave for this quantity)
             - This method of creating all the options is done first to ensure that it will not be placed within another for loop, which would increase the complexity exponentially. For example, the
               approach we first used is by placing a nested for loop within the player loop to iterate through all the caves and find the best material to mine. However, this would make the complexity
@@ -649,9 +721,10 @@ class MultiplayerGame(Game):
             - Then, the code will iterate through all the players in the game currently
             - For each player, the next best option for mining is obatained from the sorted list that was created previously. Then, the outcome of this mining is checked to see if it is worth mining.
               This is checked by seeing if the money earned from mining the material is more than the cost of the food (with an error margin of EPSILON since floating point numbers are used). 
-            - If the mining is worth it, then this mining option is removed from the sorted list using the delete_at_index function** and the other information are added to the lists as required
-              **the delete_at_index function is modified in this scenario. the function will first decrement the num_append element in the tuple as this variable is the indication of how many players
-                can still choose this option. then, if the variable is 0 or less, that means no other player can select this option anymore and it will be removed from the list
+            - If the mining is worth it, then this mining option is taken from the sorted list** and the other information are added to the lists as required
+              **the num_append of the option is first decremented in place as this variable is the indication of how many players
+                can still choose this option. then, if the variable is 0 or less, that means no other player can select this option anymore and it is removed
+                from the front of the list, which is the end of its array
             - If the mining is not worth it, then None are appended to the lists as required
 
             - Essentially, this design was chosen to ensure that any for loops that need to be written are separated as much as possible. Without separating them, the complexity would increase
@@ -694,7 +767,8 @@ class MultiplayerGame(Game):
             if (food_price < current_balance - EPSILON):
                 # if the player has hunger bars, check which cave is the most worth to go to
                 if len(options_list)>0:
-                    cave, quantity, earning, _ = options_list[len(options_list)-1]
+                    best = options_list[0]
+                    cave, quantity, earning = best.cave, best.quantity, best.earning
                 else:
                     # this means there are no options left (the caves have no more material)
                     earning=0
@@ -714,9 +788,11 @@ class MultiplayerGame(Game):
                     tuple = (cave, quantity)
                     cave_list.append(tuple)
 
-                    # remove this option from the list
-                    """ This is O(1) since always deleting the last index only """
-                    options_list.delete_at_index(len(options_list)-1)
+                    # take this option, removing it from the list once no other player can take it
+                    """ This is O(1) since the best option is always at the end of the array of the list """
+                    best.num_append -= 1
+                    if best.num_append <= 0:
+                        options_list.delete_at_index(0)
 
                 else:
                     # this means that it was not worth to buy the food
@@ -871,11 +947,12 @@ class MultiplayerGame(Game):
         string = "["
         for i in range(len(options_list)):
             string += "("
-            item = options_list[i]
-            cave = item[0]
-            quantity = item[1]
-            earning = item[2]
-            num = item[3]
+            # the list holds the best option first, so it is read from the end to print it in increasing order
+            item = options_list[len(options_list) - 1 - i]
+            cave = item.cave
+            quantity = item.quantity
+            earning = item.earning
+            num = item.num_append
             string+=cave.get_name()
             string+=", "
             string+=str(quantity)
@@ -946,7 +1023,8 @@ class MultiplayerGame(Game):
 
                 complexity:
                     best: O(1) -> where there are no food, caves or players to check 
-                    O(T + P + C) -> where T is the size of list of traders and C is the size of list of caves, when there are non-zero number of food, players and caves to check
+                    O(M + P + C) -> where M is the number of materials bought, P the number of players and C is the size of list of caves, when there are non-zero number of food, players and caves to check
+                                    (the market's price table is rebuilt in O(M) if a deal changed since it was last read)
         """
             # 1. Check for basic logic checks 
 
@@ -974,8 +1052,8 @@ class MultiplayerGame(Game):
 
             # 2. Check that all the caves have at least the amount required, and there is a trader who wants to buy the material
 
-        # create a dictionary of the traders and the buying price 
-        """ O(T) complexity to get the list of all traders """
+        # get the market of the traders, which keeps the best buying price of every material
+        """ O(1) complexity, the price table is cached by the market until a deal changes """
         trading_list=self._get_trading_list()
 
         """ O(C) complexity to get the list of all caves """
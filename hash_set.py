@@ -0,0 +1,179 @@
+"""
+    Hash-based implementation of Set ADT.
+"""
+
+from __future__ import annotations
+from set import *
+from referential_array import ArrayR
+
+__docformat__ = 'reStructuredText'
+
+
+class HashSet(Set[T]):
+    """Open addressing (linear probing) implementation of the set ADT.
+
+    Attributes:
+        * size (int): number of elements in the set
+        * capacity (int): number of elements the set was sized for initially
+        * table (ArrayR[T]): the hash table, whose length is a power of two
+
+    Unlike ASet the set never becomes full: the table doubles whenever it
+    would become more than half full. Elements are found by their Python
+    hash(), so membership, add and remove take O(1) on average, and union,
+    intersection and difference take O(n + m). None cannot be an element,
+    since it marks the empty slots of the table.
+    """
+
+    MIN_TABLESIZE = 8
+
+    def __init__(self, capacity: int = 1) -> None:
+        """ Initialization. """
+        self.capacity = capacity
+        Set.__init__(self)
+
+    @staticmethod
+    def _tablesize_for(count: int) -> int:
+        """ Smallest power of two keeping count elements at most half full. """
+        tablesize = HashSet.MIN_TABLESIZE
+        while tablesize < 2 * count:
+            tablesize *= 2
+        return tablesize
+
+    def __len__(self) -> int:
+        """ Returns the number of elements in the set. """
+        return self.size
+
+    def is_empty(self) -> bool:
+        """ True if the set is empty. """
+        return len(self) == 0
+
+    def clear(self) -> None:
+        """ Makes the set empty. """
+        self.size = 0
+        self.table = ArrayR(self._tablesize_for(self.capacity))
+
+    def _probe(self, item: T) -> int:
+        """ Position of item in the table, or of the empty slot where it
+        would go if it is not in the set.
+        :complexity: O(1) on average
+        """
+        mask = len(self.table) - 1
+        position = hash(item) & mask
+        while True:
+            current = self.table[position]
+            if current is None or current == item:
+                return position
+            position = (position + 1) & mask
+
+    def __contains__(self, item: T) -> bool:
+        """ True if the set contains the item. """
+        return item is not None and self.table[self._probe(item)] is not None
+
+    def __iter__(self):
+        """ Yields the elements of the set, in table order. """
+        for i in range(len(self.table)):
+            item = self.table[i]
+            if item is not None:
+                yield item
+
+    def _grow(self) -> None:
+        """ Doubles the table and reinserts every element.
+        :complexity: O(N) where N is the table size
+        """
+        old_table = self.table
+        self.table = ArrayR(2 * len(old_table))
+        for i in range(len(old_table)):
+            item = old_table[i]
+            if item is not None:
+                self.table[self._probe(item)] = item
+
+    def add(self, item: T) -> None:
+        """ Adds an element to the set. Note that an element already
+        present in the set should not be added.
+        :raises ValueError: if the item is None
+        """
+        if item is None:
+            raise ValueError("None cannot be added to the set")
+        position = self._probe(item)
+        if self.table[position] is None:
+            if 2 * (self.size + 1) > len(self.table):
+                self._grow()
+                position = self._probe(item)
+            self.table[position] = item
+            self.size += 1
+
+    def remove(self, item: T) -> None:
+        """ Removes an element from the set.
+        Later elements of the probe chain are shifted back into the gap,
+        so no deletion markers are left in the table.
+        :pre: the element should be present in the set
+        :raises KeyError: if no such element is found.
+        """
+        if item is None:
+            raise KeyError(item)
+        gap = self._probe(item)
+        if self.table[gap] is None:
+            raise KeyError(item)
+
+        mask = len(self.table) - 1
+        position = gap
+        while True:
+            position = (position + 1) & mask
+            current = self.table[position]
+            if current is None:
+                break
+            home = hash(current) & mask
+            # the element may only move back if its home slot is not
+            # cyclically within (gap, position]
+            if gap <= position:
+                stays = gap < home <= position
+            else:
+                stays = gap < home or home <= position
+            if not stays:
+                self.table[gap] = current
+                gap = position
+        self.table[gap] = None
+        self.size -= 1
+
+    def union(self, other: Set[T]) -> HashSet[T]:
+        """ Creates a new set equal to the union with another one,
+        i.e. the result set should contains the elements of self and other.
+        :complexity: O(n + m) on average
+        """
+        res = HashSet(len(self) + len(other))
+        for the_set in [self, other]:
+            for item in the_set:
+                res.add(item)
+        return res
+
+    def intersection(self, other: Set[T]) -> HashSet[T]:
+        """ Creates a new set equal to the intersection with another one,
+        i.e. the result set should contain the elements that are both in
+        self *and* other.
+        :complexity: O(min(n, m)) on average, as the smaller set is scanned
+        """
+        smaller, larger = (self, other) if len(self) <= len(other) else (other, self)
+        res = HashSet(len(smaller))
+        for item in smaller:
+            if item in larger:
+                res.add(item)
+        return res
+
+    def difference(self, other: Set[T]) -> HashSet[T]:
+        """ Creates a new set equal to the difference with another one,
+        i.e. the result set should contain the elements of self that
+        *are not* in other.
+        :complexity: O(n) on average
+        """
+        res = HashSet(len(self))
+        for item in self:
+            if item not in other:
+                res.add(item)
+        return res
+
+    def __str__(self):
+        """ Magic method constructing a string representation of the set object. """
+        elems = []
+        for item in self:
+            elems.append(str(item) if type(item) != str else "'{0}'".format(item))
+        return '{' + ', '.join(elems) + '}'
@@ -9,7 +9,7 @@ __docformat__ = 'reStructuredText'
 __modified__ = '26/10/2022'
 
 
-from referential_array import ArrayR
+from referential_array import ArrayR, LazyArrayR, ArrayRView
 from primes import LargestPrimeIterator
 from typing import TypeVar, Generic
 T = TypeVar('T')
@@ -151,25 +151,32 @@ class LinearProbeTable(Generic[T]):
 
         raise KeyError(key)
 
-    def keys(self) -> list[str]:
+    def keys(self) -> ArrayRView[str]:
         """
-            Returns all keys in the hash table.
+            Returns all keys in the hash table, as a view over an array sized to the count.
         """
-        res = []
-        for x in range(len(self.table)):
-            if self.table[x] is not None:
-                res.append(self.table[x][0])
-        return res
+        return self._gather(0)
+
+    def values(self) -> ArrayRView[T]:
+        """
+            Returns all values in the hash table, as a view over an array sized to the count.
+        """
+        return self._gather(1)
 
-    def values(self) -> list[T]:
+    def _gather(self, field: int) -> ArrayRView:
         """
-            Returns all values in the hash table.
+            Collects one field (0 for the key, 1 for the value) of every entry into an array
+            allocated once for all the entries, and returns a view over it
+            :complexity: O(N) where N is the tablesize
         """
-        res = []
+        res = LazyArrayR(max(1, self.count))
+        index = 0
         for x in range(len(self.table)):
-            if self.table[x] is not None:
-                res.append(self.table[x][1])
-        return res
+            entry = self.table[x]
+            if entry is not None:
+                res[index] = entry[field]
+                index += 1
+        return res.view(0, index)
 
     def __contains__(self, key: str) -> bool:
         """
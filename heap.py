@@ -5,7 +5,7 @@ __author__ = "Brendon Taylor, modified by Jackson Goerner"
 __docformat__ = 'reStructuredText'
 
 from typing import Generic
-from referential_array import ArrayR, T
+from referential_array import LazyArrayR, T
 
 
 class MaxHeap(Generic[T]):
@@ -13,7 +13,7 @@ class MaxHeap(Generic[T]):
 
     def __init__(self, max_size: int) -> None:
         self.length = 0
-        self.the_array = ArrayR(max(self.MIN_CAPACITY, max_size) + 1)
+        self.the_array = LazyArrayR(max(self.MIN_CAPACITY, max_size) + 1)
 
     def __len__(self) -> int:
         return self.length
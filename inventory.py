@@ -0,0 +1,106 @@
+""" Inventory of distinct items, with O(1) membership, removal and random choice. """
+
+from __future__ import annotations
+
+__docformat__ = 'reStructuredText'
+
+from typing import Generic, Iterable, TypeVar
+T = TypeVar('T')
+
+
+class Inventory(Generic[T]):
+    """ Set of distinct items kept in a dense array.
+
+        The items occupy the first len(items) slots of the array, and a map
+        gives the position of every item. Removing an item moves the last
+        one into its slot (swap-remove), so nothing is shifted and the array
+        never has gaps: an item is found, removed or picked at random from
+        its position in O(1). The order of the items is the order they were
+        added in, until an item is removed and the last one takes its place,
+        so the same sequence of operations always gives the same order.
+
+        Items are keyed by their hash, which for materials is their identity.
+
+        Attributes:
+            items (list[T]): the items, densely packed
+            positions (dict[T, int]): position of every item in items
+    """
+
+    def __init__(self, items: Iterable[T] = ()) -> None:
+        """ Object initializer. """
+        self.items = []
+        self.positions = {}
+        self.extend(items)
+
+    def __len__(self) -> int:
+        """ Returns the number of items.
+            :complexity: O(1)
+        """
+        return len(self.items)
+
+    def __getitem__(self, index: int) -> T:
+        """ Returns the item at a given position, e.g. the one picked by a random number.
+            :complexity: O(1)
+            :raises IndexError: if there is no such position
+        """
+        return self.items[index]
+
+    def __iter__(self):
+        """ Yields the items in their current order.
+            :complexity: O(1) per item
+        """
+        return iter(self.items)
+
+    def __contains__(self, item: T) -> bool:
+        """ Returns whether the inventory holds an item.
+            :complexity: O(1)
+        """
+        return item in self.positions
+
+    def __str__(self) -> str:
+        """ Magic method constructing a string representation of the inventory. """
+        return '[' + ', '.join(str(item) for item in self.items) + ']'
+
+    def index(self, item: T) -> int:
+        """ Returns the position of an item.
+            :complexity: O(1)
+            :raises ValueError: if the item is not in the inventory
+        """
+        try:
+            return self.positions[item]
+        except KeyError:
+            raise ValueError("item not in inventory")
+
+    def append(self, item: T) -> None:
+        """ Adds an item after the others. Adding an item already held does nothing.
+            :complexity: O(1) amortised
+        """
+        if item not in self.positions:
+            self.positions[item] = len(self.items)
+            self.items.append(item)
+
+    def extend(self, items: Iterable[T]) -> None:
+        """ Adds the items in order, as append would.
+            :complexity: O(N) where N is the number of items added
+        """
+        for item in items:
+            self.append(item)
+
+    def remove(self, item: T) -> None:
+        """ Removes an item, moving the last item into its position.
+            :complexity: O(1)
+            :raises ValueError: if the item is not in the inventory
+        """
+        position = self.index(item)
+        del self.positions[item]
+        last = self.items.pop()
+        if position < len(self.items):
+            self.items[position] = last
+            self.positions[last] = position
+
+    def clear(self) -> None:
+        """ Removes all the items.
+            :complexity: O(1)
+        """
+        self.items = []
+        self.positions = {}
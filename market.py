@@ -0,0 +1,259 @@
+"""
+    Market of the traders' active deals.
+
+    Traders notify every market they are attached to whenever their active deal
+    changes, from generate_deal or stop_deal. A trader can belong to several
+    markets, e.g. when the games of two players share some traders, and its
+    set of markets only holds weak references, so that the market of a game
+    goes away with the game. For every material the market keeps a max heap
+    of the prices offered for it, so the best price of a
+    material is read in O(1) and a change of deal costs O(log T), instead of
+    scanning all the traders to rebuild a table of best prices.
+
+    Every change of deal bumps the version of the market. The table of the
+    best price of every material is built from the heaps when it is first
+    needed for a version, and reused until the next change, so the games and
+    players looking prices up during a day share one table.
+
+    The market also indexes the traders by the materials in their inventories,
+    which they report as they change, so the traders stocking or buying a
+    material are listed without scanning the others. The index is keyed by
+    the materials themselves, as the inventories are, while the prices are
+    keyed by material name, as the games look them up.
+"""
+
+from __future__ import annotations
+
+__docformat__ = 'reStructuredText'
+
+from typing import TYPE_CHECKING
+from inventory import Inventory
+from material import Material
+
+if TYPE_CHECKING:
+    from trader import Trader
+
+
+class PriceHeap:
+    """ Max heap of the prices offered for one material, indexed by trader
+        so that the offer of any trader can be removed in O(log T).
+
+    Attributes:
+        * prices (list[float]): the prices, as an implicit binary heap rooted at 0
+        * traders (list[Trader]): traders[k] is the trader offering prices[k]
+        * positions (dict[Trader, int]): position of every trader in the heap
+    """
+
+    def __init__(self) -> None:
+        self.prices = []
+        self.traders = []
+        self.positions = {}
+
+    def __len__(self) -> int:
+        return len(self.prices)
+
+    def max_price(self) -> float:
+        """ Returns the highest price.
+            :complexity: O(1)
+            :pre: the heap is not empty
+        """
+        return self.prices[0]
+
+    def _move(self, trader: Trader, price: float, k: int) -> None:
+        """ Puts an offer at position k of the heap. """
+        self.prices[k] = price
+        self.traders[k] = trader
+        self.positions[trader] = k
+
+    def _rise(self, k: int) -> None:
+        """ Rises the offer at position k to its correct position. """
+        price, trader = self.prices[k], self.traders[k]
+        while k > 0 and self.prices[(k - 1) // 2] < price:
+            parent = (k - 1) // 2
+            self._move(self.traders[parent], self.prices[parent], k)
+            k = parent
+        self._move(trader, price, k)
+
+    def _sink(self, k: int) -> None:
+        """ Sinks the offer at position k to its correct position. """
+        price, trader = self.prices[k], self.traders[k]
+        while 2 * k + 1 < len(self.prices):
+            child = 2 * k + 1
+            if child + 1 < len(self.prices) and self.prices[child + 1] > self.prices[child]:
+                child += 1
+            if not price < self.prices[child]:
+                break
+            self._move(self.traders[child], self.prices[child], k)
+            k = child
+        self._move(trader, price, k)
+
+    def push(self, trader: Trader, price: float) -> None:
+        """ Adds the offer of a trader.
+            :complexity: O(log T)
+            :pre: the trader has no offer in the heap
+        """
+        self.prices.append(price)
+        self.traders.append(trader)
+        self._rise(len(self.prices) - 1)
+
+    def remove(self, trader: Trader) -> None:
+        """ Removes the offer of a trader.
+            :complexity: O(log T)
+            :raises KeyError: if the trader has no offer in the heap
+        """
+        k = self.positions.pop(trader)
+        last_price, last_trader = self.prices.pop(), self.traders.pop()
+        if k < len(self.prices):
+            self._move(last_trader, last_price, k)
+            self._rise(k)
+            self._sink(self.positions[last_trader])
+
+
+class Market:
+    """ Best buying price of every material over the active deals of a set of traders.
+
+    Attributes:
+        * heaps (dict[str, PriceHeap]): the offers for each material, by material name
+        * offers (dict[Trader, str]): name of the material each trader currently buys
+        * trader_count (int): number of traders attached to the market
+        * stock (dict[Material, Inventory[Trader]]): the traders having each material
+          in their inventory, keyed by the material itself as in the traders' inventories
+        * version (int): bumped whenever the deal of a trader of the market changes
+    """
+
+    def __init__(self) -> None:
+        self.heaps = {}
+        self.offers = {}
+        self.trader_count = 0
+        self.stock = {}
+        self.version = 0
+        self._table = {}
+        self._table_version = 0
+
+    @classmethod
+    def for_traders(cls, traders: list[Trader]) -> Market:
+        """ Returns the market of exactly these traders: one they are already all
+            attached to if there is one, otherwise a new market they are attached to.
+            The traders stay attached to their other markets, and a market is
+            dropped from their sets once nothing else refers to it.
+            :complexity: O(T*K) where K is the number of markets of the first trader,
+                plus O(T*log(T)) if a new market is created
+        """
+        if len(traders) > 0:
+            for market in traders[0].markets:
+                if market.trader_count == len(traders) and \
+                        all(market in trader.markets for trader in traders):
+                    return market
+        market = cls()
+        for trader in traders:
+            market.attach(trader)
+        return market
+
+    def attach(self, trader: Trader) -> None:
+        """ Attaches a trader, which then notifies this market of its deals and
+            inventory, as well as the other markets it is attached to.
+            :complexity: O(log T + M) where M is the number of materials of the trader
+        """
+        if self in trader.markets:
+            return
+        trader.markets.add(self)
+        self.trader_count += 1
+        self.update(trader)
+        for material in trader.material_list:
+            self.add_stock(trader, material)
+
+    def detach(self, trader: Trader) -> None:
+        """ Detaches a trader, removing its deal and inventory from the market.
+            :complexity: O(log T + M) where M is the number of materials of the trader
+        """
+        self._withdraw(trader)
+        self.version += 1
+        for material in trader.material_list:
+            self.remove_stock(trader, material)
+        trader.markets.discard(self)
+        self.trader_count -= 1
+
+    def add_stock(self, trader: Trader, material: Material) -> None:
+        """ Called by a trader which has added a material to its inventory.
+            :complexity: O(1)
+        """
+        if material not in self.stock:
+            self.stock[material] = Inventory()
+        self.stock[material].append(trader)
+
+    def remove_stock(self, trader: Trader, material: Material) -> None:
+        """ Called by a trader which has removed a material from its inventory.
+            :complexity: O(1)
+        """
+        traders = self.stock.get(material)
+        if traders is not None and trader in traders:
+            traders.remove(trader)
+            if len(traders) == 0:
+                del self.stock[material]
+
+    def traders_stocking(self, material: Material) -> list[Trader]:
+        """ Returns the traders having a material in their inventory.
+            :complexity: O(1 + K) where K is the number of traders returned
+        """
+        traders = self.stock.get(material)
+        return list(traders) if traders is not None else []
+
+    def traders_buying(self, material: Material) -> list[Trader]:
+        """ Returns the traders whose active deal is for a material of the same name,
+            the best offer first, ties in heap order.
+            :complexity: O(1 + K*log(K)) where K is the number of traders returned
+        """
+        heap = self.heaps.get(material.get_name())
+        if heap is None:
+            return []
+        order = sorted(range(len(heap)), key=lambda k: heap.prices[k], reverse=True)
+        return [heap.traders[k] for k in order]
+
+    def _withdraw(self, trader: Trader) -> None:
+        """ Removes the current offer of a trader, if any. """
+        name = self.offers.pop(trader, None)
+        if name is not None:
+            heap = self.heaps[name]
+            heap.remove(trader)
+            if len(heap) == 0:
+                del self.heaps[name]
+
+    def update(self, trader: Trader) -> None:
+        """ Called by a trader whose active deal has changed.
+            :complexity: O(log T)
+        """
+        self._withdraw(trader)
+        self.version += 1
+        if trader.active_deal is not None:
+            material, price = trader.active_deal
+            name = material.get_name()
+            if name not in self.heaps:
+                self.heaps[name] = PriceHeap()
+            self.heaps[name].push(trader, price)
+            self.offers[trader] = name
+
+    def best_price(self, material: Material) -> float:
+        """ Returns the highest price a trader currently offers for a material.
+            :complexity: O(1)
+            :raises KeyError: if no trader is buying the material
+        """
+        return self.heaps[material.get_name()].max_price()
+
+    def price_table(self) -> dict[str, float]:
+        """ Returns the best price of every material bought, by material name.
+            The table is only rebuilt when the version has changed since it was last built.
+            :complexity: O(M) where M is the number of materials bought if the version
+                has changed, O(1) otherwise
+        """
+        if self._table_version != self.version:
+            self._table = {name: heap.max_price() for name, heap in self.heaps.items()}
+            self._table_version = self.version
+        return self._table
+
+    def get_custom(self, material: Material) -> float:
+        """ Returns the best price of a material from the price table, which the market
+            stands in for in the games.
+            :complexity: O(1) amortised over the lookups of a version
+            :raises KeyError: if no trader is buying the material
+        """
+        return self.price_table()[material.get_name()]
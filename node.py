@@ -35,6 +35,7 @@ class TreeNode(Generic[K, I]):
 
 class AVLTreeNode(TreeNode, Generic[K, I]):
     """ Node class for AVL trees.
+        Records the height and the number of nodes of its sub-tree.
     """
 
     def __init__(self, key: K, item: I = None) -> None:
@@ -46,3 +47,21 @@ class AVLTreeNode(TreeNode, Generic[K, I]):
 
         super(AVLTreeNode, self).__init__(key, item)
         self.height = 1
+        self.size = 1
+
+class SkipListNode(TreeNode, Generic[K, I]):
+    """ Node class for skip lists.
+        Level l of the node links to the next node reaching that level,
+        and records how many nodes that link skips over.
+    """
+
+    def __init__(self, key: K, item: I = None, levels: int = 1) -> None:
+        """
+            Initialises the node with a key, optional item and a number of levels,
+            with every link pointing to None
+            :complexity: O(levels)
+        """
+
+        super(SkipListNode, self).__init__(key, item)
+        self.next = [None] * levels
+        self.width = [1] * levels
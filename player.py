@@ -1,13 +1,14 @@
 from __future__ import annotations
 from array_sorted_list import ArraySortedList
 from cave import Cave
-from hash_table import LinearProbeTable
+from market import Market
 from material import Material
 from sorted_list import ListItem
 from trader import Trader, RandomTrader
 from food import Food
 from random_gen import RandomGen
 from constants import EPSILON
+from typed_array import TypedArray
 
 """
 This file contains the Player class that will be used to create Player instances to be used in Game generation
@@ -123,19 +124,22 @@ class Player():
         self.name = name
         self.balance = self.DEFAULT_EMERALDS if emeralds is None else emeralds
         self.traders_list = None
+        self.market = None
         self.foods_list = None
         self.materials_list = None
         self.caves_list = None
+        self._efficiency_cache = None
 
 
     def set_traders(self, traders_list: list[Trader]) -> None:
         """
-            Sets the list of traders
+            Sets the list of traders, and the market of their deals
             :param
                 -> traders_list: a list of traders
         """
 
         self.traders_list = traders_list
+        self.market = Market.for_traders(traders_list)
 
     def get_traders(self) -> list[Trader]:
         """
@@ -221,29 +225,17 @@ class Player():
 
         self.materials_list = materials_list
 
-    def _get_trading_list(self) -> LinearProbeTable:
+    def _get_trading_list(self) -> Market:
         """ 
-        Will return a dictionary with the material:highest buying price
+        Will return the market of the traders, which maps each material to its highest buying price
+        through get_custom. The traders keep it up to date as their deals change.
 
-            returns a material:price dictionary
-            complexity: O(T) where T is the list of traders
+            returns the Market of the player's traders
+            complexity: O(1)
         
         """
 
-        trading_list = LinearProbeTable(len(self.get_traders()))
-        for traders in self.get_traders():
-            material = traders.current_deal()[0]
-            buying_price = traders.current_deal()[1]
-
-            try:
-                # if there is already a trader for this material, then ignore the trader with lower buying price
-                if(buying_price > trading_list.get_custom(material)):
-                    trading_list.insert_custom(material, buying_price)
-            except:
-                # if not then there is no exisitng trader for this material yet
-                trading_list.insert_custom(material, buying_price)
-
-        return trading_list
+        return self.market
 
     def __str__(self) -> str:
         """
@@ -254,6 +246,57 @@ class Player():
         """
         return "Player Name: {pname}, Emeralds: {emeralds}".format(pname=self.name, emeralds=self.balance)
 
+    def _get_efficiency_columns(self, trader_list: Market) -> tuple[ArraySortedList, TypedArray, TypedArray]:
+        """
+            Gives the caves with a material some trader buys, sorted from the most to the least efficient,
+            with the mining rate and best selling price of each in packed columns.
+            They are cached with the version of the market, and rebuilt only when a deal has changed
+            or the caves have been set again.
+
+            complexity:
+                O(1) if the cache is valid, O(C*log(C)) otherwise -> C is the list of caves
+        """
+        if self._efficiency_cache is not None:
+            market, version, caves, columns = self._efficiency_cache
+            if market is trader_list and version == trader_list.version and caves is self.get_caves():
+                return columns
+
+        # collects the caves that can be traded along with their efficiency
+        efficiency_items = []
+
+        # This particular for loop checks through each available caves, to see if there is a trader for the material the cave contains and adds that cave and it's efficiency to the list
+        """ The loop has a complexity of O(C) ~ as all the caves in the cave list has to be looped. hence, the best and worst case complexity is O(C) """
+        for cave in self.get_caves():
+            try:
+                material = cave.get_material()
+                # check if there is a trader for this material, if not then skip this cave
+                selling_price = trader_list.get_custom(material)
+                mining_rate = material.get_mining_rate()
+                efficiency = selling_price/mining_rate
+                # stores the cave as the value and efficiency as the key
+                efficiency_items.append(ListItem(cave, efficiency))
+            except:
+                pass
+
+        # creates a ArraySortedList of the caves from the most to the least efficient, with one sort
+        """ This has a complexity of O(C*log(C)) """
+        efficiency_sorted_list = ArraySortedList.from_iterable(efficiency_items, reverse=True)
+
+        # copy the mining rate and best selling price of each sorted cave into packed columns, so the food loop of
+        # select_food_and_caves reads them by index instead of hashing the material name again for every food
+        """ This has a complexity of O(C) """
+        cave_count = len(efficiency_sorted_list)
+        mining_rates = TypedArray(max(1, cave_count))
+        selling_prices = TypedArray(max(1, cave_count))
+        for index in range(cave_count):
+            material = efficiency_sorted_list[index].value.get_material()
+            mining_rates[index] = material.get_mining_rate()
+            selling_prices[index] = trader_list.get_custom(material)
+
+        columns = (efficiency_sorted_list, mining_rates, selling_prices)
+        self._efficiency_cache = (trader_list, trader_list.version, self.get_caves(), columns)
+        return columns
+
     def select_food_and_caves(self) -> tuple[Food | None, float, list[tuple[Cave, float]]]:
         """
         This method is used by the player AI to determine the best course of actions to take in the game per day.
@@ -280,24 +323,12 @@ class Player():
         # stores the current emeralds balance of player
         current_balance = self.get_balance()
         # gets the list of trade price
-        """ This line has a complexity of O(T), the full details of this function are written in the function header of the _get_trading_list function """
+        """ This line has a complexity of O(1), the full details of this function are written in the function header of the _get_trading_list function """
         trader_list = self._get_trading_list()
-        # creates a ArraySortedList to store caves and it's efficiency
-        efficiency_sorted_list = ArraySortedList(len(self.get_caves()))
-
-        # This particular for loop checks through each available caves, to see if there is a trader for the material the cave contains and adds that cave and it's efficiency to the ArraySortedList
-        """ The loop has a complexity of O(C) ~ as all the caves in the cave list has to be looped. hence, the best and worst case complexity is O(C) """
-        for cave in self.get_caves():
-            try:
-                material = cave.get_material()
-                # check if there is a trader for this material, if not then skip this cave
-                selling_price = trader_list.get_custom(material)
-                mining_rate = material.get_mining_rate()
-                efficiency = selling_price/mining_rate
-                # stores the cave as the value and efficiency as the key
-                efficiency_sorted_list.add(ListItem(cave, efficiency), True)
-            except:
-                pass
+        # the caves sorted by efficiency only change with the prices, so they are reused while the market version is the same
+        """ This has a complexity of O(1) if the market has not changed since the last call, see _get_efficiency_columns """
+        efficiency_sorted_list, mining_rates, selling_prices = self._get_efficiency_columns(trader_list)
+        cave_count = len(efficiency_sorted_list)
 
         # Empty variables are instantiated
         current_max_profits = 0
@@ -324,11 +355,10 @@ class Player():
 
             # This particular while loop calculates the  profit from a particular food and generates a tuple of caves visited by player and quantity mined  for the same food item
             """ The loop has a Worst case complexity of O(C) when the player is able to visit every cave and mine materials. Best case is when player cannot afford food so it does not enter the while loop, giving it O(1) complexity"""
-            while current_hunger-EPSILON > 0 and index < len(efficiency_sorted_list):
+            while current_hunger-EPSILON > 0 and index < cave_count:
                 item = efficiency_sorted_list[index]  # gets each element of the efficiency_sorted_list
                 cave = item.value  # retrieves the element's cave
-                material = cave.get_material()  # retrieves the cave's material
-                mining_rate = material.get_mining_rate()
+                mining_rate = mining_rates[index]
 
                 quantity_in_cave = cave.get_quantity()  # gets the quantity of the material is in the cave
                 quantity_mineable_player = (current_hunger/mining_rate)  # calculates how much the player can mine with the hunger_bars given by the current food
@@ -344,7 +374,7 @@ class Player():
                 current_cave_list.append(tuple)
 
                 # update the earning for this food 
-                earnings += trader_list.get_custom(material) * quantity_mined
+                earnings += selling_prices[index] * quantity_mined
 
                 # increment list index
                 index += 1
@@ -0,0 +1,49 @@
+"""
+    Queue ADT. Defines a generic abstract first-in first-out queue with
+    the usual methods.
+"""
+
+__docformat__ = 'reStructuredText'
+
+from abc import ABC, abstractmethod
+from typing import TypeVar, Generic
+T = TypeVar('T')
+
+
+class Queue(ABC, Generic[T]):
+    """ Abstract Queue class. """
+    def __init__(self) -> None:
+        """ Object initializer. """
+        self.length = 0
+
+    @abstractmethod
+    def append(self, item: T) -> None:
+        """ Adds an element to the rear of the queue."""
+        pass
+
+    @abstractmethod
+    def serve(self) -> T:
+        """ Deletes and returns the element at the front of the queue."""
+        pass
+
+    @abstractmethod
+    def peek(self) -> T:
+        """ Returns the element at the front of the queue, without serving it."""
+        pass
+
+    def __len__(self) -> int:
+        """ Returns the number of elements in the queue."""
+        return self.length
+
+    def is_empty(self) -> bool:
+        """ Returns True iff the queue is empty. """
+        return len(self) == 0
+
+    @abstractmethod
+    def is_full(self) -> bool:
+        """ Returns True iff the queue is full and no element can be appended. """
+        pass
+
+    def clear(self):
+        """ Clears all elements from the queue. """
+        self.length = 0
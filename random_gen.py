@@ -38,6 +38,63 @@ class RandomGen():
         cls.seed = (cls.A * cls.seed + cls.C) % cls.MOD
         return cls.seed >> 16
 
+    @classmethod
+    def random_batch(cls, count):
+        """
+        Returns a list of the next `count` numbers `random` would return, in order.
+        :complexity: O(count)
+        """
+        draws, cls.seed = cls._draws_from(cls.seed, count)
+        return draws
+
+    @classmethod
+    def _draws_from(cls, seed, count):
+        """
+        Returns the `count` numbers `random` would return from state `seed`,
+        and the state after them, without changing the state of RandomGen.
+        :complexity: O(count)
+        """
+        a, c, mod = cls.A, cls.C, cls.MOD
+        draws = [0] * count
+        for k in range(count):
+            seed = (a * seed + c) % mod
+            draws[k] = seed >> 16
+        return draws, seed
+
+    @classmethod
+    def jump(cls, seed, steps):
+        """
+        Returns the state of the LCG `steps` steps after state `seed`.
+        The affine map of one step, s -> A*s + C, is composed with itself by
+        repeated squaring, so the state is found without going through the
+        states in between.
+        :complexity: O(log(steps))
+        """
+        mult, add = 1, 0
+        step_mult, step_add = cls.A, cls.C
+        while steps > 0:
+            if steps & 1:
+                mult, add = (step_mult * mult) % cls.MOD, (step_mult * add + step_add) % cls.MOD
+            step_mult, step_add = (step_mult * step_mult) % cls.MOD, (step_mult * step_add + step_add) % cls.MOD
+            steps >>= 1
+        return (mult * seed + add) % cls.MOD
+
+    # each substream is a block of STREAM_LENGTH consecutive states of the master sequence
+    STREAM_LENGTH = 1 << 16
+
+    @classmethod
+    def substream_draws(cls, seed, stream, count):
+        """
+        Returns the first `count` numbers of substream `stream` of the sequence
+        seeded with `seed`, without changing the state of RandomGen.
+        Substream k starts k * STREAM_LENGTH steps after the seed, so distinct
+        substreams do not overlap as long as count <= STREAM_LENGTH, and any
+        substream is reached directly by jumping ahead.
+        :complexity: O(log(stream * STREAM_LENGTH) + count)
+        """
+        start = cls.jump(seed % cls.MOD, stream * cls.STREAM_LENGTH)
+        return cls._draws_from(start, count)[0]
+
     @classmethod
     def random_float(cls):
         """Returns a random floating point integer in the range 0 to 1."""
@@ -58,6 +115,37 @@ class RandomGen():
         """Returns a random choice from a collection that supports __getitem__ and __len__"""
         return collection[cls.randint(0, len(collection)-1)]
 
+    @classmethod
+    def weighted_choice(cls, collection, weights):
+        """
+        Returns a random choice from a collection, each item being chosen with
+        probability proportional to its weight. Equal weights give the choice
+        random_choice would make. To draw many times with the same weights,
+        build an AliasTable once instead.
+        :complexity: O(len(collection))
+        """
+        return AliasTable(collection, weights).draw()
+
+    @classmethod
+    def random_sample(cls, collection, k):
+        """
+        Returns k distinct random items of a collection that supports __getitem__
+        and __len__, in the order they were drawn, without copying the collection:
+        a partial Fisher-Yates shuffle records only the swapped positions.
+        :complexity: O(k)
+        :raises ValueError: if k is negative or larger than the collection
+        """
+        n = len(collection)
+        if not 0 <= k <= n:
+            raise ValueError("Sample larger than the collection or negative")
+        swapped = {}
+        sample = [None] * k
+        for i in range(k):
+            j = cls.randint(i, n - 1)
+            sample[i] = collection[swapped.get(j, j)]
+            swapped[j] = swapped.get(i, i)
+        return sample
+
     @classmethod
     def random_shuffle(cls, collection) -> None:
         """
@@ -69,3 +157,82 @@ class RandomGen():
         tmp = [collection[p[1]] for p in positions]
         for x in range(len(collection)):
             collection[x] = tmp[x]
+
+
+class AliasTable():
+    """
+    Walker alias table, for drawing items with probabilities proportional to
+    their weights in O(1) per draw after an O(N) setup (Vose's method).
+
+    Each item i owns a column holding a threshold and an alias. A draw picks
+    a column and a coin from one number of RandomGen: the column's item is
+    drawn if the coin is under its threshold, otherwise its alias. With equal
+    weights every threshold is full, so a draw is the choice random_choice
+    would make from the same number.
+
+    Attributes:
+        * items (list): the items
+        * thresholds (list): the threshold of each column, out of total
+        * aliases (list[int]): the alias of each column
+        * total: the sum of the weights, the scale of the thresholds
+    """
+
+    # a number of RandomGen is below 2^32
+    SPAN = 1 << 32
+
+    def __init__(self, items, weights):
+        """
+        Builds the table of the items with their weights.
+        :complexity: O(N)
+        :raises ValueError: if the lengths differ, a weight is negative, or no weight is positive
+        """
+        n = len(items)
+        if n != len(weights):
+            raise ValueError("There must be one weight per item")
+        if any(weight < 0 for weight in weights):
+            raise ValueError("Weights cannot be negative")
+        self.items = list(items)
+        self.total = sum(weights)
+        if self.total <= 0:
+            raise ValueError("At least one weight must be positive")
+        # a column is full when its scaled weight reaches the total
+        scaled = [weight * n for weight in weights]
+        self.thresholds = [self.total] * n
+        self.aliases = list(range(n))
+        small = [i for i in range(n) if scaled[i] < self.total]
+        large = [i for i in range(n) if scaled[i] >= self.total]
+        while small and large:
+            s, l = small.pop(), large.pop()
+            self.thresholds[s] = scaled[s]
+            self.aliases[s] = l
+            scaled[l] -= self.total - scaled[s]
+            if scaled[l] < self.total:
+                small.append(l)
+            else:
+                large.append(l)
+        # what is left is full, up to rounding
+        for i in small + large:
+            self.thresholds[i] = self.total
+
+    def __len__(self):
+        return len(self.items)
+
+    def pick(self, draw):
+        """
+        Returns the item drawn by a number of RandomGen.
+        The number modulo N picks the column and the quotient is the coin.
+        :complexity: O(1)
+        """
+        n = len(self.items)
+        column = draw % n
+        coin = draw // n
+        if coin * self.total < self.thresholds[column] * ((self.SPAN - 1) // n + 1):
+            return self.items[column]
+        return self.items[self.aliases[column]]
+
+    def draw(self):
+        """
+        Returns an item drawn with the next number of RandomGen.
+        :complexity: O(1)
+        """
+        return self.pick(RandomGen.random())
@@ -12,7 +12,30 @@ space to hold the references.
 Note that while I do check the precondition in __init__ (noone else
 would), I do not check that of getitem or setitem, since that is already
 checked by self.array[index].
+
+The bulk methods (move_range, copy_from and fill) move whole blocks of
+references with a single slice assignment on the ctypes array. This keeps
+the loop in C while still letting ctypes do the reference counting for
+every slot, which a raw memmove of the pointers would not.
+
+LazyArrayR skips the initialisation to None altogether. ctypes already
+zero-fills the memory it allocates, which leaves every slot holding a NULL
+reference; reading such a slot raises ValueError in ctypes, so LazyArrayR
+catches that and returns None instead. Allocation is then a single calloc,
+but reading a slot that was never written goes through the exception and
+is several times slower than an ArrayR read, and so is any slice holding
+such a slot. LazyArrayR is therefore only used by containers that write a
+slot before reading it (lists, stacks, heaps, sorted lists); hash tables,
+whose probes read empty slots all the time, keep the None-filled ArrayR.
+
+ArrayRView is a window (offset and length) over an ArrayR. It shares the
+backing array rather than copying it, so it can be handed to consumers
+that only need to index or iterate over part of an array. Views are the
+zero-copy interface of ArrayR: its slots hold object references, which
+the buffer protocol cannot export usefully.
 """
+from __future__ import annotations
+
 __author__ = "Julian Garcia for the __init__ code, Maria Garcia de la Banda for the rest"
 __docformat__ = 'reStructuredText'
 
@@ -31,7 +54,7 @@ class ArrayR(Generic[T]):
         if length <= 0:
             raise ValueError("Array length should be larger than 0.")
         self.array = (length * py_object)() # initialises the space
-        self.array[:] =  [None for _ in range(length)]
+        self.array[:] = [None] * length
 
     def __len__(self) -> int:
         """ Returns the length of the array
@@ -52,3 +75,154 @@ class ArrayR(Generic[T]):
         :pre: index in between 0 and length - self.array[] checks it
         """
         self.array[index] = value
+
+    def view(self, start: int = 0, stop: int = None) -> ArrayRView[T]:
+        """ Returns a view over positions [start, stop) sharing this array.
+        :complexity: O(1), nothing is copied
+        :pre: 0 <= start <= stop <= length
+        """
+        if stop is None:
+            stop = len(self.array)
+        return ArrayRView(self, start, stop - start)
+
+    def move_range(self, src: int, dst: int, count: int) -> None:
+        """ Moves the count references starting at src so they start at dst.
+        The ranges may overlap, since the source block is read in full
+        before any slot is written.
+        :complexity: O(count), done as a single slice assignment
+        :pre: both [src, src + count) and [dst, dst + count) lie within the array
+        """
+        if count > 0:
+            self.array[dst:dst + count] = self[src:src + count]
+
+    def copy_from(self, source, src: int, dst: int, count: int) -> None:
+        """ Copies count references from source (an ArrayR or any sliceable
+        sequence) starting at src into this array starting at dst.
+        :complexity: O(count), done as a single slice assignment
+        :pre: both ranges lie within their arrays
+        """
+        if count > 0:
+            self.array[dst:dst + count] = source[src:src + count]
+
+    def fill(self, value: T, start: int = 0, stop: int = None) -> None:
+        """ Sets every position in [start, stop) to value.
+        :complexity: O(stop - start), done as a single slice assignment
+        :pre: 0 <= start <= stop <= length
+        """
+        if stop is None:
+            stop = len(self.array)
+        if stop > start:
+            self.array[start:stop] = [value] * (stop - start)
+
+
+
+class LazyArrayR(ArrayR[T]):
+    """ ArrayR whose slots start as NULL references and read back as None. """
+
+    def __init__(self, length: int) -> None:
+        """ Creates an array of references to objects of the given length
+        :complexity: O(1) in Python; the memory is zero-filled by ctypes
+        :pre: length > 0
+        """
+        if length <= 0:
+            raise ValueError("Array length should be larger than 0.")
+        self.array = (length * py_object)()
+
+    def __getitem__(self, index: int) -> T:
+        """ Returns the object in position index, or None if the position
+        has never been written. Slices are handled the same way.
+        :complexity: O(1) for an index, O(length of the slice) for a slice
+        :pre: index in between 0 and length - self.array[] checks it
+        """
+        try:
+            return self.array[index]
+        except ValueError:
+            if isinstance(index, slice):
+                return [self[i] for i in range(*index.indices(len(self.array)))]
+            return None
+
+
+class ArrayRView(Generic[T]):
+    """ A window over length consecutive positions of an ArrayR, starting at
+    offset. Reads and writes go straight to the backing array.
+
+    Attributes:
+        * array (ArrayR[T]): the backing array, shared with its owner
+        * offset (int): position in the backing array of index 0 of the view
+        * length (int): number of positions visible through the view
+    """
+
+    def __init__(self, array: ArrayR[T], offset: int, length: int) -> None:
+        """ Creates a view over array[offset:offset + length]
+        :complexity: O(1)
+        :pre: the window lies within the backing array
+        """
+        if offset < 0 or length < 0 or offset + length > len(array):
+            raise IndexError("View does not fit in the array.")
+        self.array = array
+        self.offset = offset
+        self.length = length
+
+    def __len__(self) -> int:
+        """ Returns the length of the view
+        :complexity: O(1)
+        """
+        return self.length
+
+    def _position(self, index: int) -> int:
+        """ Maps an index of the view (negative ones count from the end) to
+        a position in the backing array.
+        :complexity: O(1)
+        :raises IndexError: if the index is outside the view
+        """
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError("View index out of range.")
+        return self.offset + index
+
+    def __getitem__(self, index: int) -> T:
+        """ Returns the object in position index of the view.
+        :complexity: O(1)
+        """
+        return self.array[self._position(index)]
+
+    def __setitem__(self, index: int, value: T) -> None:
+        """ Sets the object in position index of the view to value
+        :complexity: O(1)
+        """
+        self.array[self._position(index)] = value
+
+    def __iter__(self):
+        """ Yields the objects of the view in order.
+        :complexity: O(length)
+        """
+        array = self.array
+        for i in range(self.offset, self.offset + self.length):
+            yield array[i]
+
+    def capacity(self) -> int:
+        """ Returns how long the view can grow to without leaving its array.
+        :complexity: O(1)
+        """
+        return len(self.array) - self.offset
+
+    def resize(self, length: int) -> None:
+        """ Grows or shrinks the view in place.
+        :complexity: O(1)
+        :raises ValueError: if the backing array has no room for length
+        """
+        if length < 0 or length > self.capacity():
+            raise ValueError("View cannot be resized in place.")
+        self.length = length
+
+    def view(self, start: int = 0, stop: int = None) -> ArrayRView[T]:
+        """ Returns a view over positions [start, stop) of this view, sharing
+        the same backing array.
+        :complexity: O(1)
+        """
+        if stop is None:
+            stop = self.length
+        if not 0 <= start <= stop <= self.length:
+            raise IndexError("View does not fit in the view.")
+        return ArrayRView(self.array, self.offset + start, stop - start)
@@ -0,0 +1,244 @@
+""" Sorted map implemented as an indexable skip list. """
+
+from __future__ import annotations
+
+__docformat__ = 'reStructuredText'
+
+from typing import TypeVar, Generic, Iterator, List
+from node import SkipListNode
+from random_gen import RandomGen
+
+K = TypeVar('K')
+I = TypeVar('I')
+
+
+class SkipList(Generic[K, I]):
+    """ Probabilistic sorted map with the interface of BinarySearchTree.
+
+        Every node is on level 0, a linked list of all the keys in order,
+        and on each higher level with probability 1/2, so search, insert and
+        delete take O(log N) expected time. Unlike an AVL tree no rotation
+        is needed: an insert or delete only relinks the neighbours of one
+        node. Every link also records how many nodes it skips, which gives
+        rank and selection by rank in O(log N) expected time.
+
+        The levels are drawn from RandomGen, so the shape of the list is
+        reproducible under a seed.
+
+        Attributes:
+            head (SkipListNode): sentinel node before the first key, on every level
+            length (int): number of keys in the map
+    """
+
+    MAX_LEVELS = 32
+
+    def __init__(self) -> None:
+        """
+            Initialises an empty skip list
+            :complexity: O(MAX_LEVELS)
+        """
+        self.head = SkipListNode(None, None, self.MAX_LEVELS)
+        self.levels = 1
+        self.length = 0
+
+    def is_empty(self) -> bool:
+        """
+            Checks to see if the skip list is empty
+            :complexity: O(1)
+        """
+        return self.length == 0
+
+    def __len__(self) -> int:
+        """ Returns the number of keys in the skip list. """
+        return self.length
+
+    def _random_levels(self) -> int:
+        """
+            Number of levels of a new node: 1 plus the number of trailing
+            one bits of a single random draw, i.e. l levels with probability 2^-l.
+            :complexity: O(1)
+        """
+        bits = RandomGen.random()
+        levels = 1
+        while bits & 1 and levels < self.MAX_LEVELS:
+            levels += 1
+            bits >>= 1
+        return levels
+
+    def _predecessors(self, key: K) -> tuple[list, list]:
+        """
+            For every level, the last node with a key smaller than the given
+            one, and the rank of that node (the head having rank -1).
+            :complexity: O(log N) expected
+        """
+        update = [self.head] * self.MAX_LEVELS
+        ranks = [-1] * self.MAX_LEVELS
+        current = self.head
+        rank = -1
+        for level in range(self.levels - 1, -1, -1):
+            following = current.next[level]
+            while following is not None and following.key < key:
+                rank += current.width[level]
+                current = following
+                following = current.next[level]
+            update[level] = current
+            ranks[level] = rank
+        return update, ranks
+
+    def _find(self, key: K) -> SkipListNode:
+        """
+            Returns the node holding the key
+            :complexity: O(log N) expected
+            :raises KeyError: if the key is not in the skip list
+        """
+        current = self.head
+        for level in range(self.levels - 1, -1, -1):
+            following = current.next[level]
+            while following is not None and following.key < key:
+                current = following
+                following = current.next[level]
+        current = current.next[0]
+        if current is None or current.key != key:
+            raise KeyError('Key not found: {0}'.format(key))
+        return current
+
+    def __contains__(self, key: K) -> bool:
+        """
+            Checks to see if the key is in the skip list
+            :complexity: O(log N) expected
+        """
+        try:
+            self._find(key)
+        except KeyError:
+            return False
+        return True
+
+    def __getitem__(self, key: K) -> I:
+        """
+            Returns the item stored with the key
+            :complexity: O(log N) expected
+            :raises KeyError: if the key is not in the skip list
+        """
+        return self._find(key).item
+
+    def __setitem__(self, key: K, item: I) -> None:
+        """
+            Inserts a new key with its item
+            :complexity: O(log N) expected
+            :raises ValueError: if the key is already in the skip list
+        """
+        update, ranks = self._predecessors(key)
+        following = update[0].next[0]
+        if following is not None and following.key == key:
+            raise ValueError('Inserting duplicate item')
+
+        levels = self._random_levels()
+        if levels > self.levels:
+            for level in range(self.levels, levels):
+                # the head's links on new levels skip over the whole list
+                self.head.width[level] = self.length + 1
+            self.levels = levels
+
+        node = SkipListNode(key, item, levels)
+        rank = ranks[0] + 1
+        for level in range(levels):
+            before = update[level]
+            node.next[level] = before.next[level]
+            before.next[level] = node
+            # the links of before and node now share the nodes before skipped
+            skipped_before = rank - ranks[level]
+            node.width[level] = before.width[level] - skipped_before + 1
+            before.width[level] = skipped_before
+        for level in range(levels, self.levels):
+            update[level].width[level] += 1
+        self.length += 1
+
+    def __delitem__(self, key: K) -> None:
+        """
+            Deletes the key and its item
+            :complexity: O(log N) expected
+            :raises ValueError: if the key is not in the skip list
+        """
+        update, _ = self._predecessors(key)
+        node = update[0].next[0]
+        if node is None or node.key != key:
+            raise ValueError('Deleting non-existent item')
+
+        for level in range(self.levels):
+            before = update[level]
+            if before.next[level] is node:
+                before.next[level] = node.next[level]
+                before.width[level] += node.width[level] - 1
+            else:
+                before.width[level] -= 1
+        while self.levels > 1 and self.head.next[self.levels - 1] is None:
+            self.levels -= 1
+        self.length -= 1
+
+    def __iter__(self) -> Iterator[K]:
+        """ Yields the keys in increasing order. """
+        current = self.head.next[0]
+        while current is not None:
+            yield current.key
+            current = current.next[0]
+
+    def rank(self, key: K) -> int:
+        """
+            Returns the number of keys smaller than the given key, whether
+            or not the key is in the skip list
+            :complexity: O(log N) expected
+        """
+        _, ranks = self._predecessors(key)
+        return ranks[0] + 1
+
+    def _node_at(self, index: int) -> SkipListNode:
+        """
+            Returns the node holding the key of the given rank
+            :complexity: O(log N) expected
+            :raises IndexError: if there is no such rank
+        """
+        if not 0 <= index < self.length:
+            raise IndexError('No such index in the skip list')
+        current = self.head
+        rank = -1
+        for level in range(self.levels - 1, -1, -1):
+            while current.next[level] is not None and rank + current.width[level] <= index:
+                rank += current.width[level]
+                current = current.next[level]
+        return current
+
+    def kth_key(self, index: int) -> K:
+        """
+            Returns the key of the given rank, starting from 0
+            :complexity: O(log N) expected
+            :raises IndexError: if there is no such rank
+        """
+        return self._node_at(index).key
+
+    def range_between(self, i: int, j: int) -> List:
+        """
+            Returns a sorted list of all items in the skip list between the ith
+            and jth indices, inclusive, as AVLTree.range_between does
+            :complexity: O(j - i + log N) expected
+        """
+        res = []
+        if self.length == 0 or j < i:
+            return res
+        current = self._node_at(max(0, i))
+        for _ in range(max(0, i), min(j, self.length - 1) + 1):
+            res.append(current.item)
+            current = current.next[0]
+        return res
+
+    def range_by_key(self, low: K, high: K) -> List:
+        """
+            Returns a sorted list of the (key, item) pairs with low <= key <= high
+            :complexity: O(log N + M) expected, where M is the number of pairs returned
+        """
+        update, _ = self._predecessors(low)
+        res = []
+        current = update[0].next[0]
+        while current is not None and not high < current.key:
+            res.append((current.key, current.item))
+            current = current.next[0]
+        return res
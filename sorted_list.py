@@ -0,0 +1,25 @@
+"""
+    Items for the SortedList ADT.
+    The SortedList ADT itself is defined in AbstractSortedList and is
+    re-exported here, so both can be imported from this module.
+"""
+
+from typing import TypeVar, Generic
+from AbstractSortedList import SortedList, T
+
+__docformat__ = 'reStructuredText'
+
+K = TypeVar('K')
+
+
+class ListItem(Generic[T, K]):
+    """ Items to be stored in a sorted list: a value and the key it is sorted by. """
+
+    def __init__(self, value: T, key: K) -> None:
+        """ ListItem object initialiser. """
+        self.value = value
+        self.key = key
+
+    def __str__(self) -> str:
+        """ Magic method constructing a string representation of the item. """
+        return '({0}, {1})'.format(self.value, self.key)
@@ -0,0 +1,53 @@
+"""
+Tests the growth policy and bulk methods of ArrayList.
+"""
+
+from array_list import ArrayList
+import unittest
+
+
+class TestArrayList(unittest.TestCase):
+    """ Testing ArrayList functionality. """
+
+    def test_growth_is_geometric(self):
+        items = ArrayList(0)
+        resizes = 0
+        capacity = len(items.array)
+        for i in range(10000):
+            items.append(i)
+            if len(items.array) != capacity:
+                resizes += 1
+                capacity = len(items.array)
+        self.assertLessEqual(resizes, 15)
+        self.assertEqual(list(items), list(range(10000)))
+
+    def test_growth_factor(self):
+        items = ArrayList(4, growth_factor=1.5)
+        for i in range(5):
+            items.append(i)
+        self.assertEqual(len(items.array), 6)
+        with self.assertRaises(ValueError):
+            ArrayList(4, growth_factor=1)
+
+    def test_extend(self):
+        items = ArrayList(0)
+        items.extend([1, 2, 3])
+        self.assertEqual(len(items.array), 3)
+        items.extend(x * 10 for x in range(3))
+        items.extend((7, 8))
+        self.assertEqual(list(items), [1, 2, 3, 0, 10, 20, 7, 8])
+
+    def test_shrink(self):
+        items = ArrayList(0)
+        items.extend(list(range(64)))
+        while len(items) > 4:
+            items.delete_at_index(len(items) - 1)
+        self.assertLessEqual(len(items.array), 16)
+        self.assertEqual(list(items), [0, 1, 2, 3])
+        items.shrink_to_fit()
+        self.assertEqual(len(items.array), 4)
+        self.assertEqual(list(items), [0, 1, 2, 3])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+"""
+Tests the circular array queue and deque against Python's deque.
+"""
+
+from array_queue import ArrayQueue, ArrayDeque
+from collections import deque
+import random
+import unittest
+
+
+class TestArrayQueue(unittest.TestCase):
+    """ Testing ArrayQueue and ArrayDeque functionality. """
+
+    def setUp(self):
+        random.seed(37)
+
+    def test_queue_order(self):
+        queue = ArrayQueue()
+        for i in range(10):
+            queue.append(i)
+        for i in range(5):
+            self.assertEqual(queue.serve(), i)
+        for i in range(10, 20):
+            queue.append(i)
+        self.assertEqual(queue.peek(), 5)
+        self.assertEqual(list(queue), list(range(5, 20)))
+        self.assertEqual(queue[0], 5)
+        self.assertEqual(queue[-1], 19)
+        with self.assertRaises(IndexError):
+            queue[15]
+        queue.clear()
+        self.assertTrue(queue.is_empty())
+        with self.assertRaises(Exception):
+            queue.serve()
+
+    def test_deque_against_python(self):
+        ours = ArrayDeque()
+        expected = deque()
+        for i in range(2000):
+            operation = random.randrange(5)
+            if operation == 0:
+                ours.append(i)
+                expected.append(i)
+            elif operation == 1:
+                ours.append_left(i)
+                expected.appendleft(i)
+            elif operation == 2 and expected:
+                self.assertEqual(ours.pop(), expected.pop())
+            elif operation == 3 and expected:
+                self.assertEqual(ours.pop_left(), expected.popleft())
+            elif expected:
+                self.assertEqual(ours.peek(), expected[0])
+                self.assertEqual(ours.peek_last(), expected[-1])
+            self.assertEqual(len(ours), len(expected))
+        self.assertEqual(list(ours), list(expected))
+
+    def test_bounded(self):
+        queue = ArrayDeque(3, bounded=True)
+        for i in range(3):
+            self.assertTrue(queue.try_append(i))
+        self.assertTrue(queue.is_full())
+        self.assertFalse(queue.try_append(3))
+        with self.assertRaises(Exception):
+            queue.append(3)
+        with self.assertRaises(Exception):
+            queue.append_left(3)
+        self.assertEqual(queue.serve(), 0)
+        self.assertTrue(queue.try_append(3))
+        self.assertEqual(list(queue), [1, 2, 3])
+        self.assertEqual(len(queue.array), 3)
+
+    def test_rotate(self):
+        queue = ArrayQueue.from_iterable(['a', 'b', 'c', 'd'])
+        queue.rotate()
+        self.assertEqual(list(queue), ['b', 'c', 'd', 'a'])
+        queue.rotate(6)
+        self.assertEqual(list(queue), ['d', 'a', 'b', 'c'])
+        queue.serve()
+        queue.rotate(2)
+        self.assertEqual(list(queue), ['c', 'a', 'b'])
+        empty = ArrayQueue.from_iterable([])
+        empty.rotate()
+        self.assertTrue(empty.is_empty())
+
+
+if __name__ == '__main__':
+    unittest.main()
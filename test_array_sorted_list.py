@@ -0,0 +1,130 @@
+"""
+Tests the array-based sorted list against Python's sorted lists.
+"""
+
+from array_sorted_list import ArraySortedList
+from sorted_list import ListItem
+import random
+import unittest
+
+
+class TestArraySortedList(unittest.TestCase):
+    """ Testing ArraySortedList functionality. """
+
+    def setUp(self):
+        random.seed(34)
+
+    def test_add_ascending_and_descending(self):
+        keys = [random.randint(0, 30) for _ in range(100)]
+        ascending = ArraySortedList(1)
+        descending = ArraySortedList(1, reverse=True)
+        for i, key in enumerate(keys):
+            ascending.add(ListItem(i, key))
+            descending.add(ListItem(i, key))
+        self.assertEqual([item.key for item in ascending], sorted(keys))
+        self.assertEqual([item.key for item in descending], sorted(keys, reverse=True))
+        self.assertEqual(descending[0].key, max(keys))
+        self.assertEqual(descending[-1].key, min(keys))
+
+    def test_equal_keys_keep_insertion_order(self):
+        for reverse in [False, True]:
+            sorted_list = ArraySortedList(2, reverse=reverse)
+            for i in range(5):
+                sorted_list.add(ListItem(i, 1))
+            sorted_list.add(ListItem('low', 0))
+            sorted_list.add(ListItem('high', 2))
+            values = [item.value for item in sorted_list]
+            self.assertEqual(values[1:-1], [0, 1, 2, 3, 4])
+
+    def test_key_function(self):
+        sorted_list = ArraySortedList(0, key=len)
+        for word in ['ruby', 'emerald', 'gold', 'diamond', 'iron', 'coal']:
+            sorted_list.add(word)
+        self.assertEqual(list(sorted_list), ['ruby', 'gold', 'iron', 'coal', 'emerald', 'diamond'])
+
+    def test_setitem(self):
+        sorted_list = ArraySortedList.from_iterable([1, 3, 5], key=lambda item: item, reverse=True)
+        sorted_list[1] = 4
+        self.assertEqual(list(sorted_list), [5, 4, 3, 1])
+        with self.assertRaises(IndexError):
+            sorted_list[0] = 2
+        with self.assertRaises(IndexError):
+            sorted_list[10] = 0
+
+    def test_index_and_delete(self):
+        items = [ListItem(i, random.random()) for i in range(50)]
+        sorted_list = ArraySortedList.from_iterable(items, reverse=True)
+        expected = sorted(items, key=lambda item: item.key, reverse=True)
+        for item in items:
+            self.assertIn(item, sorted_list)
+            self.assertEqual(sorted_list.index(item), expected.index(item))
+        for _ in range(30):
+            i = random.randrange(len(expected))
+            self.assertIs(sorted_list.delete_at_index(i), expected.pop(i))
+        self.assertEqual(list(sorted_list), expected)
+        self.assertNotIn(ListItem('missing', 0.5), sorted_list)
+        with self.assertRaises(IndexError):
+            sorted_list[len(expected)]
+
+    def test_from_iterable_matches_add(self):
+        keys = [random.randint(0, 10) for _ in range(60)]
+        for reverse in [False, True]:
+            added = ArraySortedList(0, reverse=reverse)
+            for i, key in enumerate(keys):
+                added.add(ListItem(i, key))
+            built = ArraySortedList.from_iterable((ListItem(i, key) for i, key in enumerate(keys)), reverse=reverse)
+            self.assertEqual([item.value for item in built], [item.value for item in added])
+
+    def test_merge(self):
+        for reverse in [False, True]:
+            left_keys = [random.randint(0, 20) for _ in range(40)]
+            right_keys = [random.randint(0, 20) for _ in range(25)]
+            merged = ArraySortedList(0, reverse=reverse)
+            added = ArraySortedList(0, reverse=reverse)
+            for i, key in enumerate(left_keys):
+                merged.add(ListItem(('left', i), key))
+                added.add(ListItem(('left', i), key))
+            other = ArraySortedList(0, reverse=not reverse)
+            for i, key in enumerate(right_keys):
+                other.add(ListItem(('right', i), key))
+                added.add(ListItem(('right', i), key))
+            merged.merge(other)
+            self.assertEqual(len(merged), len(left_keys) + len(right_keys))
+            self.assertEqual([item.value for item in merged], [item.value for item in added])
+
+    def test_lazy_delete_matches_list(self):
+        for reverse in [False, True]:
+            keys = [random.randint(0, 50) for _ in range(200)]
+            sorted_list = ArraySortedList(1, reverse=reverse)
+            expected = []
+            for i, key in enumerate(keys):
+                item = ListItem(i, key)
+                sorted_list.add(item)
+                expected.append(item)
+            # in both directions, equal keys read back in the order they were added
+            expected.sort(key=lambda item: -item.key if reverse else item.key)
+            for _ in range(150):
+                index = random.randrange(len(expected))
+                self.assertIs(sorted_list.delete_at_index(index), expected.pop(index))
+                self.assertLessEqual(len(sorted_list.dead), sorted_list.MAX_DEAD_FRACTION * sorted_list.size)
+                probe = random.randrange(len(expected))
+                self.assertIs(sorted_list[probe], expected[probe])
+                self.assertEqual(sorted_list.index(expected[probe]), probe)
+            self.assertNotIn(ListItem(-1, 1000), sorted_list)
+            self.assertEqual([item.value for item in sorted_list], [item.value for item in expected])
+            self.assertEqual(sorted_list.dead, [])
+
+    def test_add_after_lazy_delete(self):
+        sorted_list = ArraySortedList.from_iterable(ListItem(i, i) for i in range(10))
+        sorted_list.delete_at_index(2)
+        sorted_list.delete_at_index(5)
+        self.assertEqual(sorted_list.dead, [2, 6])
+        self.assertIs(sorted_list.pop_max().key, 9)
+        self.assertEqual(sorted_list.peek_max().key, 8)
+        sorted_list.add(ListItem('new', 4))
+        self.assertEqual(sorted_list.dead, [])
+        self.assertEqual([item.key for item in sorted_list], [0, 1, 3, 4, 4, 5, 7, 8])
+
+
+if __name__ == '__main__':
+    unittest.main()
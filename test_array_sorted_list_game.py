@@ -0,0 +1,85 @@
+"""
+Tests the sorted list of mining options used by the multiplayer game.
+"""
+
+from array_sorted_list import ArraySortedList
+from cave import Cave
+from game import MiningOption
+from material import Material
+from operator import attrgetter
+import unittest
+
+
+class TestArraySortedListGame(unittest.TestCase):
+    """ Testing ArraySortedList with the mining options of the game. """
+
+    def setUp(self):
+        material = Material('Gold Nugget', 27.24)
+        self.options_list = ArraySortedList(1, key=attrgetter('earning'), reverse=True)
+        self.options = []
+        for i, (earning, num_append) in enumerate([(5.0, 1), (30.0, 2), (10.0, 1), (20.0, 1)]):
+            option = MiningOption(Cave('Cave {0}'.format(i), material), 1.0, earning, num_append)
+            self.options.append(option)
+            self.options_list.add(option)
+
+    def earnings(self):
+        return [self.options_list[i].earning for i in range(len(self.options_list))]
+
+    def take_best(self):
+        """ Takes the best option for one player, as select_for_players does. """
+        best = self.options_list[0]
+        best.num_append -= 1
+        if best.num_append <= 0:
+            self.options_list.delete_at_index(0)
+        return best
+
+    def test_sorted_by_earning(self):
+        self.assertEqual(self.earnings(), [30.0, 20.0, 10.0, 5.0])
+        self.assertIs(self.options_list.peek_max(), self.options[1])
+
+    def test_ties(self):
+        # of options with equal earnings, the first added is taken first
+        material = Material('Ruby', 2.0)
+        ties = [MiningOption(Cave(name, material), 1.0, 30.0, 1) for name in ['A Cave', 'B Cave']]
+        for option in ties:
+            self.options_list.add(option)
+        self.assertEqual([self.take_best() for _ in range(3)], [self.options[1], self.options[1]] + ties[:1])
+        self.assertIs(self.take_best(), ties[1])
+
+    def test_pop_max(self):
+        best = self.take_best()
+        self.assertIs(best, self.options[1])
+        self.assertEqual(best.num_append, 1)
+        self.assertEqual(len(self.options_list), 4)
+        self.assertIs(self.take_best(), best)
+        self.assertEqual(len(self.options_list), 3)
+        self.assertEqual(self.options_list.pop_max().earning, 20.0)
+        self.assertEqual(self.options_list.pop_max().earning, 10.0)
+        self.assertEqual(self.options_list.pop_max().earning, 5.0)
+        self.assertTrue(self.options_list.is_empty())
+        with self.assertRaises(IndexError):
+            self.options_list.pop_max()
+
+    def test_lazy_delete(self):
+        self.options_list.delete_at_index(1)
+        self.options_list.delete_at_index(1)
+        # both options are left as tombstones, the second delete did not compact the array
+        self.assertEqual(self.options_list.dead, [1, 2])
+        self.assertEqual(self.options_list.size, 4)
+        self.assertEqual(len(self.options_list), 2)
+        self.assertNotIn(self.options[2], self.options_list)
+        self.assertEqual(self.earnings(), [30.0, 5.0])
+
+        self.options_list.delete_at_index(1)
+        self.assertIs(self.take_best(), self.options[1])
+        self.assertIs(self.take_best(), self.options[1])
+        self.assertTrue(self.options_list.is_empty())
+
+    def test_add_after_delete(self):
+        self.options_list.delete_at_index(3)
+        self.options_list.add(MiningOption(Cave('New Cave', Material('Ruby', 2.0)), 1.0, 25.0, 1))
+        self.assertEqual(self.earnings(), [30.0, 25.0, 20.0, 10.0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+"""
+Tests the array-based stack against the linked one.
+"""
+
+from array_stack import ArrayStack
+from linked_stack import LinkedStack
+import unittest
+
+
+class TestArrayStack(unittest.TestCase):
+    """ Testing ArrayStack functionality. """
+
+    def test_push_pop(self):
+        for shrink in [False, True]:
+            stack = ArrayStack(shrink=shrink)
+            linked = LinkedStack()
+            for i in range(100):
+                stack.push(i)
+                linked.push(i)
+            self.assertEqual(len(stack), 100)
+            self.assertEqual(stack.peek(), 99)
+            for _ in range(70):
+                self.assertEqual(stack.pop(), linked.pop())
+            stack.push('top')
+            self.assertEqual(stack.pop(), 'top')
+            while not linked.is_empty():
+                self.assertEqual(stack.pop(), linked.pop())
+            self.assertTrue(stack.is_empty())
+            self.assertFalse(stack.is_full())
+            with self.assertRaises(Exception):
+                stack.pop()
+            with self.assertRaises(Exception):
+                stack.peek()
+
+    def test_growth_and_shrinking(self):
+        stack = ArrayStack(shrink=True)
+        for i in range(64):
+            stack.push(i)
+        self.assertEqual(len(stack.array), 64)
+        for _ in range(60):
+            stack.pop()
+        self.assertLessEqual(len(stack.array), 16)
+
+        stack = ArrayStack()
+        for i in range(64):
+            stack.push(i)
+        for _ in range(60):
+            stack.pop()
+        self.assertEqual(len(stack.array), 64)
+
+    def test_clear(self):
+        stack = ArrayStack(4)
+        for i in range(10):
+            stack.push(i)
+        stack.clear()
+        self.assertTrue(stack.is_empty())
+        self.assertTrue(all(item is None for item in stack.array))
+        stack.push(1)
+        self.assertEqual(stack.peek(), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -139,6 +139,92 @@ class TestAVL(unittest.TestCase):
 
         self.assertEqual(tree.range_between(1, 5), [2, 3, 4, 5, 6], "Range between failed")
 
+    def check_node(self, current: AVLTreeNode) -> tuple:
+        """ Checks the stored height, size and balance of every node, returning (height, size). """
+        if current is None:
+            return 0, 0
+        left_height, left_size = self.check_node(current.left)
+        right_height, right_size = self.check_node(current.right)
+        self.assertLessEqual(abs(left_height - right_height), 1)
+        self.assertEqual(current.height, 1 + max(left_height, right_height))
+        self.assertEqual(current.size, 1 + left_size + right_size)
+        return current.height, current.size
+
+    def test_split(self):
+        random.seed(39)
+        for attempt in range(10):
+            with self.subTest(attempt):
+                numbers = random.sample(range(1000), random.randint(1, 300))
+                tree = AVLTree()
+                for num in numbers:
+                    tree[num] = str(num)
+                for num in numbers[:len(numbers) // 3]:
+                    del tree[num]
+                remaining = sorted(numbers[len(numbers) // 3:])
+
+                key = random.randint(-10, 1010)
+                smaller, larger = tree.split(key)
+                self.assertTrue(tree.is_empty())
+                self.assertEqual(list(smaller), [num for num in remaining if num < key])
+                self.assertEqual(list(larger), [num for num in remaining if num >= key])
+                self.assertEqual(len(smaller) + len(larger), len(remaining))
+                self.assertEqual(len(smaller), self.check_node(smaller.root)[1])
+                self.check_node(larger.root)
+
+    def test_join(self):
+        random.seed(39)
+        for attempt in range(10):
+            with self.subTest(attempt):
+                # trees of very different heights
+                left, right = AVLTree(), AVLTree()
+                left_numbers = random.sample(range(500), random.randint(0, 200))
+                right_numbers = random.sample(range(500, 1000), random.randint(0, 20))
+                for num in left_numbers:
+                    left[num] = num
+                for num in right_numbers:
+                    right[num] = num
+
+                joined = AVLTree.join(left, right)
+                self.assertTrue(left.is_empty() and right.is_empty())
+                self.assertEqual(list(joined), sorted(left_numbers + right_numbers))
+                self.assertEqual(len(joined), len(left_numbers) + len(right_numbers))
+                self.check_node(joined.root)
+
+        left, right = AVLTree(), AVLTree()
+        left[5] = 5
+        right[3] = 3
+        with self.assertRaises(ValueError):
+            AVLTree.join(left, right)
+
+    def test_kth_item(self):
+        random.seed(41)
+        numbers = random.sample(range(1000), 200)
+        tree = AVLTree()
+        for num in numbers:
+            tree[num] = str(num)
+        for num in numbers[:50]:
+            del tree[num]
+        remaining = sorted(numbers[50:])
+        for k, num in enumerate(remaining):
+            self.assertEqual(tree.kth_item(k), str(num))
+        with self.assertRaises(IndexError):
+            tree.kth_item(len(remaining))
+        self.assertEqual(tree.range_between(20, 30), [str(num) for num in remaining[20:31]])
+
+    def test_tree_stats(self):
+        tree = AVLTree()
+        tree.enable_stats()
+        for num in range(1, 8):
+            tree[num] = num
+        stats = tree.tree_stats()
+        # inserting 1 to 7 in order gives a perfect tree after 4 left rotations
+        self.assertEqual(stats['height'], 3)
+        self.assertEqual(stats['nodes'], 7)
+        self.assertEqual(stats['left_rotations'], 4)
+        self.assertEqual(stats['right_rotations'], 0)
+        self.assertEqual(stats['rotations'], 4)
+        self.assertGreater(stats['rebalances'], 0)
+
 
 if __name__ == '__main__':
     # seeding the pseudo-random generator
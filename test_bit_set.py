@@ -0,0 +1,54 @@
+"""
+    Unit test for BitSet, implemented via inheritance from TestSet.
+"""
+from test_set import *
+from bit_set import *
+
+
+class TestBitSet(TestSet):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.SetType = BitSet
+
+    def test_iter_is_sorted(self):
+        s = self.SetType(8)
+        for i in [70, 3, 0, 9, 64]:
+            s.add(i)
+        self.assertEqual(list(s), [0, 3, 9, 64, 70])
+
+    def test_grows(self):
+        s = self.SetType(1)
+        s.add(1000000)
+        self.assertTrue(1000000 in s)
+        self.assertFalse(999999 in s)
+        self.assertEqual(len(s), 1)
+
+    def test_different_lengths(self):
+        small = self.SetType(8)
+        small.add(1)
+        small.add(2)
+        large = self.SetType(1000)
+        large.add(2)
+        large.add(900)
+        self.assertEqual(list(small.union(large)), [1, 2, 900])
+        self.assertEqual(list(large.intersection(small)), [2])
+        self.assertEqual(list(large.difference(small)), [900])
+        self.assertEqual(list(small.difference(large)), [1])
+
+    def test_invalid_items(self):
+        s = self.SetType(8)
+        self.assertFalse(-1 in s)
+        self.assertFalse("a" in s)
+        with self.assertRaises(ValueError):
+            s.add(-1)
+        with self.assertRaises(TypeError):
+            s.add("a")
+        with self.assertRaises(KeyError):
+            s.remove(3)
+
+
+if __name__ == '__main__':
+    testtorun = TestBitSet()
+    suite = unittest.TestLoader().loadTestsFromModule(testtorun)
+    unittest.TextTestRunner().run(suite)
@@ -0,0 +1,106 @@
+"""
+Tests the blocked sorted list against Python's sorted lists.
+"""
+
+from block_sorted_list import BlockSortedList
+import bisect
+import random
+import unittest
+
+
+class TestBlockSortedList(unittest.TestCase):
+    """ Testing BlockSortedList functionality. """
+
+    def setUp(self):
+        random.seed(16)
+        # small blocks so that splitting and merging are exercised
+        self.sorted_list = BlockSortedList(load=4)
+
+    def test_add_and_rank(self):
+        numbers = [random.randint(0, 50) for _ in range(300)]
+        for number in numbers:
+            self.sorted_list.add(number)
+        numbers.sort()
+        self.assertEqual(len(self.sorted_list), len(numbers))
+        self.assertEqual(list(self.sorted_list), numbers)
+        for i in range(len(numbers)):
+            self.assertEqual(self.sorted_list[i], numbers[i])
+        self.assertEqual(self.sorted_list[-1], numbers[-1])
+
+    def test_delete_and_index(self):
+        numbers = list(range(200))
+        random.shuffle(numbers)
+        for number in numbers:
+            self.sorted_list.add(number)
+        expected = list(range(200))
+        for _ in range(150):
+            i = random.randrange(len(expected))
+            self.assertEqual(self.sorted_list.delete_at_index(i), expected.pop(i))
+        self.assertEqual(list(self.sorted_list), expected)
+        for i, number in enumerate(expected):
+            self.assertEqual(self.sorted_list.index(number), i)
+        with self.assertRaises(ValueError):
+            self.sorted_list.index(-1)
+        with self.assertRaises(IndexError):
+            self.sorted_list.delete_at_index(len(expected))
+
+    def test_positional_index(self):
+        expected = []
+        for _ in range(2000):
+            if expected and random.random() < 0.4:
+                i = random.randrange(len(expected))
+                self.assertEqual(self.sorted_list.delete_at_index(i), expected.pop(i))
+            else:
+                number = random.randint(0, 1000)
+                self.sorted_list.add(number)
+                expected.insert(bisect.bisect_right(expected, number), number)
+            i = random.randrange(len(expected))
+            self.assertEqual(self.sorted_list[i], expected[i])
+            self.assertEqual(self.sorted_list.index(expected[i]), expected.index(expected[i]))
+        self.assertEqual(list(self.sorted_list), expected)
+
+        # adding to or deleting from a block that stays in place updates the tree in place
+        small = BlockSortedList(load=4)
+        for number in range(12):
+            small.add(number)
+        self.assertEqual(small[10], 10)
+        tree = small.fenwick
+        small.add(2)
+        small.delete_at_index(11)
+        self.assertIs(small.fenwick, tree)
+        self.assertEqual(list(small), [0, 1, 2, 2, 3, 4, 5, 6, 7, 8, 9, 11])
+        self.assertEqual(small.index(11), 11)
+        with self.assertRaises(ValueError):
+            BlockSortedList(load=0)
+
+    def test_key_and_ties(self):
+        tied = BlockSortedList(key=lambda item: item[0])
+        tied.LOAD = 2
+        for i in range(10):
+            tied.add((i % 3, i))
+        self.assertEqual([item[1] for item in tied], [0, 3, 6, 9, 1, 4, 7, 2, 5, 8])
+        self.assertEqual(tied.index((1, 7)), 6)
+        self.assertTrue((2, 8) in tied)
+        self.assertFalse((2, 9) in tied)
+
+    def test_setitem(self):
+        for number in [1, 3, 5]:
+            self.sorted_list.add(number)
+        self.sorted_list[1] = 2
+        self.sorted_list[4] = 7
+        self.assertEqual(list(self.sorted_list), [1, 2, 3, 5, 7])
+        with self.assertRaises(IndexError):
+            self.sorted_list[0] = 4
+
+    def test_remove_and_clear(self):
+        for number in [4, 2, 8]:
+            self.sorted_list.add(number)
+        self.sorted_list.remove(4)
+        self.assertEqual(list(self.sorted_list), [2, 8])
+        self.sorted_list.clear()
+        self.assertTrue(self.sorted_list.is_empty())
+        self.assertEqual(list(self.sorted_list), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
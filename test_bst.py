@@ -114,3 +114,29 @@ class TestBST(unittest.TestCase):
             array = [key for key in tree]  # using out treesort
 
             self.assertEqual(array, sorted_array, 'In-Order traversal produces a wrong order: {0}'.format(array))
+
+    def test_tree_stats(self):
+        tree = BinarySearchTree()
+        for num in [4, 2, 6, 1, 3, 5, 7]:
+            tree[num] = num
+        stats = tree.tree_stats()
+        self.assertEqual(stats['height'], 3)
+        self.assertEqual(stats['nodes'], 7)
+        self.assertAlmostEqual(stats['average_depth'], 10 / 7)
+        self.assertNotIn('searches', stats)
+
+        tree.enable_stats()
+        self.assertIn('insert_aux', tree.__dict__)
+        tree[8] = 8
+        self.assertEqual(tree[1], 1)
+        with self.assertRaises(KeyError):
+            tree[0]
+        stats = tree.tree_stats()
+        self.assertEqual(stats['insert_comparisons'], 3)
+        self.assertEqual(stats['searches'], 2)
+        self.assertEqual(stats['search_comparisons'], 6)
+
+        tree.disable_stats()
+        self.assertNotIn('insert_aux', tree.__dict__)
+        tree[9] = 9
+        self.assertEqual(tree.tree_stats()['insert_comparisons'], 3)
@@ -0,0 +1,105 @@
+"""
+Tests that batched deal generation gives the deals of the sequential path,
+and that seeded deals do not depend on how the traders are split.
+"""
+
+from deal_engine import STREAMS_PER_DAY, _seeded_deals, deal_stream, generate_all_deals, generate_seeded_deals
+from material import Material
+from random_gen import RandomGen
+from trader import RandomTrader, RangeTrader, HardTrader
+import unittest
+
+
+class TestDealEngine(unittest.TestCase):
+    """ Testing generate_all_deals. """
+
+    def make_traders(self) -> list:
+        RandomGen.set_seed(43)
+        materials = [Material("Material {0}".format(i), i + RandomGen.random_float()) for i in range(30)]
+        traders = []
+        for i in range(200):
+            trader = [RandomTrader, RangeTrader, HardTrader][RandomGen.randint(0, 2)]("Trader {0}".format(i))
+            low = RandomGen.randint(0, 20)
+            trader.set_all_materials(materials[low:low + RandomGen.randint(1, 10)])
+            traders.append(trader)
+        return traders
+
+    def deals(self, traders) -> list:
+        return [(trader.current_deal()[0].name, trader.current_deal()[1]) for trader in traders]
+
+    def test_same_as_sequential(self):
+        sequential = self.make_traders()
+        batched = self.make_traders()
+        for day in range(5):
+            RandomGen.set_seed(day)
+            for trader in sequential:
+                trader.generate_deal()
+            seed = RandomGen.seed
+
+            RandomGen.set_seed(day)
+            generate_all_deals(batched)
+            self.assertEqual(self.deals(batched), self.deals(sequential))
+            self.assertEqual(RandomGen.seed, seed)
+
+    def test_random_batch(self):
+        RandomGen.set_seed(16)
+        expected = [RandomGen.random() for _ in range(100)]
+        seed = RandomGen.seed
+        RandomGen.set_seed(16)
+        self.assertEqual(RandomGen.random_batch(100), expected)
+        self.assertEqual(RandomGen.seed, seed)
+
+    def test_jump(self):
+        RandomGen.set_seed(16)
+        for steps in [0, 1, 2, 7, 100, 1000]:
+            RandomGen.set_seed(16)
+            for _ in range(steps):
+                RandomGen.random()
+            self.assertEqual(RandomGen.jump(16, steps), RandomGen.seed)
+        RandomGen.set_seed(16)
+        RandomGen.random_batch(RandomGen.STREAM_LENGTH * 3)
+        self.assertEqual(RandomGen.substream_draws(16, 3, 10), RandomGen.random_batch(10))
+
+    def test_seeded_deals(self):
+        reference = self.make_traders()
+        RandomGen.set_seed(5)
+        generate_seeded_deals(reference, 1234, 7)
+        self.assertEqual(RandomGen.seed, 5)
+        expected = self.deals(reference)
+
+        # a deal only depends on the seed, the day and the trader id
+        traders = self.make_traders()
+        for trader_id in reversed(range(len(traders))):
+            draws = RandomGen.substream_draws(1234, deal_stream(7, trader_id), traders[trader_id].RANDOM_DRAWS)
+            traders[trader_id].active_deal = traders[trader_id].deal_from_draws(draws, 0)
+        self.assertEqual(self.deals(traders), expected)
+        generate_seeded_deals(traders, 1234, 8)
+        self.assertNotEqual(self.deals(traders), expected)
+
+        # the same results however the work is split, and in whatever order the parts run
+        tasks = list(enumerate(self.make_traders()))
+        results = _seeded_deals(1234, 7, tasks)
+        for size in [1, 3, 7, 64]:
+            parts = [tasks[start:start + size] for start in range(0, len(tasks), size)]
+            split = [result for part in reversed(parts) for result in _seeded_deals(1234, 7, part)]
+            self.assertEqual(sorted(split), results)
+
+        # the same deals, the same material objects, from a process pool
+        traders = self.make_traders()
+        generate_seeded_deals(traders, 1234, 7, processes=2, chunks=3)
+        self.assertEqual(self.deals(traders), expected)
+        for trader in traders:
+            self.assertIn(trader.current_deal()[0], trader.material_list)
+
+    def test_deal_stream_range(self):
+        self.assertEqual(deal_stream(1, 0), STREAMS_PER_DAY)
+        self.assertEqual(deal_stream(0, STREAMS_PER_DAY - 1), STREAMS_PER_DAY - 1)
+        for trader_id in [-1, STREAMS_PER_DAY]:
+            with self.assertRaises(ValueError):
+                deal_stream(0, trader_id)
+        with self.assertRaises(ValueError):
+            generate_seeded_deals([None] * (STREAMS_PER_DAY + 1), 1234, 7)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+"""
+Tests the deal history ring buffer and the rolling price statistics.
+"""
+
+from deal_history import DealHistory, PriceStats
+from material import Material
+import random
+import unittest
+
+
+class TestDealHistory(unittest.TestCase):
+    """ Testing DealHistory and PriceStats functionality. """
+
+    def test_ring_buffer(self):
+        gold = Material("Gold Nugget", 27.24)
+        history = DealHistory(4)
+        with self.assertRaises(IndexError):
+            history.latest()
+        for day in range(1, 11):
+            history.add(day, gold, float(day))
+        self.assertEqual(len(history), 4)
+        self.assertEqual([deal.day for deal in history], [7, 8, 9, 10])
+        self.assertEqual(history[0].price, 7.0)
+        self.assertEqual(history.latest(), (10, gold, 10.0))
+        self.assertIs(history.latest().material, gold)
+        self.assertEqual(len(history.deals.array), 4)
+
+    def test_rolling_stats(self):
+        random.seed(42)
+        for window in [1, 3, 10]:
+            stats = PriceStats(window, alpha=0.5)
+            prices = []
+            ewma = None
+            for _ in range(200):
+                # few distinct prices, so equal prices enter the window together
+                price = round(random.uniform(2, 10), 0)
+                prices.append(price)
+                stats.add(price)
+                ewma = price if ewma is None else 0.5 * price + 0.5 * ewma
+                last = prices[-window:]
+                self.assertAlmostEqual(stats.mean(), sum(last) / len(last))
+                self.assertEqual(stats.min(), min(last))
+                self.assertEqual(stats.max(), max(last))
+                self.assertAlmostEqual(stats.ewma, ewma)
+                self.assertLessEqual(len(stats.minima), window)
+                self.assertLessEqual(len(stats.maxima), window)
+            self.assertEqual(stats.count, 200)
+
+    def test_empty_stats(self):
+        stats = PriceStats()
+        self.assertIsNone(stats.ewma)
+        with self.assertRaises(ValueError):
+            stats.mean()
+        with self.assertRaises(ValueError):
+            stats.min()
+        with self.assertRaises(ValueError):
+            stats.max()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,7 +3,7 @@ from game import MultiplayerGame, SoloGame
 from player import PLAYER_NAMES, Player
 from random_gen import RandomGen
 from cave import Cave
-from trader import HardTrader, RandomTrader, RangeTrader
+from trader import HardTrader, RandomTrader, RangeTrader, Trader
 from material import Material
 import unittest
 
@@ -140,6 +140,76 @@ class TestGame(unittest.TestCase):
             g.simulate_day()
             g.finish_day()
 
+    def test_multiplayer_ties(self):
+        RandomGen.set_seed(16)
+        gold = Material("Gold Nugget", 27.24)
+        orson = RandomTrader("Orson Hoover")
+        orson.add_material(gold)
+        caves = [Cave(name, gold, 3) for name in ["A Cave", "B Cave", "C Cave"]]
+        g = MultiplayerGame()
+        g.initialise_with_data([gold], caves, [orson], ["Alex", "Steve", "Jackson"], [50, 60, 70])
+        orson.active_deal = (gold, 7.70)
+
+        # the caves earn the same, so they are taken in the order they are listed
+        _, _, chosen = g.select_for_players(Food("Cooked Chicken Cuts", 424, 19))
+        self.assertEqual([cave.get_name() for cave, quantity in chosen], ["A Cave", "B Cave", "C Cave"])
+
+    def test_fair_rotation(self):
+        RandomGen.set_seed(16)
+        gold = Material("Gold Nugget", 27.24)
+        orson = RandomTrader("Orson Hoover")
+        orson.add_material(gold)
+        g = MultiplayerGame(fair_rotation=True)
+        g.initialise_with_data([gold], [Cave("Glacial Cave", gold, 3)], [orson], ["Alex", "Steve", "Jackson"], [50, 60, 70])
+
+        names = lambda: [player.name for player in g.get_players()]
+        self.assertEqual(names(), ["Alex", "Steve", "Jackson"])
+        g.simulate_day()
+        g.finish_day()
+        self.assertEqual(names(), ["Steve", "Jackson", "Alex"])
+        g.simulate_day()
+        g.finish_day()
+        self.assertEqual(names(), ["Jackson", "Alex", "Steve"])
+
+    def test_deal_history(self):
+        RandomGen.set_seed(16)
+        gold = Material("Gold Nugget", 27.24)
+        orson = RandomTrader("Orson Hoover")
+        orson.add_material(gold)
+        g = MultiplayerGame()
+        g.initialise_with_data([gold], [Cave("Glacial Cave", gold, 3)], [orson], ["Alex", "Steve"], [50, 60])
+
+        prices = []
+        for _ in range(Trader.HISTORY_SIZE + 5):
+            g.simulate_day()
+            prices.append(orson.current_deal()[1])
+            g.finish_day()
+        self.assertEqual(g.day, len(prices))
+        self.assertEqual(len(orson.history), Trader.HISTORY_SIZE)
+        self.assertEqual([deal.price for deal in orson.history], prices[-Trader.HISTORY_SIZE:])
+        self.assertEqual(orson.history.latest().day, g.day)
+        stats = g.price_stats[gold.get_name()]
+        self.assertEqual(stats.count, len(prices))
+        self.assertEqual(stats.max(), max(prices[-stats.WINDOW:]))
+
+    def test_deal_seed(self):
+        deals = []
+        for seed in [16, 17]:
+            RandomGen.set_seed(seed)
+            gold, netherite = Material("Gold Nugget", 27.24), Material("Netherite Ingot", 20.95)
+            orson = RandomTrader("Orson Hoover")
+            orson.set_all_materials([gold, netherite])
+            g = MultiplayerGame(deal_seed=1234)
+            g.initialise_with_data([gold, netherite], [Cave("Glacial Cave", gold, 3)], [orson], ["Alex", "Steve"], [50, 60])
+            day_deals = []
+            for _ in range(3):
+                g.simulate_day()
+                day_deals.append((orson.current_deal()[0].name, orson.current_deal()[1]))
+                g.finish_day()
+            deals.append(day_deals)
+        # the deals only depend on deal_seed, not on the state of RandomGen
+        self.assertEqual(deals[0], deals[1])
+
 if __name__ == '__main__':
     # seeding the pseudo-random generator
     RandomGen.set_seed(16)
@@ -0,0 +1,59 @@
+"""
+    Unit test for HashSet, implemented via inheritance from TestSet.
+"""
+from test_set import *
+from hash_set import *
+from aset import ASet
+
+
+class TestHashSet(TestSet):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.SetType = HashSet
+
+    def test_grows(self):
+        s = self.SetType(1)
+        for i in range(1000):
+            s.add(i)
+        self.assertEqual(len(s), 1000)
+        for i in range(1000):
+            self.assertTrue(i in s)
+        self.assertFalse(1000 in s)
+
+    def test_remove_keeps_probe_chains(self):
+        # all these strings collide often in a small table
+        s = self.SetType(4)
+        items = ["k{0}".format(i) for i in range(200)]
+        for item in items:
+            s.add(item)
+        for item in items[::2]:
+            s.remove(item)
+        for i, item in enumerate(items):
+            self.assertEqual(item in s, i % 2 == 1)
+        with self.assertRaises(KeyError):
+            s.remove(items[0])
+        self.assertEqual(len(s), 100)
+
+    def test_mixed_with_aset(self):
+        other = ASet(5)
+        for i in [1, 2, 3]:
+            other.add(i)
+        s = self.SetType()
+        for i in [2, 3, 4]:
+            s.add(i)
+        self.assertEqual(sorted(s.union(other)), [1, 2, 3, 4])
+        self.assertEqual(sorted(s.intersection(other)), [2, 3])
+        self.assertEqual(sorted(s.difference(other)), [4])
+
+    def test_none(self):
+        s = self.SetType()
+        self.assertFalse(None in s)
+        with self.assertRaises(ValueError):
+            s.add(None)
+
+
+if __name__ == '__main__':
+    testtorun = TestHashSet()
+    suite = unittest.TestLoader().loadTestsFromModule(testtorun)
+    unittest.TextTestRunner().run(suite)
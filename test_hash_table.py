@@ -47,6 +47,14 @@ class TestHashTable(unittest.TestCase):
         self.assertGreaterEqual(probe_max, 3)    # Jon: 3  + Whatever rehash caused
         self.assertEqual(rehash, 1)              # 1 rehash
 
+    def test_keys_values(self):
+        table = LinearProbeTable(10)
+        self.assertEqual(len(table.keys()), 0)
+        for name in "Eva, Amy, Tim".split(", "):
+            table[name] = name + "-value"
+        self.assertEqual(sorted(table.keys()), ["Amy", "Eva", "Tim"])
+        self.assertEqual(sorted(table.values()), ["Amy-value", "Eva-value", "Tim-value"])
+
 if __name__ == '__main__':
 
     # running all the tests
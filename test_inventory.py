@@ -0,0 +1,64 @@
+"""
+Tests the swap-remove inventory.
+"""
+
+from inventory import Inventory
+from material import Material
+import unittest
+
+
+class TestInventory(unittest.TestCase):
+    """ Testing Inventory functionality. """
+
+    def setUp(self):
+        self.materials = [Material(name, rate) for name, rate in
+                          [("Coal", 4.5), ("Diamond", 3), ("Redstone", 20), ("Gold", 9)]]
+
+    def test_add_and_contains(self):
+        inventory = Inventory(self.materials[:3])
+        self.assertEqual(len(inventory), 3)
+        self.assertEqual(list(inventory), self.materials[:3])
+        self.assertIn(self.materials[1], inventory)
+        self.assertNotIn(self.materials[3], inventory)
+        # materials are distinguished by identity, not by name
+        self.assertNotIn(Material("Coal", 4.5), inventory)
+        inventory.append(self.materials[0])
+        self.assertEqual(len(inventory), 3)
+        inventory.append(self.materials[3])
+        self.assertEqual(inventory[3], self.materials[3])
+        self.assertEqual(inventory.index(self.materials[3]), 3)
+
+    def test_swap_remove(self):
+        coal, diamond, redstone, gold = self.materials
+        inventory = Inventory(self.materials)
+        inventory.remove(diamond)
+        # the last material takes the place of the removed one
+        self.assertEqual(list(inventory), [coal, gold, redstone])
+        for position, material in enumerate(inventory):
+            self.assertEqual(inventory.index(material), position)
+        inventory.remove(redstone)
+        self.assertEqual(list(inventory), [coal, gold])
+        with self.assertRaises(ValueError):
+            inventory.remove(redstone)
+        with self.assertRaises(ValueError):
+            inventory.index(diamond)
+        inventory.remove(coal)
+        inventory.remove(gold)
+        self.assertEqual(len(inventory), 0)
+        inventory.clear()
+        self.assertEqual(str(inventory), "[]")
+
+    def test_order_is_deterministic(self):
+        orders = []
+        for _ in range(2):
+            inventory = Inventory(self.materials)
+            inventory.remove(self.materials[0])
+            inventory.append(self.materials[0])
+            inventory.remove(self.materials[2])
+            orders.append([material.name for material in inventory])
+        self.assertEqual(orders[0], orders[1])
+        self.assertEqual(orders[0], ["Gold", "Diamond", "Coal"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,176 @@
+"""
+Tests the market of best prices against a scan of the traders' deals.
+"""
+
+from market import Market
+from material import Material
+from random_gen import RandomGen
+from trader import RandomTrader
+import random
+import unittest
+
+
+class TestMarket(unittest.TestCase):
+    """ Testing Market functionality. """
+
+    def setUp(self):
+        random.seed(42)
+        RandomGen.set_seed(42)
+        self.materials = [Material(name, rate) for name, rate in
+                          [("Gold Nugget", 27.24), ("Netherite Ingot", 20.95), ("Fishing Rod", 26.93)]]
+        self.traders = []
+        for i in range(30):
+            trader = RandomTrader("Trader {0}".format(i))
+            trader.set_all_materials(self.materials)
+            self.traders.append(trader)
+
+    def best_prices(self) -> dict:
+        """ The best price of every material, by scanning all the deals. """
+        best = {}
+        for trader in self.traders:
+            if trader.active_deal is not None:
+                material, price = trader.active_deal
+                best[material.name] = max(price, best.get(material.name, price))
+        return best
+
+    def check(self, market: Market) -> None:
+        best = self.best_prices()
+        for material in self.materials:
+            if material.name in best:
+                self.assertEqual(market.best_price(material), best[material.name])
+                self.assertEqual(market.get_custom(material), best[material.name])
+            else:
+                with self.assertRaises(KeyError):
+                    market.best_price(material)
+
+    def test_follows_deals(self):
+        market = Market.for_traders(self.traders)
+        self.check(market)
+        for _ in range(300):
+            trader = random.choice(self.traders)
+            if random.random() < 0.3:
+                trader.stop_deal()
+            else:
+                trader.generate_deal()
+            self.check(market)
+        for trader in self.traders:
+            trader.stop_deal()
+        self.check(market)
+        self.assertEqual(market.heaps, {})
+
+    def test_for_traders(self):
+        market = Market.for_traders(self.traders)
+        self.assertIs(Market.for_traders(list(self.traders)), market)
+
+        # a different set of traders gets its own market, and stays in the old one
+        subset = self.traders[:10]
+        for trader in self.traders:
+            trader.generate_deal()
+        other = Market.for_traders(subset)
+        self.assertIsNot(other, market)
+        self.assertIs(Market.for_traders(subset), other)
+        self.assertEqual(market.trader_count, 30)
+        self.assertEqual(other.trader_count, 10)
+        self.assertTrue(all(set(trader.markets) == {market, other} for trader in subset))
+
+        for trader in self.traders:
+            trader.generate_deal()
+        self.check(market)
+        self.traders = subset
+        self.check(other)
+
+    def test_overlapping_traders(self):
+        a, b = self.traders[:2]
+        first = Market.for_traders([a, b])
+        second = Market.for_traders([a])
+        gold = self.materials[0]
+        for trader in (a, b):
+            trader.stop_deal()
+            trader.set_all_materials([gold])
+            trader.generate_deal()
+        self.assertEqual(first.best_price(gold), max(a.active_deal[1], b.active_deal[1]))
+        self.assertEqual(second.best_price(gold), a.active_deal[1])
+        b.stop_deal()
+        self.assertEqual(first.best_price(gold), a.active_deal[1])
+        self.assertEqual(set(first.traders_stocking(gold)), {a, b})
+        self.assertEqual(second.traders_stocking(gold), [a])
+
+        # a market nothing refers to any more is dropped from the traders' sets
+        del second
+        self.assertEqual(set(a.markets), {first})
+
+    def test_version_and_price_table(self):
+        market = Market.for_traders(self.traders)
+        for trader in self.traders:
+            trader.generate_deal()
+        version = market.version
+        table = market.price_table()
+        self.assertIs(market.price_table(), table)
+        self.assertEqual(table, self.best_prices())
+        self.assertEqual(market.version, version)
+
+        self.traders[0].stop_deal()
+        self.assertGreater(market.version, version)
+        self.assertIsNot(market.price_table(), table)
+        self.assertEqual(market.price_table(), self.best_prices())
+        self.check(market)
+
+    def check_stock(self, market: Market) -> None:
+        for material in self.materials:
+            expected = {trader for trader in self.traders if trader.has_material(material)}
+            self.assertEqual(set(market.traders_stocking(material)), expected)
+            self.assertEqual(len(market.traders_stocking(material)), len(expected))
+            buying = market.traders_buying(material)
+            self.assertEqual(set(buying), {trader for trader in self.traders
+                                           if trader.active_deal is not None and trader.active_deal[0] is material})
+            if buying:
+                self.assertEqual(buying[0].active_deal[1], market.best_price(material))
+            prices = [trader.active_deal[1] for trader in buying]
+            self.assertEqual(prices, sorted(prices, reverse=True))
+
+    def test_material_index(self):
+        market = Market.for_traders(self.traders)
+        self.check_stock(market)
+        gold, netherite, fishing_rod = self.materials
+        for i, trader in enumerate(self.traders):
+            if i % 3 == 0:
+                trader.remove_material(gold)
+            elif i % 3 == 1:
+                trader.set_all_materials([fishing_rod])
+            trader.generate_deal()
+        self.check_stock(market)
+        self.assertEqual(len(market.traders_stocking(gold)), 10)
+        self.traders[0].add_material(gold)
+        self.traders[0].add_material(gold)
+        self.assertEqual(len(market.traders_stocking(gold)), 11)
+        self.check_stock(market)
+
+        # traders attached to another market report their inventory to both
+        subset = self.traders[:10]
+        other = Market.for_traders(subset)
+        for trader in subset:
+            if trader.has_material(netherite):
+                trader.remove_material(netherite)
+        self.check_stock(market)
+        traders, self.traders = self.traders, subset
+        self.check_stock(other)
+        self.traders = traders
+        # a different material of the same name is stocked separately, as in the inventories
+        twin = Material(gold.name, gold.mining_rate)
+        trader = traders[0]
+        trader.add_material(twin)
+        self.assertEqual(market.traders_stocking(twin), [trader])
+        trader.remove_material(gold)
+        self.assertEqual(market.traders_stocking(twin), [trader])
+        self.assertNotIn(trader, market.traders_stocking(gold))
+        trader.remove_material(twin)
+        self.check_stock(market)
+
+        for trader in self.traders:
+            trader.set_all_materials([])
+        self.assertEqual(market.stock, {})
+        self.assertEqual(market.traders_stocking(gold), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,9 @@
 from random_gen import RandomGen
 from player import Player
+from cave import Cave
+from food import Food
+from material import Material
+from trader import RandomTrader
 import unittest
 
 
@@ -16,6 +20,28 @@ class TestPlayer(unittest.TestCase):
         except Exception:
             raise AssertionError("Unable to instantiate player with correct inputs")
 
+    def test_efficiency_cache(self):
+        RandomGen.set_seed(16)
+        gold, netherite = Material("Gold Nugget", 27.24), Material("Netherite Ingot", 20.95)
+        orson = RandomTrader("Orson Hoover")
+        orson.set_all_materials([gold, netherite])
+        player = Player("Steve", 50)
+        player.set_traders([orson])
+        player.set_caves([Cave("Glacial Cave", gold, 3), Cave("Boulderfall Cave", netherite, 10)])
+        player.set_foods([Food("Cabbage Seeds", 106, 30)])
+
+        orson.generate_deal()
+        choice = player.select_food_and_caves()
+        columns = player._efficiency_cache[-1]
+        self.assertEqual(player.select_food_and_caves(), choice)
+        self.assertIs(player._efficiency_cache[-1], columns)
+
+        # a new deal changes the market version, so the caves are sorted again
+        orson.generate_deal()
+        player.select_food_and_caves()
+        self.assertIsNot(player._efficiency_cache[-1], columns)
+        self.assertEqual(len(player._efficiency_cache[-1][0]), 1)
+
 
 if __name__ == '__main__':
     # seeding the pseudo-random generator
@@ -0,0 +1,68 @@
+"""
+Tests weighted sampling with alias tables and sampling without replacement.
+"""
+
+from random_gen import AliasTable, RandomGen
+import unittest
+
+
+class TestRandomGen(unittest.TestCase):
+    """ Testing AliasTable and RandomGen sampling. """
+
+    def test_equal_weights_match_random_choice(self):
+        items = ["a", "b", "c", "d", "e"]
+        table = AliasTable(items, [2] * 5)
+        RandomGen.set_seed(16)
+        expected = [RandomGen.random_choice(items) for _ in range(200)]
+        RandomGen.set_seed(16)
+        self.assertEqual([table.draw() for _ in range(200)], expected)
+
+    def test_probabilities(self):
+        weights = [0, 1, 2, 3, 4, 10]
+        table = AliasTable(list(range(6)), weights)
+        # every column splits between its item and its alias as the weights require
+        mass = [0.0] * 6
+        for column in range(6):
+            mass[column] += table.thresholds[column] / table.total
+            mass[table.aliases[column]] += 1 - table.thresholds[column] / table.total
+        for item, weight in enumerate(weights):
+            self.assertAlmostEqual(mass[item] / 6, weight / sum(weights))
+
+        RandomGen.set_seed(42)
+        counts = [0] * 6
+        for _ in range(20000):
+            counts[table.draw()] += 1
+        self.assertEqual(counts[0], 0)
+        for item, weight in enumerate(weights):
+            self.assertAlmostEqual(counts[item] / 20000, weight / sum(weights), delta=0.015)
+
+    def test_invalid_weights(self):
+        with self.assertRaises(ValueError):
+            AliasTable([1, 2], [1])
+        with self.assertRaises(ValueError):
+            AliasTable([1, 2], [1, -1])
+        with self.assertRaises(ValueError):
+            AliasTable([1, 2], [0, 0])
+        RandomGen.set_seed(16)
+        self.assertEqual(RandomGen.weighted_choice(["x", "y"], [0, 5]), "y")
+
+    def test_random_sample(self):
+        RandomGen.set_seed(16)
+        population = range(100)
+        for k in [0, 1, 10, 100]:
+            sample = RandomGen.random_sample(population, k)
+            self.assertEqual(len(sample), k)
+            self.assertEqual(len(set(sample)), k)
+            self.assertTrue(all(item in population for item in sample))
+        with self.assertRaises(ValueError):
+            RandomGen.random_sample(population, 101)
+        # every item turns up about as often, first or second
+        counts = [[0] * 5, [0] * 5]
+        for _ in range(5000):
+            for position, item in enumerate(RandomGen.random_sample("abcde", 2)):
+                counts[position]["abcde".index(item)] += 1
+        self.assertTrue(all(850 < count < 1150 for row in counts for count in row))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+"""
+Tests the bulk operations of the referential array and the lists built on it.
+"""
+
+from referential_array import ArrayR, ArrayRView, LazyArrayR
+from array_list import ArrayList
+import unittest
+
+
+class TestArrayR(unittest.TestCase):
+    """ Testing ArrayR bulk functionality. """
+
+    def setUp(self):
+        self.array = ArrayR(8)
+        for i in range(8):
+            self.array[i] = i
+
+    def test_move_range_right(self):
+        self.array.move_range(2, 3, 4)
+        self.assertEqual([self.array[i] for i in range(8)], [0, 1, 2, 2, 3, 4, 5, 7])
+
+    def test_move_range_left(self):
+        self.array.move_range(3, 1, 5)
+        self.assertEqual([self.array[i] for i in range(8)], [0, 3, 4, 5, 6, 7, 6, 7])
+
+    def test_copy_from(self):
+        other = ArrayR(4)
+        other.copy_from(self.array, 5, 1, 3)
+        self.assertEqual([other[i] for i in range(4)], [None, 5, 6, 7])
+        other.copy_from(["a", "b"], 0, 0, 2)
+        self.assertEqual([other[i] for i in range(4)], ["a", "b", 6, 7])
+
+    def test_fill(self):
+        self.array.fill(None, 2, 5)
+        self.assertEqual([self.array[i] for i in range(8)], [0, 1, None, None, None, 5, 6, 7])
+        self.array.fill(-1)
+        self.assertEqual([self.array[i] for i in range(8)], [-1] * 8)
+
+    def test_view(self):
+        view = self.array.view(2, 5)
+        self.assertIsInstance(view, ArrayRView)
+        self.assertEqual(len(view), 3)
+        self.assertEqual(list(view), [2, 3, 4])
+        self.assertEqual(view[-1], 4)
+        with self.assertRaises(IndexError):
+            _ = view[3]
+        # writes go through to the backing array
+        view[0] = "x"
+        self.assertEqual(self.array[2], "x")
+        # and writes to the backing array are seen through the view, nothing was copied
+        self.array[3] = "y"
+        self.assertEqual(view[1], "y")
+        self.assertIs(view.array, self.array)
+        inner = view.view(1, 3)
+        self.assertEqual(list(inner), ["y", 4])
+        self.assertIs(inner.array, self.array)
+        self.assertEqual(inner.offset, 3)
+        with self.assertRaises(IndexError):
+            view.view(2, 4)
+        with self.assertRaises(IndexError):
+            self.array.view(5, 9)
+
+    def test_view_resize(self):
+        view = self.array.view(6, 6)
+        self.assertEqual(len(view), 0)
+        self.assertEqual(view.capacity(), 2)
+        view.resize(2)
+        self.assertEqual(list(view), [6, 7])
+        with self.assertRaises(ValueError):
+            view.resize(3)
+
+    def test_lazy_array(self):
+        lazy = LazyArrayR(5)
+        self.assertEqual(len(lazy), 5)
+        self.assertIsNone(lazy[3])
+        lazy[1] = "a"
+        self.assertEqual(lazy[0:3], [None, "a", None])
+        lazy.move_range(0, 2, 3)
+        self.assertEqual([lazy[i] for i in range(5)], [None, "a", None, "a", None])
+        with self.assertRaises(IndexError):
+            _ = lazy[5]
+        with self.assertRaises(ValueError):
+            LazyArrayR(0)
+
+    def test_list_shifts(self):
+        items = ArrayList(0)
+        for i in range(20):
+            items.append(i)
+        items.insert(0, -1)
+        items.insert(10, 100)
+        items.delete_at_index(5)
+        items.remove(100)
+        self.assertEqual([items[i] for i in range(len(items))], [-1, 0, 1, 2, 3] + list(range(5, 20)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+"""
+Tests the skip list sorted map against Python's sorted lists.
+"""
+
+from skip_list import SkipList
+from random_gen import RandomGen
+import random
+import unittest
+
+
+class TestSkipList(unittest.TestCase):
+    """ Testing SkipList functionality. """
+
+    def setUp(self):
+        random.seed(38)
+        RandomGen.set_seed(38)
+        self.keys = random.sample(range(1000), 300)
+        self.skip_list = SkipList()
+        for key in self.keys:
+            self.skip_list[key] = str(key)
+
+    def test_get_set(self):
+        self.assertEqual(len(self.skip_list), 300)
+        self.assertEqual(list(self.skip_list), sorted(self.keys))
+        for key in self.keys:
+            self.assertIn(key, self.skip_list)
+            self.assertEqual(self.skip_list[key], str(key))
+        self.assertNotIn(1000, self.skip_list)
+        with self.assertRaises(KeyError):
+            self.skip_list[1000]
+        with self.assertRaises(ValueError):
+            self.skip_list[self.keys[0]] = 'again'
+
+    def test_delete(self):
+        remaining = sorted(self.keys)
+        for key in self.keys[:200]:
+            del self.skip_list[key]
+            remaining.remove(key)
+        self.assertEqual(list(self.skip_list), remaining)
+        self.assertEqual(len(self.skip_list), 100)
+        with self.assertRaises(ValueError):
+            del self.skip_list[self.keys[0]]
+        for key in self.keys[200:]:
+            del self.skip_list[key]
+        self.assertTrue(self.skip_list.is_empty())
+        self.skip_list[5] = 'five'
+        self.assertEqual(self.skip_list.kth_key(0), 5)
+
+    def test_rank_and_select(self):
+        for key in self.keys[:150]:
+            del self.skip_list[key]
+        remaining = sorted(self.keys[150:])
+        for index, key in enumerate(remaining):
+            self.assertEqual(self.skip_list.rank(key), index)
+            self.assertEqual(self.skip_list.kth_key(index), key)
+        self.assertEqual(self.skip_list.rank(-1), 0)
+        self.assertEqual(self.skip_list.rank(1000), len(remaining))
+        with self.assertRaises(IndexError):
+            self.skip_list.kth_key(len(remaining))
+
+    def test_ranges(self):
+        ordered = sorted(self.keys)
+        self.assertEqual(self.skip_list.range_between(10, 20), [str(key) for key in ordered[10:21]])
+        self.assertEqual(self.skip_list.range_between(290, 400), [str(key) for key in ordered[290:]])
+        self.assertEqual(self.skip_list.range_by_key(100, 200),
+                         [(key, str(key)) for key in ordered if 100 <= key <= 200])
+
+    def test_reproducible(self):
+        RandomGen.set_seed(38)
+        other = SkipList()
+        for key in self.keys:
+            other[key] = str(key)
+        self.assertEqual(other.levels, self.skip_list.levels)
+        node, other_node = self.skip_list.head.next[0], other.head.next[0]
+        while node is not None:
+            self.assertEqual(len(node.next), len(other_node.next))
+            node, other_node = node.next[0], other_node.next[0]
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,5 @@
 from random_gen import RandomGen
-from trader import RandomTrader, RangeTrader, HardTrader
+from trader import RandomTrader, RangeTrader, HardTrader, Trader
 from material import Material
 import unittest
 
@@ -157,6 +157,61 @@ class TestTraders(unittest.TestCase):
         # check that the deal matches
         self.assertEqual(str(rando), "<HardTrader: Mr Barnes buying [Gunpowder: 8🍗/💎] for 2.01💰>", "Deal check failed")
 
+    def test_range_index_follows_inventory(self):
+        RandomGen.set_seed(16)
+        materials = [Material(name, rate) for name, rate in [("Coal", 4.5), ("Diamond", 3), ("Redstone", 20), ("Gold", 9)]]
+        rando = RangeTrader("Mr Barnes")
+        rando.set_all_materials(materials[:3])
+        self.assertEqual([m.name for m in rando.materials_between(0, 2)], ["Diamond", "Coal", "Redstone"])
+
+        rando.add_material(materials[3])
+        rando.remove_material(materials[0])
+        self.assertEqual([m.name for m in rando.materials_between(0, 2)], ["Diamond", "Gold", "Redstone"])
+        self.assertEqual(len(rando.material_index), 3)
+
+        for _ in range(20):
+            rando.generate_deal()
+            self.assertIn(rando.current_deal()[0], materials[1:])
+
+    def test_range_rejects_equal_rates(self):
+        RandomGen.set_seed(16)
+        coal, diamond = Material("Coal", 4.5), Material("Diamond", 3)
+        rando = RangeTrader("Mr Barnes")
+        rando.set_all_materials([coal, diamond])
+        with self.assertRaises(ValueError):
+            rando.set_all_materials([coal, Material("Charcoal", 4.5)])
+        # the rejected list left the trader as it was
+        self.assertEqual(list(rando.material_list), [coal, diamond])
+        self.assertEqual(rando.materials_between(0, 1), [diamond, coal])
+        rando.generate_deal()
+        self.assertIn(rando.current_deal()[0], [coal, diamond])
+
+    def test_has_material(self):
+        materials = [Material(name, rate) for name, rate in [("Coal", 4.5), ("Diamond", 3), ("Redstone", 20)]]
+        for trader in [RandomTrader("Mr Barnes"), RangeTrader("Mr Barnes"), HardTrader("Mr Barnes")]:
+            trader.set_all_materials(materials[:2])
+            self.assertTrue(trader.has_material(materials[0]))
+            self.assertFalse(trader.has_material(materials[2]))
+            trader.add_material(materials[2])
+            trader.add_material(materials[2])
+            self.assertEqual(len(trader.material_list), 3)
+            trader.remove_material(materials[0])
+            self.assertFalse(trader.has_material(materials[0]))
+            with self.assertRaises(ValueError):
+                trader.remove_material(materials[0])
+
+    def test_type_weights(self):
+        RandomGen.set_seed(16)
+        try:
+            Trader.set_type_weights(0, 1, 3)
+            types = [type(Trader.random_trader()) for _ in range(2000)]
+            self.assertNotIn(RandomTrader, types)
+            self.assertAlmostEqual(types.count(HardTrader) / len(types), 0.75, delta=0.04)
+            with self.assertRaises(ValueError):
+                Trader.set_type_weights(0, 0, 0)
+        finally:
+            Trader.set_type_weights()
+
 
 if __name__ == '__main__':
     # seeding the pseudo-random generator
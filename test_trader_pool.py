@@ -0,0 +1,128 @@
+"""
+Tests that pooled traders behave as the traders they stand for.
+"""
+
+from deal_engine import generate_all_deals
+from game import SoloGame
+from market import Market
+from material import Material
+from random_gen import RandomGen
+from trader import RandomTrader, RangeTrader, HardTrader, Trader
+from trader_pool import TraderPool, TraderProxy
+from cave import Cave
+import unittest
+
+
+class TestTraderPool(unittest.TestCase):
+    """ Testing TraderPool and TraderProxy functionality. """
+
+    def setUp(self):
+        self.materials = [Material("Material {0}".format(i), i + 0.5) for i in range(12)]
+
+    def make_pair(self):
+        """ The same traders, as objects and in a pool. """
+        RandomGen.set_seed(7)
+        traders, pool = [], TraderPool()
+        for i in range(60):
+            trader_type = [RandomTrader, RangeTrader, HardTrader][i % 3]
+            low = RandomGen.randint(0, 6)
+            mats = self.materials[low:low + RandomGen.randint(1, 6)]
+            traders.append(trader_type("Trader {0}".format(i)))
+            traders[-1].set_all_materials(mats)
+            pool.add(trader_type, "Trader {0}".format(i)).set_all_materials(mats)
+        return traders, pool
+
+    def deals(self, traders) -> list:
+        return [str(trader) for trader in traders]
+
+    def test_same_deals(self):
+        traders, pool = self.make_pair()
+        proxies = list(pool)
+        for day in range(4):
+            RandomGen.set_seed(day)
+            generate_all_deals(traders)
+            RandomGen.set_seed(day)
+            generate_all_deals(proxies)
+            self.assertEqual(self.deals(proxies), self.deals(traders))
+            for trader, proxy in zip(traders, proxies):
+                self.assertIs(proxy.current_deal()[0], trader.current_deal()[0])
+            # change the inventories the same way
+            for trader in traders + proxies:
+                material = trader.material_list[0]
+                trader.remove_material(material)
+                trader.add_material(self.materials[(day * 5) % 12])
+                trader.add_material(material)
+            self.assertEqual([[m.name for m in t.material_list] for t in proxies],
+                             [[m.name for m in t.material_list] for t in traders])
+
+    def test_trader_api(self):
+        pool = TraderPool()
+        proxy = pool.add(RandomTrader, "Mr Barnes")
+        self.assertIsInstance(proxy, Trader)
+        self.assertEqual(proxy, pool[0])
+        self.assertEqual(hash(proxy), hash(pool[-1]))
+        self.assertEqual(str(proxy), "<RandomTrader: Mr Barnes buying None for None💰>")
+        self.assertFalse(proxy.is_currently_selling())
+        with self.assertRaises(ValueError):
+            proxy.current_deal()
+        proxy.add_material(self.materials[0])
+        proxy.add_material(self.materials[0])
+        self.assertEqual(len(proxy.material_list), 1)
+        self.assertTrue(proxy.has_material(self.materials[0]))
+        self.assertFalse(proxy.has_material(self.materials[1]))
+        with self.assertRaises(ValueError):
+            proxy.remove_material(self.materials[1])
+        proxy.generate_deal()
+        self.assertTrue(pool[0].is_currently_selling())
+        proxy.record_deal(1)
+        self.assertEqual(pool[0].history.latest().material, self.materials[0])
+        proxy.stop_deal()
+        self.assertIsNone(pool[0].active_deal)
+        with self.assertRaises(IndexError):
+            pool[1]
+        with self.assertRaises(ValueError):
+            pool.add(TraderProxy, "Mr Barnes")
+        self.assertFalse(hasattr(proxy, '__dict__'))
+
+    def test_range_rates(self):
+        twin = Material("Twin", self.materials[0].mining_rate)
+        pool = TraderPool()
+        for trader in [RangeTrader("Mr Barnes"), pool.add(RangeTrader, "Mr Barnes")]:
+            with self.assertRaises(ValueError):
+                trader.set_all_materials([self.materials[0], twin])
+            trader.set_all_materials([self.materials[0], self.materials[0], self.materials[1]])
+            with self.assertRaises(ValueError):
+                trader.add_material(twin)
+            trader.add_material(self.materials[0])
+        # other types do not rank their materials, so may hold equal rates
+        proxy = pool.add(HardTrader, "Mr Barnes")
+        proxy.set_all_materials([self.materials[0], twin])
+        self.assertEqual(len(proxy.material_list), 2)
+
+    def test_market(self):
+        traders, pool = self.make_pair()
+        proxies = list(pool)
+        market = Market.for_traders(proxies)
+        self.assertIs(Market.for_traders(list(pool)), market)
+        RandomGen.set_seed(3)
+        generate_all_deals(proxies)
+        for material in self.materials:
+            buying = [p for p in proxies if p.active_deal is not None and p.active_deal[0] is material]
+            if buying:
+                self.assertEqual(market.best_price(material), max(p.active_deal[1] for p in buying))
+            self.assertEqual(set(market.traders_stocking(material)),
+                             {p for p in proxies if p.has_material(material)})
+
+    def test_game(self):
+        RandomGen.set_seed(16)
+        gold = Material("Gold Nugget", 27.24)
+        pool = TraderPool()
+        pool.add(RandomTrader, "Orson Hoover").add_material(gold)
+        g = SoloGame()
+        g.initialise_with_data([gold], [Cave("Glacial Cave", gold, 3)], list(pool), ["Steve"], [50])
+        g.simulate_day()
+        self.assertIs(pool[0].current_deal()[0], gold)
+
+
+if __name__ == '__main__':
+    unittest.main()
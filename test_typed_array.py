@@ -0,0 +1,51 @@
+"""
+Tests the typed numeric array.
+"""
+
+from typed_array import TypedArray, numpy
+import unittest
+
+
+class TestTypedArray(unittest.TestCase):
+    """ Testing TypedArray functionality. """
+
+    def test_init(self):
+        doubles = TypedArray(4)
+        self.assertEqual(len(doubles), 4)
+        self.assertEqual([doubles[i] for i in range(4)], [0.0] * 4)
+        with self.assertRaises(ValueError):
+            TypedArray(0)
+        with self.assertRaises(ValueError):
+            TypedArray(3, 'f')
+        for typecode in ['f', 'i']:
+            with self.assertRaises(ValueError):
+                TypedArray.from_iterable([1, 2], typecode)
+
+    def test_get_set(self):
+        ints = TypedArray(3, 'q')
+        ints[1] = 7
+        self.assertEqual(ints[1], 7)
+        with self.assertRaises(TypeError):
+            ints[0] = 1.5
+        with self.assertRaises(IndexError):
+            ints[3] = 1
+
+    def test_bulk(self):
+        doubles = TypedArray.from_iterable([1.5, 2.5, 3.5, 4.5])
+        doubles.move_range(0, 1, 3)
+        self.assertEqual(list(doubles.array), [1.5, 1.5, 2.5, 3.5])
+        doubles.fill(0.25, 2)
+        self.assertEqual(list(doubles.array), [1.5, 1.5, 0.25, 0.25])
+        doubles.copy_from([9, 8], 0, 0, 2)
+        self.assertEqual(list(doubles.view(0, 3)), [9.0, 8.0, 0.25])
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_as_numpy(self):
+        doubles = TypedArray.from_iterable([1.0, 2.0, 3.0])
+        column = doubles.as_numpy()
+        column *= 2
+        self.assertEqual(doubles[2], 6.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
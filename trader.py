@@ -1,10 +1,11 @@
 from __future__ import annotations
 from abc import abstractmethod, ABC
-from array_list import ArrayList
+from weakref import WeakSet
+from inventory import Inventory
 from avl import AVLTree
-from heap import MaxHeap
+from deal_history import DealHistory
 from material import Material
-from random_gen import RandomGen
+from random_gen import AliasTable, RandomGen
 """
 This file contains all the classes and methods for the trader functionality of the game.
 """
@@ -82,29 +83,97 @@ class Trader(ABC):
     implement the abstract base class functionality.
     It contains attributes and methods shared by all the extending trader classes.
 
+    The materials of a trader are kept in an Inventory, so checking whether the
+    trader handles a material, removing it and picking one at random are O(1).
+    Changes of inventory are reported to every market the trader is attached to,
+    which indexes the traders by material. The last HISTORY_SIZE deals of the
+    trader are kept in its history.
+
+    Every trader class declares __slots__, so traders, and the pooled traders
+    subclassing Trader, carry no attribute dictionary.
+
     :complexity: All functions, unless stated otherwise, have best/worst case complexity of O(1).
     """
 
+    __slots__ = ('name', 'material_list', 'markets', '_active_deal', 'history')
+
+    # number of RandomGen numbers a deal is computed from
+    RANDOM_DRAWS = 0
+
+    # number of past deals kept in the history
+    HISTORY_SIZE = 16
+
+    # the types random_trader chooses from, with their weights (set below the trader classes)
+    TYPE_TABLE = None
+
     def __init__(self, name: str) -> None:
         self.name = name
-        self.material_list = ArrayList(0)
+        self.material_list = Inventory()
+        self.markets = WeakSet()
         self.active_deal = None
+        self.history = DealHistory(self.HISTORY_SIZE)
+
+    def __getstate__(self) -> dict:
+        """
+        Gives the state of the trader to copy or pickle, e.g. to send it to
+        another process. The copy is not attached to the markets of the trader.
+        """
+        state = {}
+        for cls in type(self).__mro__:
+            for attribute in cls.__dict__.get('__slots__', ()):
+                if attribute != 'markets' and hasattr(self, attribute):
+                    state[attribute] = getattr(self, attribute)
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        """ Restores a copied or unpickled trader, attached to no market. """
+        for attribute, value in state.items():
+            setattr(self, attribute, value)
+        self.markets = WeakSet()
+
+    @property
+    def active_deal(self) -> tuple[Material, float] | None:
+        """ The active deal of the trader, or None. """
+        return self._active_deal
+
+    @active_deal.setter
+    def active_deal(self, deal: tuple[Material, float] | None) -> None:
+        """
+        Sets the active deal of the trader, and notifies the markets the trader is
+        attached to, so that every change of deal reaches them.
+
+        :complexity:
+            best/worst: O(log(T))
+                Where T is the number of traders attached to the market, for each market.
+        """
+        self._active_deal = deal
+        for market in self.markets:
+            market.update(self)
 
     @classmethod
     def random_trader(cls) -> Trader:
         """
-        Gives a random type of trader.
+        Gives a random type of trader, drawn from the mix of types set with set_type_weights.
+        By default the three types are equally likely.
 
             Returns: (Trader) A trader object of either one of the three trader types.
         """
         trader_name = RandomGen.random_choice(TRADER_NAMES)
-        random_int = RandomGen.randint(1, 3)
-        if random_int == 1:
-            return RandomTrader(trader_name)
-        if random_int == 2:
-            return RangeTrader(trader_name)
-        if random_int == 3:
-            return HardTrader(trader_name)
+        return Trader.TYPE_TABLE.draw()(trader_name)
+
+    @staticmethod
+    def set_type_weights(random_weight: float = 1, range_weight: float = 1, hard_weight: float = 1) -> None:
+        """
+        Sets how likely random_trader is to give each type of trader.
+
+            Params:
+                random_weight, range_weight, hard_weight (float): The relative weights
+                of RandomTrader, RangeTrader and HardTrader.
+
+            Raises: ValueError if a weight is negative or none is positive.
+        """
+        Trader.TYPE_TABLE = AliasTable([RandomTrader, RangeTrader, HardTrader],
+                                       [random_weight, range_weight, hard_weight])
 
     def set_all_materials(self, mats: list[Material]) -> None:
         """
@@ -116,30 +185,40 @@ class Trader(ABC):
 
             :complexity:
                 best/worst: O(N)
-                    Appending to an ArrayList is always O(1) complexity hence appending all elements
-                    from the given list is O(N).
+                    Where N is the number of materials passed in.
         """
-        self.material_list = ArrayList(0)
-        for material in mats:
-            self.material_list.append(material)
+        for market in self.markets:
+            for material in self.material_list:
+                market.remove_stock(self, material)
+        self.material_list = Inventory(mats)
+        for market in self.markets:
+            for material in self.material_list:
+                market.add_stock(self, material)
 
     def add_material(self, mat: Material) -> None:
         """
-        Adds a material to the trader's material list.
+        Adds a material to the trader's material list, unless the trader already has it.
 
             Params:
                 mat (Material): The material to be added.
         """
         self.material_list.append(mat)
+        for market in self.markets:
+            market.add_stock(self, mat)
 
     def remove_material(self, mat: Material) -> None:
         """
-        Removes a material to the trader's material list.
+        Removes a material from the trader's material list.
+        The last material of the list takes its place.
 
             Params:
                 mat (Material): The material to be removed.
+
+            Raises: ValueError if the trader does not have the material.
         """
         self.material_list.remove(mat)
+        for market in self.markets:
+            market.remove_stock(self, mat)
 
     def is_currently_selling(self) -> bool:
         """
@@ -151,6 +230,14 @@ class Trader(ABC):
             return True
         return False
 
+    def has_material(self, mat: Material) -> bool:
+        """
+        Checks if a material is in the trader's inventory.
+
+            Returns: (bool) True, if the trader has the material.
+        """
+        return mat in self.material_list
+
     def current_deal(self) -> tuple[Material, float]:
         """
         Gives the currently active deal of the trader.
@@ -161,10 +248,45 @@ class Trader(ABC):
             raise ValueError("No active deal!")
         return self.active_deal
 
-    @abstractmethod
     def generate_deal(self) -> None:
+        """
+        Generates a deal from the next RANDOM_DRAWS numbers of RandomGen.
+
+        :complexity: see deal_from_draws
+        """
+        self.active_deal = self.deal_from_draws(RandomGen.random_batch(self.RANDOM_DRAWS), 0)
+
+    @abstractmethod
+    def deal_from_draws(self, draws, offset: int) -> tuple[Material, float]:
+        """
+        Computes the deal the trader makes from RANDOM_DRAWS numbers of RandomGen,
+        starting at draws[offset]. The deal only depends on these numbers, so it is
+        the same whether they are drawn for this trader alone or in a batch.
+
+            Returns: (tuple) The material and its buying price.
+        """
         raise NotImplementedError()
 
+    @staticmethod
+    def buy_price_from_draw(draw: int) -> float:
+        """
+        Gives a random buying price between 2 and 10, from one number of RandomGen.
+
+            Returns: (float) The price, rounded to 2 decimals.
+        """
+        return round(2 + 8 * (draw / (1 << 32)), 2)
+
+    def record_deal(self, day: int) -> None:
+        """
+        Adds the active deal, if any, to the history of the trader.
+
+            Params:
+                day (int): The day the deal was made.
+        """
+        if self.active_deal is not None:
+            material, price = self.active_deal
+            self.history.add(day, material, price)
+
     def stop_deal(self) -> None:
         """
         Clears the active deal of the trader.
@@ -185,17 +307,20 @@ class RandomTrader(Trader):
     Extends the base Trader class and implements its own version of generate_deal.
     Trader's active deal is generated at random.
     """
+    __slots__ = ()
+    RANDOM_DRAWS = 2
+
     def __init__(self, name: str) -> None:
         Trader.__init__(self, name)
 
-    def generate_deal(self) -> None:
+    def deal_from_draws(self, draws, offset: int) -> tuple[Material, float]:
         """
-        Generates a deal with a random material (from the list of materials)
-        and a random buy price.
+        Computes a deal with a random material (from the list of materials)
+        and a random buy price, as RandomGen.random_choice and RandomGen.random_float would.
         """
-        random_material = RandomGen.random_choice(self.material_list)
-        buy_price = round(2 + 8 * RandomGen.random_float(), 2)
-        self.active_deal = (random_material, buy_price)
+        random_material = self.material_list[draws[offset] % len(self.material_list)]
+        buy_price = self.buy_price_from_draw(draws[offset + 1])
+        return (random_material, buy_price)
 
     def __str__(self) -> str:
         if self.active_deal is not None:
@@ -210,9 +335,60 @@ class RangeTrader(Trader):
     """
     Extends the base Trader class and implements its own version of generate_deal.
     Trader's active deal is generated based on a range of materials chosen based on difficulty.
+
+    The trader keeps its materials in an AVLTree keyed by mining rate, updated
+    whenever its inventory changes, so the material of a given rank is found in
+    O(log N) instead of rebuilding the tree for every deal. As before, the
+    materials of a RangeTrader must have different mining rates.
     """
+    __slots__ = ('material_index',)
+    RANDOM_DRAWS = 4
+
     def __init__(self, name: str) -> None:
         Trader.__init__(self, name)
+        self.material_index = AVLTree()
+
+    def set_all_materials(self, mats: list[Material]) -> None:
+        """
+        Clears the trader's inventory and puts in the list of materials passed in,
+        rebuilding the index of the materials by mining rate. The index is built
+        first, so a rejected list leaves the trader unchanged.
+
+        Raises: ValueError if two of the materials have the same mining rate.
+
+        :complexity:
+            best/worst: O(N*log(N))
+                Where N is the number of materials passed in.
+        """
+        material_index = AVLTree()
+        for material in Inventory(mats):
+            material_index[material.mining_rate] = material
+        Trader.set_all_materials(self, mats)
+        self.material_index = material_index
+
+    def add_material(self, mat: Material) -> None:
+        """
+        Adds a material to the trader's material list and to the index.
+
+        :complexity:
+            best/worst: O(log(N))
+                Where N is the size of the list of materials in the trader's inventory.
+        """
+        if self.has_material(mat):
+            return
+        self.material_index[mat.mining_rate] = mat
+        Trader.add_material(self, mat)
+
+    def remove_material(self, mat: Material) -> None:
+        """
+        Removes a material from the trader's material list and from the index.
+
+        :complexity:
+            best/worst: O(log(N))
+                Removing from the list is O(1), removing from the index is O(log(N)).
+        """
+        Trader.remove_material(self, mat)
+        del self.material_index[mat.mining_rate]
 
     def materials_between(self, i: int, j: int) -> list[Material]:
         """
@@ -226,31 +402,30 @@ class RangeTrader(Trader):
             Returns: (list) A list containing the materials.
 
         :complexity:
-            best/worst: O(N)
+            best/worst: O(j - i + log(N))
                 Where N is the size of the list of materials in the trader's inventory.
         """
-        avl_tree = AVLTree()
-        for material in self.material_list:
-            if material is not None:
-                avl_tree[material.mining_rate] = material
-        easy_materials = avl_tree.range_between(i, j)
-        return easy_materials
+        return self.material_index.range_between(i, j)
 
-    def generate_deal(self) -> None:
+    def deal_from_draws(self, draws, offset: int) -> tuple[Material, float]:
         """
-        Generates a deal with a random material in the materials list that
+        Computes a deal with a random material in the materials list that
         lies between the ith and jth easiest to mine, inclusive.
         A random buy price is selected.
+        Each number is used as RandomGen.randint would use it.
 
         :complexity:
-            best/worst: O(N)
+            best/worst: O(log(N))
                 Where N is the size of the list of materials in the trader's inventory.
+                Picking a random rank in [i, j] draws the same number as picking a random
+                element of materials_between(i, j), so deals are the same as with the list.
         """
-        i = RandomGen.randint(0, len(self.material_list) - 1)
-        j = RandomGen.randint(i, len(self.material_list) - 1)
-        random_material = RandomGen.random_choice(self.materials_between(i, j))
-        buy_price = round(2 + 8 * RandomGen.random_float(), 2)
-        self.active_deal = (random_material, buy_price)
+        n = len(self.material_list)
+        i = draws[offset] % n
+        j = draws[offset + 1] % (n - i) + i
+        random_material = self.material_index.kth_item(draws[offset + 2] % (j - i + 1) + i)
+        buy_price = self.buy_price_from_draw(draws[offset + 3])
+        return (random_material, buy_price)
 
     def __str__(self) -> str:
         if self.active_deal is not None:
@@ -265,28 +440,73 @@ class HardTrader(Trader):
     """
     Extends the base Trader class and implements its own version of generate_deal.
     Trader's active deal is generated based on the hardest to mine material in their inventory.
+
+    The hardest material is kept up to date as the inventory changes, so a deal
+    does not have to look through the inventory. Of several materials equally hard
+    to mine, the first one in the inventory is chosen.
     """
+    __slots__ = ('hardest_to_mine',)
+    RANDOM_DRAWS = 1
+
     def __init__(self, name: str) -> None:
         Trader.__init__(self, name)
+        self.hardest_to_mine = None
 
-    def generate_deal(self) -> None:
+    def _find_hardest(self) -> None:
         """
-        Generates a deal with the hardest to mine material and removes
-        it from the trader's inventory.
-        A random buy price is selected.
+        Looks through the inventory for the hardest to mine material.
 
         :complexity:
             best/worst: O(N)
                 Where N is the size of the list of materials in the trader's inventory.
         """
-        material_heap = MaxHeap(len(self.material_list))
+        self.hardest_to_mine = None
         for material in self.material_list:
-            if material is not None:
-                material_heap.add((material, material.mining_rate))
-        hardest_to_mine = material_heap.get_max()
+            if self.hardest_to_mine is None or material.mining_rate > self.hardest_to_mine.mining_rate:
+                self.hardest_to_mine = material
 
-        buy_price = round(2 + 8 * RandomGen.random_float(), 2)
-        self.active_deal = (hardest_to_mine[0], buy_price)
+    def set_all_materials(self, mats: list[Material]) -> None:
+        """
+        Clears the trader's inventory and puts in the list of materials passed in.
+
+        :complexity:
+            best/worst: O(N)
+                Where N is the number of materials passed in.
+        """
+        Trader.set_all_materials(self, mats)
+        self._find_hardest()
+
+    def add_material(self, mat: Material) -> None:
+        """
+        Adds a material to the trader's material list.
+        """
+        Trader.add_material(self, mat)
+        if self.hardest_to_mine is None or mat.mining_rate > self.hardest_to_mine.mining_rate:
+            self.hardest_to_mine = mat
+
+    def remove_material(self, mat: Material) -> None:
+        """
+        Removes a material from the trader's material list.
+
+        :complexity:
+            best/worst: O(1) unless the hardest material is removed, O(N) if it is
+                Where N is the size of the list of materials in the trader's inventory.
+        """
+        Trader.remove_material(self, mat)
+        if mat is self.hardest_to_mine:
+            self._find_hardest()
+
+    def deal_from_draws(self, draws, offset: int) -> tuple[Material, float]:
+        """
+        Computes a deal with the hardest to mine material.
+        A random buy price is selected.
+
+        :raises IndexError: if the trader has no material
+        """
+        if self.hardest_to_mine is None:
+            raise IndexError('The trader has no material')
+        buy_price = self.buy_price_from_draw(draws[offset])
+        return (self.hardest_to_mine, buy_price)
 
     def __str__(self) -> str:
         if self.active_deal is not None:
@@ -298,6 +518,9 @@ class HardTrader(Trader):
         return print_string
 
 
+Trader.set_type_weights()
+
+
 if __name__ == "__main__":
     trader = RangeTrader("Jackson")
     print(trader)
@@ -0,0 +1,341 @@
+"""
+    Columnar storage for large numbers of traders.
+
+    A Trader object carries its own attribute dictionary, an Inventory with
+    its list and map, a history and a deal tuple, which adds up to more than
+    a kilobyte per trader. A TraderPool stores the traders column by column
+    instead: one list of names, and compact arrays of type codes, material
+    ids and prices, with every material kept once in a shared catalogue.
+
+    Traders are handed out as TraderProxy objects, which only hold the pool
+    and a position in it, and expose the Trader API on top of the columns,
+    so games, markets and the deal engine use them as any other trader.
+    Proxies of the same position are equal, so markets can key them.
+"""
+
+from __future__ import annotations
+
+__docformat__ = 'reStructuredText'
+
+from array import array
+from weakref import WeakSet
+from deal_history import DealHistory
+from material import Material
+from random_gen import RandomGen
+from trader import TRADER_NAMES, HardTrader, RandomTrader, RangeTrader, Trader
+from typed_array import TypedArray
+
+# the trader classes, by type code
+TYPES = [RandomTrader, RangeTrader, HardTrader]
+RANDOM, RANGE, HARD = range(3)
+
+# material id of a trader with no active deal
+NO_DEAL = -1
+
+
+class TraderPool:
+    """ Traders stored in columns.
+
+    The prices are kept in a TypedArray of doubles, as the game's other
+    numeric columns are. A TypedArray has a fixed length, so the column is
+    given spare capacity and doubled when full, as an ArrayList is, and
+    adding a trader stays O(1) amortised. The type codes and material ids
+    stay in arrays of bytes and 32-bit ints, narrower than TypedArray's
+    64-bit integers.
+
+    Attributes:
+        * names (list[str]): the name of each trader
+        * types (array[int]): the type code of each trader, a position in TYPES
+        * deal_materials (array[int]): the id of the material of each active deal, or NO_DEAL
+        * prices (TypedArray): the price of each active deal, in a column of doubles
+          with spare capacity at the end, doubled when it is full
+        * inventories (list[array[int]]): the material ids of each trader, in inventory order
+        * markets (dict[int, WeakSet[Market]]): the markets of the traders attached to one
+        * histories (dict[int, DealHistory]): the histories of the traders that have one
+        * materials (list[Material]): the catalogue of materials, by id
+        * material_ids (dict[Material, int]): the id of every material of the catalogue
+    """
+
+    MIN_CAPACITY = 16
+
+    def __init__(self) -> None:
+        self.names = []
+        self.types = array('b')
+        self.deal_materials = array('i')
+        self.prices = TypedArray(self.MIN_CAPACITY)
+        self.inventories = []
+        self.markets = {}
+        self.histories = {}
+        self.materials = []
+        self.material_ids = {}
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __getitem__(self, index: int) -> TraderProxy:
+        """ Returns the trader at a position of the pool.
+            :complexity: O(1)
+            :raises IndexError: if there is no such trader
+        """
+        if index < 0:
+            index += len(self.names)
+        if not 0 <= index < len(self.names):
+            raise IndexError("No such trader in the pool")
+        return TraderProxy(self, index)
+
+    def __iter__(self):
+        """ Yields the traders in the order they were added. """
+        for index in range(len(self.names)):
+            yield TraderProxy(self, index)
+
+    def add(self, trader_type: type, name: str) -> TraderProxy:
+        """ Adds a trader of a given type, with no material and no deal.
+            :complexity: O(1) amortised
+            :raises ValueError: if the type is not one of TYPES
+        """
+        self.names.append(name)
+        self.types.append(TYPES.index(trader_type))
+        self.deal_materials.append(NO_DEAL)
+        if len(self.names) > len(self.prices):
+            self._grow_prices()
+        self.inventories.append(array('i'))
+        return TraderProxy(self, len(self.names) - 1)
+
+    def _grow_prices(self) -> None:
+        """ Doubles the capacity of the price column. The new slots are zero.
+            :complexity: O(T) where T is the number of traders
+        """
+        prices = TypedArray(2 * len(self.prices))
+        prices.copy_from(self.prices.array, 0, 0, len(self.prices))
+        self.prices = prices
+
+    def add_random(self) -> TraderProxy:
+        """ Adds a trader drawn as Trader.random_trader would draw it.
+            :complexity: O(1) amortised
+        """
+        name = RandomGen.random_choice(TRADER_NAMES)
+        return self.add(Trader.TYPE_TABLE.draw(), name)
+
+    def material_id(self, material: Material) -> int:
+        """ Returns the id of a material, adding it to the catalogue if needed.
+            :complexity: O(1) amortised
+        """
+        material_id = self.material_ids.get(material)
+        if material_id is None:
+            material_id = len(self.materials)
+            self.material_ids[material] = material_id
+            self.materials.append(material)
+        return material_id
+
+
+class PooledInventory:
+    """ The inventory of a pooled trader, read through its column of material ids.
+        Membership scans the ids, which are few per trader.
+    """
+
+    __slots__ = ('pool', 'ids')
+
+    def __init__(self, pool: TraderPool, ids: array) -> None:
+        self.pool = pool
+        self.ids = ids
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __getitem__(self, index: int) -> Material:
+        return self.pool.materials[self.ids[index]]
+
+    def __iter__(self):
+        materials = self.pool.materials
+        for material_id in self.ids:
+            yield materials[material_id]
+
+    def __contains__(self, material: Material) -> bool:
+        material_id = self.pool.material_ids.get(material)
+        return material_id is not None and material_id in self.ids
+
+    def index(self, material: Material) -> int:
+        """ Returns the position of a material.
+            :raises ValueError: if the material is not in the inventory
+        """
+        material_id = self.pool.material_ids.get(material)
+        if material_id is None:
+            raise ValueError("item not in inventory")
+        return self.ids.index(material_id)
+
+    def __str__(self) -> str:
+        return '[' + ', '.join(str(material) for material in self) + ']'
+
+
+class TraderProxy(Trader):
+    """ A trader of a TraderPool, exposing the Trader API on top of its columns.
+
+        The inventory behaves as an Inventory: adding a material already held
+        does nothing, and removing one moves the last material into its place,
+        so a proxy makes the same deals as a trader of its type would from the
+        same numbers. The rankings of RangeTrader and HardTrader are computed
+        from the inventory when a deal is made instead of being kept, and as
+        for a RangeTrader, the materials of a range trader must have different
+        mining rates.
+
+        Trader and its subclasses declare __slots__, so a proxy only holds its
+        two references and the empty slots of Trader, with no attribute dictionary.
+    """
+
+    __slots__ = ('pool', 'index')
+
+    def __init__(self, pool: TraderPool, index: int) -> None:
+        self.pool = pool
+        self.index = index
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, TraderProxy) and other.pool is self.pool and other.index == self.index
+
+    def __hash__(self) -> int:
+        return hash((id(self.pool), self.index))
+
+    def __getstate__(self) -> dict:
+        """ Pickling a proxy would copy the whole pool. """
+        raise TypeError("A pooled trader cannot be pickled")
+
+    @property
+    def trader_type(self) -> type:
+        """ The class of trader this trader behaves as. """
+        return TYPES[self.pool.types[self.index]]
+
+    @property
+    def RANDOM_DRAWS(self) -> int:
+        return self.trader_type.RANDOM_DRAWS
+
+    @property
+    def name(self) -> str:
+        return self.pool.names[self.index]
+
+    @property
+    def markets(self) -> WeakSet:
+        """ The markets of the trader, created when it is first attached to one. """
+        markets = self.pool.markets.get(self.index)
+        if markets is None:
+            markets = self.pool.markets[self.index] = WeakSet()
+        return markets
+
+    @property
+    def material_list(self) -> PooledInventory:
+        return PooledInventory(self.pool, self.pool.inventories[self.index])
+
+    @property
+    def history(self) -> DealHistory:
+        """ The history of the trader, created when it is first needed. """
+        history = self.pool.histories.get(self.index)
+        if history is None:
+            history = self.pool.histories[self.index] = DealHistory(self.HISTORY_SIZE)
+        return history
+
+    @property
+    def active_deal(self) -> tuple[Material, float] | None:
+        """ The active deal of the trader, or None. """
+        material_id = self.pool.deal_materials[self.index]
+        if material_id == NO_DEAL:
+            return None
+        return (self.pool.materials[material_id], self.pool.prices[self.index])
+
+    @active_deal.setter
+    def active_deal(self, deal: tuple[Material, float] | None) -> None:
+        """ Stores the active deal in the columns, and notifies the markets of the trader. """
+        if deal is None:
+            self.pool.deal_materials[self.index] = NO_DEAL
+        else:
+            material, price = deal
+            self.pool.deal_materials[self.index] = self.pool.material_id(material)
+            self.pool.prices[self.index] = price
+        for market in self.pool.markets.get(self.index, ()):
+            market.update(self)
+
+    def _check_rates(self, materials) -> None:
+        """ Checks that a range trader would have no two materials of the same mining rate.
+            :complexity: O(N) in the number N of materials
+            :raises ValueError: if two of the materials have the same mining rate
+        """
+        if self.pool.types[self.index] == RANGE:
+            rates = set()
+            for material in materials:
+                if material.mining_rate in rates:
+                    raise ValueError('Inserting duplicate item')
+                rates.add(material.mining_rate)
+
+    def set_all_materials(self, mats: list[Material]) -> None:
+        """ Replaces the inventory of the trader with the materials passed in.
+            :complexity: O(N^2) in the number N of materials, to skip repeated ones
+            :raises ValueError: if the trader is a range trader and two of the
+                materials have the same mining rate
+        """
+        self._check_rates({material: None for material in mats})
+        markets = self.pool.markets.get(self.index, ())
+        for market in markets:
+            for material in self.material_list:
+                market.remove_stock(self, material)
+        ids = array('i')
+        for material in mats:
+            material_id = self.pool.material_id(material)
+            if material_id not in ids:
+                ids.append(material_id)
+        self.pool.inventories[self.index] = ids
+        for market in markets:
+            for material in self.material_list:
+                market.add_stock(self, material)
+
+    def add_material(self, mat: Material) -> None:
+        """ Adds a material to the inventory, unless the trader already has it.
+            :complexity: O(N) in the number N of materials of the trader
+            :raises ValueError: if the trader is a range trader and already has
+                a material of the same mining rate
+        """
+        material_id = self.pool.material_id(mat)
+        ids = self.pool.inventories[self.index]
+        if material_id not in ids:
+            self._check_rates(list(self.material_list) + [mat])
+            ids.append(material_id)
+            for market in self.pool.markets.get(self.index, ()):
+                market.add_stock(self, mat)
+
+    def remove_material(self, mat: Material) -> None:
+        """ Removes a material from the inventory, the last material taking its place.
+            :complexity: O(N) in the number N of materials of the trader
+            :raises ValueError: if the trader does not have the material
+        """
+        ids = self.pool.inventories[self.index]
+        position = self.material_list.index(mat)
+        last = ids.pop()
+        if position < len(ids):
+            ids[position] = last
+        for market in self.pool.markets.get(self.index, ()):
+            market.remove_stock(self, mat)
+
+    def deal_from_draws(self, draws, offset: int) -> tuple[Material, float]:
+        """ Computes the deal a trader of its type would make from the same numbers.
+            :complexity: O(1) for a RandomTrader, O(N*log(N)) for a RangeTrader and
+                O(N) for a HardTrader, where N is the number of materials of the trader
+            :raises IndexError: if the trader has no material
+        """
+        materials = list(self.material_list)
+        trader_type = self.pool.types[self.index]
+        if trader_type == RANDOM:
+            material = materials[draws[offset] % len(materials)]
+        elif trader_type == RANGE:
+            materials.sort(key=lambda m: m.mining_rate)
+            n = len(materials)
+            i = draws[offset] % n
+            j = draws[offset + 1] % (n - i) + i
+            material = materials[draws[offset + 2] % (j - i + 1) + i]
+        else:
+            if len(materials) == 0:
+                raise IndexError('The trader has no material')
+            material = materials[0]
+            for other in materials:
+                if other.mining_rate > material.mining_rate:
+                    material = other
+        return (material, self.buy_price_from_draw(draws[offset + self.trader_type.RANDOM_DRAWS - 1]))
+
+    def __str__(self) -> str:
+        deal = self.active_deal if self.active_deal is not None else (None, None)
+        return "<{}: {} buying {} for {}💰>".format(self.trader_type.__name__, self.name, deal[0], deal[1])
@@ -0,0 +1,125 @@
+""" Array of unboxed numbers with the same interface as ArrayR.
+
+ArrayR stores a reference to a boxed Python object in every slot, which
+costs a pointer plus the object itself (24+ bytes for a float). TypedArray
+stores the raw values in an array.array instead: 8 bytes per slot for
+doubles ('d') or 64-bit integers ('q'). Values are boxed again when read.
+
+When NumPy is installed, as_numpy() returns an ndarray that shares the
+same memory, so whole columns can be processed with vectorised operations.
+"""
+from __future__ import annotations
+
+__docformat__ = 'reStructuredText'
+
+from array import array
+from referential_array import ArrayRView
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class TypedArray:
+    """ Fixed length array of doubles or 64-bit integers.
+
+    Attributes:
+        * typecode (str): 'd' for doubles or 'q' for 64-bit integers
+        * array (array): the packed values
+    """
+
+    TYPECODES = ('d', 'q')
+
+    def __init__(self, length: int, typecode: str = 'd') -> None:
+        """ Creates a zero-filled array of the given length and typecode
+        :complexity: O(length), done by array repetition in C
+        :pre: length > 0 and typecode in TYPECODES
+        """
+        if length <= 0:
+            raise ValueError("Array length should be larger than 0.")
+        if typecode not in self.TYPECODES:
+            raise ValueError("Typecode should be one of {0}.".format(self.TYPECODES))
+        self.typecode = typecode
+        self.array = array(typecode, [0]) * length
+
+    @classmethod
+    def from_iterable(cls, values, typecode: str = 'd') -> TypedArray:
+        """ Creates an array holding the given values in order
+        :complexity: O(N) where N is the number of values
+        :pre: there is at least one value and typecode in TYPECODES
+        """
+        if typecode not in cls.TYPECODES:
+            raise ValueError("Typecode should be one of {0}.".format(cls.TYPECODES))
+        res = cls.__new__(cls)
+        res.typecode = typecode
+        res.array = array(typecode, values)
+        if len(res.array) == 0:
+            raise ValueError("Array length should be larger than 0.")
+        return res
+
+    def __len__(self) -> int:
+        """ Returns the length of the array
+        :complexity: O(1)
+        """
+        return len(self.array)
+
+    def __getitem__(self, index: int) -> float | int:
+        """ Returns the value in position index.
+        :complexity: O(1)
+        :pre: index in between 0 and length - self.array[] checks it
+        """
+        return self.array[index]
+
+    def __setitem__(self, index: int, value: float | int) -> None:
+        """ Sets the value in position index
+        :complexity: O(1)
+        :pre: index in between 0 and length - self.array[] checks it
+        """
+        self.array[index] = value
+
+    def view(self, start: int = 0, stop: int = None) -> ArrayRView:
+        """ Returns a view over positions [start, stop) sharing this array.
+        :complexity: O(1), nothing is copied
+        """
+        if stop is None:
+            stop = len(self.array)
+        return ArrayRView(self, start, stop - start)
+
+    def as_numpy(self):
+        """ Returns a NumPy array sharing this array's memory, so writes to
+        either are seen by the other.
+        :complexity: O(1)
+        :raises ImportError: if NumPy is not installed
+        """
+        if numpy is None:
+            raise ImportError("NumPy is required for as_numpy().")
+        dtype = numpy.float64 if self.typecode == 'd' else numpy.int64
+        return numpy.frombuffer(self.array, dtype=dtype)
+
+    def move_range(self, src: int, dst: int, count: int) -> None:
+        """ Moves the count values starting at src so they start at dst.
+        :complexity: O(count), done as a single slice assignment
+        :pre: both ranges lie within the array
+        """
+        if count > 0:
+            self.array[dst:dst + count] = self.array[src:src + count]
+
+    def copy_from(self, source, src: int, dst: int, count: int) -> None:
+        """ Copies count values from source starting at src into this array
+        starting at dst.
+        :complexity: O(count)
+        :pre: both ranges lie within their arrays
+        """
+        if count > 0:
+            self.array[dst:dst + count] = array(self.typecode, source[src:src + count])
+
+    def fill(self, value: float | int, start: int = 0, stop: int = None) -> None:
+        """ Sets every position in [start, stop) to value.
+        :complexity: O(stop - start)
+        :pre: 0 <= start <= stop <= length
+        """
+        if stop is None:
+            stop = len(self.array)
+        if stop > start:
+            self.array[start:stop] = array(self.typecode, [value]) * (stop - start)